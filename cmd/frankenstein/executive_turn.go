@@ -8,6 +8,7 @@ import (
 	"path/filepath"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"frankenstein-v0/internal/brain"
@@ -250,7 +251,7 @@ func kvIncInt(db *sql.DB, key string, delta int) {
 	if db == nil { return }
 	key = strings.TrimSpace(key)
 	if key == "" { return }
-	now := time.Now().Format(time.RFC3339)
+	now := brain.NowRFC3339()
 	_, _ = db.Exec(
 		`INSERT INTO kv_state(key,value,updated_at) VALUES(?,?,?)
 		 ON CONFLICT(key) DO UPDATE SET value=CAST(kv_state.value AS INTEGER)+CAST(excluded.value AS INTEGER),
@@ -366,7 +367,7 @@ func handleCodeCommands(db *sql.DB, oc *ollama.Client, eg *epi.Epigenome, userTe
 			return true, "Diff-Pfad-Check fehlgeschlagen: " + err.Error() + "\nTipp: /selfcode index ausführen."
 		}
 
-		// 4) preflight: git apply --check + go test in temporary worktree (compile gate before apply)
+		// 4) preflight: git apply + go test in temporary worktree (compile gate before apply)
 		log, err := preflightApplyAndTest(repo, out)
 		if err != nil {
 			return true, "Preflight fehlgeschlagen (Patch wird NICHT gespeichert):\n" + log
@@ -411,6 +412,8 @@ func handleCodeCommands(db *sql.DB, oc *ollama.Client, eg *epi.Epigenome, userTe
 	}
 }
 
+var codeIndexSkipTokens = map[string]struct{}{"topic": {}, "drift": {}, "fix": {}, "prevent": {}}
+
 func codeIndexContext(db *sql.DB, title, spec string) string {
 	if db == nil {
 		return ""
@@ -421,7 +424,7 @@ func codeIndexContext(db *sql.DB, title, spec string) string {
 		if len(t) < 4 {
 			continue
 		}
-		if _, bad := map[string]struct{}{"topic": {}, "drift": {}, "fix": {}, "prevent": {}}[t]; bad {
+		if _, bad := codeIndexSkipTokens[t]; bad {
 			continue
 		}
 		keys = append(keys, t)
@@ -684,17 +687,13 @@ func preflightApplyAndTest(repoRoot string, diffText string) (string, error) {
 		_, _ = runCmdDir(repoRoot, "git", "worktree", "prune")
 	}()
 
-	log.WriteString("1) git apply --check\n")
-	if out, err := runCmdDir(worktree, "git", "apply", "--check", tmpPatch); err != nil {
-		log.WriteString(out + "\n")
-		return strings.TrimSpace(log.String()), fmt.Errorf("git apply --check failed")
-	}
-	log.WriteString("2) git apply\n")
+	// git apply verifies every hunk before touching any file, so a separate --check run is redundant.
+	log.WriteString("1) git apply\n")
 	if out, err := runCmdDir(worktree, "git", "apply", tmpPatch); err != nil {
 		log.WriteString(out + "\n")
 		return strings.TrimSpace(log.String()), fmt.Errorf("git apply failed")
 	}
-	log.WriteString("3) go test ./...\n")
+	log.WriteString("2) go test ./...\n")
 	testOut, testErr := runCmdDir(worktree, "go", "test", "./...")
 	if testErr != nil {
 		log.WriteString(testOut + "\n")
@@ -843,57 +842,49 @@ func applyPatchInRepo(id int64, title string, diff string) (string, error) {
 		branch = branch[:80]
 	}
 
+	worktree := filepath.Join(os.TempDir(), fmt.Sprintf("bunny_apply_%d", time.Now().UnixNano()))
 	var log strings.Builder
 	log.WriteString("[code apply]\n")
 	log.WriteString("repo: " + repo + "\n")
 	log.WriteString("base_branch: " + baseBranch + "\n")
 	log.WriteString("new_branch: " + branch + "\n")
+	log.WriteString("worktree: " + worktree + "\n")
 
-	// require clean working tree
-	status, err := runCmdDir(repo, "git", "status", "--porcelain")
-	if err != nil {
-		log.WriteString("git status failed:\n" + status + "\n")
-		return strings.TrimSpace(log.String()), err
-	}
-	if strings.TrimSpace(status) != "" {
-		log.WriteString("working tree NOT clean:\n" + status + "\n")
-		return strings.TrimSpace(log.String()), fmt.Errorf("working tree not clean (commit/stash first)")
-	}
-
-	log.WriteString("0) git checkout -b\n")
-	out, err := runCmdDir(repo, "git", "checkout", "-b", branch)
+	// The patch is applied, tested and committed in a throwaway worktree on the new branch.
+	// The user's checkout is never switched or rolled back, so it does not need to be clean.
+	log.WriteString("0) git worktree add -b\n")
+	out, err := runCmdDir(repo, "git", "worktree", "add", "-b", branch, worktree, "HEAD")
 	if err != nil {
 		log.WriteString(out + "\n")
 		return strings.TrimSpace(log.String()), err
 	}
-
-	log.WriteString("1) git apply --check\n")
-	out, err = runCmdDir(repo, "git", "apply", "--check", tmp)
-	if err != nil {
-		log.WriteString(out + "\n")
-		return strings.TrimSpace(log.String()), err
+	defer func() {
+		_, _ = runCmdDir(repo, "git", "worktree", "remove", "--force", worktree)
+		_, _ = runCmdDir(repo, "git", "worktree", "prune")
+	}()
+	dropBranch := func() {
+		_, _ = runCmdDir(repo, "git", "worktree", "remove", "--force", worktree)
+		_, _ = runCmdDir(repo, "git", "branch", "-D", branch)
 	}
 
-	log.WriteString("2) git apply\n")
-	out, err = runCmdDir(repo, "git", "apply", tmp)
+	log.WriteString("1) git apply\n")
+	out, err = runCmdDir(worktree, "git", "apply", tmp)
 	if err != nil {
 		log.WriteString(out + "\n")
-		_, _ = runCmdDir(repo, "git", "checkout", baseBranch)
+		dropBranch()
 		return strings.TrimSpace(log.String()), err
 	}
 
-	log.WriteString("3) go test ./...\n")
-	testOut, testErr := runCmdDir(repo, "go", "test", "./...")
+	log.WriteString("2) go test ./...\n")
+	testOut, testErr := runCmdDir(worktree, "go", "test", "./...")
 	if testErr != nil {
 		log.WriteString("go test FAILED:\n" + testOut + "\n")
-		rb, _ := runCmdDir(repo, "git", "apply", "-R", tmp)
-		log.WriteString("rollback:\n" + rb + "\n")
-		_, _ = runCmdDir(repo, "git", "checkout", baseBranch)
-		return strings.TrimSpace(log.String()), fmt.Errorf("go test failed; patch rolled back")
+		dropBranch()
+		return strings.TrimSpace(log.String()), fmt.Errorf("go test failed; patch discarded")
 	}
 
-	log.WriteString("4) git add -A\n")
-	_, _ = runCmdDir(repo, "git", "add", "-A")
+	log.WriteString("3) git add -A\n")
+	_, _ = runCmdDir(worktree, "git", "add", "-A")
 	msg := fmt.Sprintf("Apply code_proposal #%d", id)
 	if strings.TrimSpace(title) != "" {
 		t := strings.TrimSpace(title)
@@ -902,8 +893,8 @@ func applyPatchInRepo(id int64, title string, diff string) (string, error) {
 		}
 		msg += ": " + t
 	}
-	log.WriteString("5) git commit\n")
-	cout, cerr := runCmdDir(repo, "git", "commit", "-m", msg)
+	log.WriteString("4) git commit\n")
+	cout, cerr := runCmdDir(worktree, "git", "commit", "-m", msg)
 	if cerr != nil {
 		if !strings.Contains(strings.ToLower(cout), "nothing to commit") {
 			log.WriteString(cout + "\n")
@@ -942,13 +933,49 @@ func gitRepoRoot() (string, error) {
 	return out, nil
 }
 
+// cmdOutputTail is how much combined output runCmdDir keeps (the end is where go test/git report).
+const cmdOutputTail = 64 << 10
+
 func runCmdDir(dir string, bin string, args ...string) (string, error) {
 	cmd := exec.Command(bin, args...)
 	if strings.TrimSpace(dir) != "" {
 		cmd.Dir = dir
 	}
-	out, err := cmd.CombinedOutput()
-	return strings.TrimSpace(string(out)), err
+	out := &tailWriter{max: cmdOutputTail}
+	cmd.Stdout = out
+	cmd.Stderr = out
+	err := cmd.Run()
+	return strings.TrimSpace(out.String()), err
+}
+
+// tailWriter keeps only the last max bytes written to it, so memory stays bounded
+// no matter how much a command prints.
+type tailWriter struct {
+	max       int
+	buf       []byte
+	truncated bool
+}
+
+func (t *tailWriter) Write(p []byte) (int, error) {
+	n := len(p)
+	if len(p) >= t.max {
+		t.buf = append(t.buf[:0], p[len(p)-t.max:]...)
+		t.truncated = true
+		return n, nil
+	}
+	if over := len(t.buf) + len(p) - t.max; over > 0 {
+		t.buf = append(t.buf[:0], t.buf[over:]...)
+		t.truncated = true
+	}
+	t.buf = append(t.buf, p...)
+	return n, nil
+}
+
+func (t *tailWriter) String() string {
+	if t.truncated {
+		return "…(output truncated)\n" + string(t.buf)
+	}
+	return string(t.buf)
 }
 
 func handleABCommands(db *sql.DB, eg *epi.Epigenome, userText string) (bool, string) {
@@ -1181,21 +1208,21 @@ func handlePickCommand(db *sql.DB, userText string) (bool, string) {
 			bAct := tt.BAction
 			aSty := tt.AStyle
 			bSty := tt.BStyle
-			aA0, aB0 := getPolicyAlphaBeta(db, ctxKey, aAct)
-			bA0, bB0 := getPolicyAlphaBeta(db, ctxKey, bAct)
-			psA0 := getPrefValue(db, "style:"+aSty)
-			psB0 := getPrefValue(db, "style:"+bSty)
-			ptA0 := getPrefValue(db, "strat:"+aAct)
-			ptB0 := getPrefValue(db, "strat:"+bAct)
+			aA0, aB0 := brain.PolicyAlphaBeta(db, ctxKey, aAct)
+			bA0, bB0 := brain.PolicyAlphaBeta(db, ctxKey, bAct)
+			psA0 := brain.GetPreference(db, "style:"+aSty, 0)
+			psB0 := brain.GetPreference(db, "style:"+bSty, 0)
+			ptA0 := brain.GetPreference(db, "strat:"+aAct, 0)
+			ptB0 := brain.GetPreference(db, "strat:"+bAct, 0)
 
 			brain.ApplyTrainChoice(db, id, choice)
 
-			aA1, aB1 := getPolicyAlphaBeta(db, ctxKey, aAct)
-			bA1, bB1 := getPolicyAlphaBeta(db, ctxKey, bAct)
-			psA1 := getPrefValue(db, "style:"+aSty)
-			psB1 := getPrefValue(db, "style:"+bSty)
-			ptA1 := getPrefValue(db, "strat:"+aAct)
-			ptB1 := getPrefValue(db, "strat:"+bAct)
+			aA1, aB1 := brain.PolicyAlphaBeta(db, ctxKey, aAct)
+			bA1, bB1 := brain.PolicyAlphaBeta(db, ctxKey, bAct)
+			psA1 := brain.GetPreference(db, "style:"+aSty, 0)
+			psB1 := brain.GetPreference(db, "style:"+bSty, 0)
+			ptA1 := brain.GetPreference(db, "strat:"+aAct, 0)
+			ptB1 := brain.GetPreference(db, "strat:"+bAct, 0)
 
 			learned := ""
 			if trainExplainEnabled(db) {
@@ -1315,36 +1342,6 @@ func trainExplainEnabled(db *sql.DB) bool {
 	return true
 }
 
-func getPolicyAlphaBeta(db *sql.DB, ctx, action string) (float64, float64) {
-	if db == nil || strings.TrimSpace(ctx) == "" || strings.TrimSpace(action) == "" {
-		return 1.0, 1.0
-	}
-	a, b := 1.0, 1.0
-	_ = db.QueryRow(`SELECT alpha,beta FROM policy_stats WHERE context_key=? AND action=?`, ctx, action).Scan(&a, &b)
-	if a == 0 && b == 0 {
-		a, b = 1.0, 1.0
-	}
-	if a < 0.1 {
-		a = 0.1
-	}
-	if b < 0.1 {
-		b = 0.1
-	}
-	return a, b
-}
-
-func getPrefValue(db *sql.DB, key string) float64 {
-	if db == nil || strings.TrimSpace(key) == "" {
-		return 0
-	}
-	var v sql.NullFloat64
-	_ = db.QueryRow(`SELECT value FROM preferences WHERE key=?`, key).Scan(&v)
-	if !v.Valid {
-		return 0
-	}
-	return v.Float64
-}
-
 func fmtAB(a, b float64) string {
 	return fmt.Sprintf("%.2f/%.2f", a, b)
 }
@@ -1419,10 +1416,14 @@ func kvSet(db *sql.DB, key, val string) {
 	}
 	_, _ = db.Exec(`INSERT INTO kv_state(key,value,updated_at) VALUES(?,?,?)
 		ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=excluded.updated_at`,
-		strings.TrimSpace(key), strings.TrimSpace(val), time.Now().Format(time.RFC3339))
+		strings.TrimSpace(key), strings.TrimSpace(val), brain.NowRFC3339())
 }
 
 func runTrainTrial(db *sql.DB, epiPath string, oc *ollama.Client, modelSpeaker, modelStance string, body *BodyState, aff *brain.AffectState, ws *brain.Workspace, tr *brain.Traits, dr *brain.Drives, eg *epi.Epigenome, userText string) (string, bool) {
+	// A and B generate concurrently below; they must not release the caller's lock
+	// or stream into the same UI draft.
+	oc = oc.Yielding(nil).StreamingTo(nil)
+
 	// Champion model: current override or configured speaker.
 	aModel := strings.TrimSpace(kvGet(db, "speaker_model_override"))
 	if aModel == "" {
@@ -1465,9 +1466,19 @@ func runTrainTrial(db *sql.DB, epiPath string, oc *ollama.Client, modelSpeaker,
 		wsB.TrainingDryRun = true
 	}
 
-	aOut, aAct, aSty, ctxKey, topic, intentMode := ExecuteTurnWithMeta(db, epiPath, oc, aModel, modelStance, &bodyA, affA, wsA, tr, &drA, eg, userText, nil)
+	// A and B run on cloned state in dry-run mode, so they are independent and can be
+	// generated concurrently (Ollama serves them in parallel when OLLAMA_NUM_PARALLEL > 1).
+	var aOut, aAct, aSty, ctxKey, topic, intentMode string
+	var bOut, bAct, bSty string
 	mut := &MutantOverlay{Strength: mutStrength, Prompt: mutPrompt, Model: bModel}
-	bOut, bAct, bSty, _, _, _ := ExecuteTurnWithMeta(db, epiPath, oc, aModel, modelStance, &bodyB, affB, wsB, tr, &drB, eg, userText, mut)
+	var wg sync.WaitGroup
+	wg.Add(1)
+	go func() {
+		defer wg.Done()
+		bOut, bAct, bSty, _, _, _ = ExecuteTurnWithMeta(db, epiPath, oc, aModel, modelStance, &bodyB, affB, wsB, tr, &drB, eg, userText, mut)
+	}()
+	aOut, aAct, aSty, ctxKey, topic, intentMode = ExecuteTurnWithMeta(db, epiPath, oc, aModel, modelStance, &bodyA, affA, wsA, tr, &drA, eg, userText, nil)
+	wg.Wait()
 	aOut = strings.TrimSpace(aOut)
 	bOut = strings.TrimSpace(bOut)
 	if aOut == "" || bOut == "" {
@@ -1547,31 +1558,24 @@ func autoPickMutantModel(oc *ollama.Client, poolCSV string, fallback string) str
 	if err != nil || len(models) == 0 {
 		return ""
 	}
-	// Prefer bunny-* or *lora* or *adapter*.
-	cands := []string{}
+	// Prefer bunny-* or *lora* or *adapter*; otherwise any other installed model.
+	// One pass over the model names, lowering each (and the fallback) only once.
+	lf := strings.ToLower(fallback)
+	var cands, others []string
 	for m := range models {
 		lm := strings.ToLower(strings.TrimSpace(m))
-		if lm == "" || lm == strings.ToLower(fallback) {
+		if lm == "" || lm == lf {
 			continue
 		}
 		if strings.HasPrefix(lm, "bunny-") || strings.Contains(lm, "lora") || strings.Contains(lm, "adapter") {
 			cands = append(cands, m)
+		} else {
+			others = append(others, m)
 		}
 	}
-	if len(cands) > 0 {
-		idx := int(time.Now().UnixNano() % int64(len(cands)))
-		if idx < 0 {
-			idx = -idx
-		}
-		return cands[idx]
-	}
-	// If no LoRA/adapter models exist, still vary by picking ANY other installed model.
-	for m := range models {
-		lm := strings.ToLower(strings.TrimSpace(m))
-		if lm == "" || lm == strings.ToLower(fallback) {
-			continue
-		}
-		cands = append(cands, m)
+	if len(cands) == 0 {
+		// If no LoRA/adapter models exist, still vary by picking ANY other installed model.
+		cands = others
 	}
 	if len(cands) == 0 {
 		return ""
@@ -25,3 +25,23 @@ func TestNormalizeUnifiedDiffHunks_RepairsEmptyHunkLine(t *testing.T) {
 		t.Fatalf("expected normalized diff to be valid, got err: %v", err)
 	}
 }
+
+func TestTailWriter_KeepsLastBytes(t *testing.T) {
+	w := &tailWriter{max: 8}
+	_, _ = w.Write([]byte("abcd"))
+	_, _ = w.Write([]byte("efgh"))
+	if got := w.String(); got != "abcdefgh" {
+		t.Fatalf("expected untruncated output, got %q", got)
+	}
+	_, _ = w.Write([]byte("ij"))
+	if got := string(w.buf); got != "cdefghij" {
+		t.Fatalf("expected tail cdefghij, got %q", got)
+	}
+	_, _ = w.Write([]byte("0123456789"))
+	if got := string(w.buf); got != "23456789" {
+		t.Fatalf("expected tail 23456789, got %q", got)
+	}
+	if !strings.HasPrefix(w.String(), "…(output truncated)") {
+		t.Fatalf("expected truncation marker, got %q", w.String())
+	}
+}
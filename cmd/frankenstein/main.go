@@ -10,10 +10,14 @@ import (
 	"math/rand"
 	"net/url"
 	"os"
+	"os/signal"
+	"runtime/pprof"
 	"strconv"
 	"strings"
 	"sync"
+	"syscall"
 	"time"
+	"unicode/utf8"
 
 	"frankenstein-v0/internal/brain"
 	"frankenstein-v0/internal/codeindex"
@@ -36,7 +40,9 @@ type BodyState struct {
 
 // --- Energy interface for autonomous self-change metabolic costs ---
 // (CommitSelfChange uses epi.ExtractEnergy/InjectEnergy; provide explicit methods too.)
-func (b *BodyState) GetEnergy() float64 { return b.Energy }
+func (b *BodyState) GetEnergy() float64          { return b.Energy }
+func (b *BodyState) GetWebCountHour() int        { return b.WebCountHour }
+func (b *BodyState) GetCooldownUntil() time.Time { return b.CooldownUntil }
 func (b *BodyState) SetEnergy(v float64) {
 	if v < 0 {
 		v = 0
@@ -70,6 +76,17 @@ func main() {
 	epiPath := getenv("FRANK_EPI", "data/epigenome.json")
 	uiAddr := getenv("FRANK_UI_ADDR", "127.0.0.1:8080")
 
+	// Opt-in CPU profile for PGO: copy it to cmd/frankenstein/default.pgo and
+	// `go build` (Go >= 1.21 uses -pgo=auto) optimizes the hot paths seen here.
+	if p := getenv("FRANK_CPUPROFILE", ""); p != "" {
+		stop, err := startCPUProfile(p)
+		if err != nil {
+			log.Println("cpuprofile:", err)
+		} else {
+			defer stop()
+		}
+	}
+
 	_ = os.MkdirAll("data", 0o755)
 
 	db, err := state.Open(dbPath)
@@ -137,7 +154,14 @@ func main() {
 	sampler := sensors.NewSampler()
 	dr1 := &brain.DrivesV1{}
 
+	// mu guards the in-memory state (body, affects, workspace, drives, traits, epigenome)
+	// the heartbeat ticks; hold it only for state reads/writes, not for DB-only work.
 	var mu sync.Mutex
+	// turnMu serializes the LLM pipeline (UI turns, /say, /think). A turn releases mu
+	// while it waits on Ollama (oc.Yielding), so ticks, ratings and status reads are
+	// not stuck behind a long generation; turnMu keeps another turn from running in
+	// that gap.
+	var turnMu sync.Mutex
 
 	fmt.Println("Bunny v0 online.")
 	fmt.Println("Commands: /think | /say <text...> | /train on|off | /pick A|B | /rate <up|meh|down> | /caught | /status | /mutate ... | /selfcode index | /quit")
@@ -165,30 +189,67 @@ func main() {
 	var lastTrainTrialID int64 = 0
 	var lastAutoSpeak time.Time // protected by mu
 
+	// UI status snapshot, rebuilt only when statusVersion moved (protected by mu)
+	var statusCache *uiStatus
+	var statusVersion, statusCacheVersion uint64
+	// statusSnapshot returns the current UI status; callers hold mu. The snapshot owns
+	// its maps and slices (BuildSelfModel copies affects and affect defs out of the live
+	// state) and is never modified after it is built, so it may be encoded after mu is
+	// released.
+	statusSnapshot := func() *uiStatus {
+		if statusCache == nil || statusCacheVersion != statusVersion {
+			statusCache = buildUIStatus(&body, aff, ws, tr, dr, eg)
+			statusCacheVersion = statusVersion
+		}
+		return statusCache
+	}
+
 	// --- UI server (SSE) ---
-	ctx, cancel := context.WithCancel(context.Background())
+	// Ctrl-C / SIGTERM end the main loop like /quit, so the deferred cleanup (DB
+	// close, CPU profile flush) runs. Once it fired the default handling is back: a
+	// second Ctrl-C kills a process stuck in a long command.
+	ctx, cancel := signal.NotifyContext(context.Background(), os.Interrupt, syscall.SIGTERM)
 	defer cancel()
+	go func() {
+		<-ctx.Done()
+		cancel()
+	}()
 	srv := ui.New(uiAddr)
+	// publishStatus queues a status push; the snapshot is taken (under mu) only when
+	// the coalesced publish fires, so callers may hold mu.
+	publishStatus := func() {
+		srv.PublishStatusFunc(func() any {
+			mu.Lock()
+			defer mu.Unlock()
+			return statusSnapshot()
+		})
+	}
 
-	// DB-backed list (last N)
+	// DB-backed list (last N, oldest first)
 	srv.ListMessages = func(limit int) ([]ui.Message, error) {
-		rows, err := db.DB.Query(
+		// newest N via the rowid, then the joins and the per-message rating lookup
+		// (idx_ratings_message) only for those rows, returned in chronological order.
+		// Every page load and reconnect runs it, so it goes through the statement cache.
+		st, err := db.Stmt(
 			`SELECT
 			   m.id,
 			   m.created_at,
 			   COALESCE(mm.kind,'reply') as kind,
 			   m.text,
 			   (SELECT r.value FROM ratings r WHERE r.message_id=m.id ORDER BY r.created_at DESC LIMIT 1) as rating
-			 FROM messages m
+			 FROM (SELECT id, created_at, text FROM messages ORDER BY id DESC LIMIT ?) m
 			 LEFT JOIN message_meta mm ON mm.message_id = m.id
-			 ORDER BY m.id DESC
-			 LIMIT ?`, limit,
+			 ORDER BY m.id ASC`,
 		)
 		if err != nil {
 			return nil, err
 		}
+		rows, err := st.Query(limit)
+		if err != nil {
+			return nil, err
+		}
 		defer rows.Close()
-		var out []ui.Message
+		out := make([]ui.Message, 0, limit)
 		for rows.Next() {
 			var m ui.Message
 			var rating sql.NullInt64
@@ -206,41 +267,20 @@ func main() {
 	srv.Status = func() (any, error) {
 		mu.Lock()
 		defer mu.Unlock()
-		// publish raw selfmodel (json-ish struct)
-		sm := epi.BuildSelfModel(&body, aff, ws, tr, eg)
-		// also include drives/traits extras without forcing schema changes
-		type status struct {
-			Self   any `json:"self"`
-			Drives any `json:"drives"`
-			Traits any `json:"traits"`
-		}
-		st := status{
-			Self: sm,
-			Drives: map[string]any{
-				"curiosity":     dr.Curiosity,
-				"urge_to_share": dr.UrgeToShare,
-			},
-			Traits: map[string]any{
-				"talk_bias":      tr.TalkBias,
-				"search_k":       tr.SearchK,
-				"fetch_attempts": tr.FetchAttempts,
-			},
-		}
-		return st, nil
+		// reuse the snapshot until the next heartbeat tick (or rating) invalidates it
+		return statusSnapshot(), nil
 	}
 	srv.SendText = func(text string) (ui.Message, error) {
 		// 1) persist + publish USER message immediately
-		userID := persistMessageWithKind(db.DB, text, nil, 0.1, "user")
+		um := persistMessageWithKind(db, text, nil, 0.1, "user")
+		userID := um.ID
 		if userID > 0 {
-			srv.PublishMessage(ui.Message{
-				ID:        userID,
-				CreatedAt: time.Now().Format(time.RFC3339),
-				Kind:      "user",
-				Text:      text,
-			})
+			srv.PublishMessage(um)
 		}
 
 		// 2) generate Bunny reply
+		turnMu.Lock()
+		defer turnMu.Unlock()
 		start := time.Now()
 		mu.Lock()
 		// determine intent (rules + NB), then let executive run strategy.
@@ -248,8 +288,16 @@ func main() {
 		_ = intent
 		ws.LastUserText = text
 		ws.LastUserMsgID = userID
-		out, err := ExecuteTurn(db.DB, epiPath, oc, modelSpeaker, modelStance, &body, aff, ws, tr, dr, eg, text)
+		// the reply is streamed to the UI as a draft while it is generated
+		turnOC := oc.Yielding(&mu).StreamingTo(srv.ReplyStream())
+		out, err := ExecuteTurn(db.DB, epiPath, turnOC, modelSpeaker, modelStance, &body, aff, ws, tr, dr, eg, text)
 		brain.LatencyAffect(ws, aff, eg, time.Since(start))
+		// policy context of this turn, for linking the reply below
+		ut := ws.LastUserText
+		in := ws.LastRoutedIntent
+		pctx := ws.LastPolicyCtx
+		act := ws.LastPolicyAction
+		sty := ws.LastPolicyStyle
 		mu.Unlock()
 		if err != nil {
 			return ui.Message{}, err
@@ -257,33 +305,23 @@ func main() {
 		if strings.TrimSpace(out) == "" {
 			out = "Ich bin da. Magst du kurz sagen, was du von mir willst (Status / Idee / Umsetzung)?"
 		}
-		id := persistMessageWithKind(db.DB, out, nil, 0.2, "reply")
+		reply := persistMessageWithKind(db, out, nil, 0.2, "reply")
+		id := reply.ID
 		// link reply -> user_text + intent + policy for learning
 		mu.Lock()
-		ut := ws.LastUserText
-		in := ws.LastRoutedIntent
-		pctx := ws.LastPolicyCtx
-		act := ws.LastPolicyAction
-		sty := ws.LastPolicyStyle
 		lastMessageID = id
 		mu.Unlock()
 		brain.SaveReplyContext(db.DB, id, ut, in) // v1 NB
 		brain.SaveReplyContextV2(db.DB, id, ut, in, pctx, act, sty)
-		return ui.Message{
-			ID:        id,
-			CreatedAt: time.Now().Format(time.RFC3339),
-			Kind:      "reply",
-			Text:      out,
-		}, nil
+		return reply, nil
 	}
 	srv.RateMessage = func(messageID int64, value int) error {
-		if err := storeRating(db.DB, messageID, value); err != nil {
+		if err := storeRating(db, messageID, value); err != nil {
 			return err
 		}
 		// Learned anti-spam: ratings on auto proposal pings become preferences.
 		{
-			var kind, txt string
-			_ = db.DB.QueryRow(`SELECT COALESCE(mm.kind,'reply') as kind, m.text FROM messages m LEFT JOIN message_meta mm ON mm.message_id=m.id WHERE m.id=?`, messageID).Scan(&kind, &txt)
+			kind, txt := loadMessageKindText(db, messageID)
 			kind = strings.TrimSpace(strings.ToLower(kind))
 			lt := strings.ToLower(txt)
 			if kind == "auto" {
@@ -338,7 +376,9 @@ func main() {
 		} else if value < 0 {
 			dr.UrgeToShare = clamp01(dr.UrgeToShare - 0.10)
 		}
+		statusVersion++
 		mu.Unlock()
+		publishStatus()
 
 		ut2, intentMode, pctx, act, sty, ok2 := brain.LoadReplyContextV2(db.DB, messageID)
 		if ok2 {
@@ -365,8 +405,7 @@ func main() {
 	srv.Caught = func(messageID int64) error {
 		// Learned anti-spam: caught on auto proposal pings becomes strong negative preference.
 		{
-			var kind, txt string
-			_ = db.DB.QueryRow(`SELECT COALESCE(mm.kind,'reply') as kind, m.text FROM messages m LEFT JOIN message_meta mm ON mm.message_id=m.id WHERE m.id=?`, messageID).Scan(&kind, &txt)
+			kind, txt := loadMessageKindText(db, messageID)
 			kind = strings.TrimSpace(strings.ToLower(kind))
 			lt := strings.ToLower(txt)
 			if kind == "auto" {
@@ -404,8 +443,10 @@ func main() {
 		_ = brain.ApplyCaught(db.DB, tr, aff, eg)
 		_ = brain.SaveAffectState(db.DB, aff)
 		dr.UrgeToShare = clamp01(dr.UrgeToShare - 0.15)
-		_, _ = db.DB.Exec(`INSERT INTO caught_events(created_at,message_id) VALUES(?,?)`, time.Now().Format(time.RFC3339), messageID)
+		storeCaught(db, messageID)
+		statusVersion++
 		mu.Unlock()
+		publishStatus()
 		return nil
 	}
 
@@ -433,18 +474,13 @@ func main() {
 
 	go func() {
 		for req := range speakReqCh {
-			sys := `Du bist Bunny.
-Du darfst autonom sprechen, aber nur wenn es einen echten Grund gibt (Mitteilungsbedürfnis).
-Regeln:
-- Deutsch. Kurz: 1–3 Sätze.
-- Kein Smalltalk. Keine Entschuldigung. Keine Meta-Erklärungen.
-- Keine externen Fakten behaupten (nur interne Gedanken/Fragen/Beobachtungen).
-- Ein Satz Inhalt + optional 1 Frage an Oliver.`
-
-			user := "SelfModel:\n" + req.SelfModelJSON + "\n\n" +
-				"Reason:\n" + req.Reason + "\n\n" +
-				"Topic:\n" + req.Topic + "\n\n" +
+			sys := promptSpeak
+
+			// Slow-changing fields first, per-tick SelfModel and thought last (longer shared prefix).
+			user := "Topic:\n" + req.Topic + "\n\n" +
 				"ConceptSummary:\n" + req.ConceptSummary + "\n\n" +
+				"Reason:\n" + req.Reason + "\n\n" +
+				"SelfModel:\n" + req.SelfModelJSON + "\n\n" +
 				"CurrentThought:\n" + req.CurrentThought + "\n\n" +
 				"Compose ONE proactive message now."
 
@@ -462,23 +498,34 @@ Regeln:
 
 	go func() {
 		for req := range memReqCh {
-			sys := `Du bist Hippocampus (Bunny).
-Fasse die folgenden Ereignisse zu einer GROBEN STORY zusammen (Gist), Details weglassen.
-Ziel: 5-9 kurze Sätze oder Bulletpoints, neutral, deutsch.
-Keine erfundenen Fakten.`
-			user := "TOPIC: " + req.Topic + "\nEVENTS:\n" + req.TextBlock + "\n\nGIST:"
-			sum, err := oc.Chat(modelHippo, []ollama.Message{
-				{Role: "system", Content: sys},
-				{Role: "user", Content: user},
-			})
-			if err != nil {
-				continue
+			// The heartbeat re-queues the same topic window every tick until its gist is saved.
+			// Fold whatever is already queued so each window costs one LLM call.
+			pending := []brain.ConsolidateRequest{req}
+		drain:
+			for {
+				select {
+				case more := <-memReqCh:
+					pending = coalesceConsolidate(pending, more)
+				default:
+					break drain
+				}
 			}
-			sum = strings.TrimSpace(sum)
-			if sum == "" {
-				continue
+			for _, req := range pending {
+				sys := promptHippo
+				user := "TOPIC: " + req.Topic + "\nEVENTS:\n" + req.TextBlock + "\n\nGIST:"
+				sum, err := oc.Chat(modelHippo, []ollama.Message{
+					{Role: "system", Content: sys},
+					{Role: "user", Content: user},
+				})
+				if err != nil {
+					continue
+				}
+				sum = strings.TrimSpace(sum)
+				if sum == "" {
+					continue
+				}
+				memOutCh <- fmt.Sprintf("%d|%d|%s\n%s", req.StartEvent, req.EndEvent, req.Topic, sum)
 			}
-			memOutCh <- fmt.Sprintf("%d|%d|%s\n%s", req.StartEvent, req.EndEvent, req.Topic, sum)
 		}
 	}()
 
@@ -503,12 +550,9 @@ Keine erfundenen Fakten.`
 				evs = append(evs, Ev{URL: results[i].URL, Domain: dom, Title: results[i].Title, Snippet: results[i].Snippet})
 			}
 			evJSON, _ := json.MarshalIndent(evs, "", "  ")
-			sys := `Du bist Bunny-Scout.
-Aus EVIDENCE eine knappe Einordnung des Themas erstellen.
-Antwort NUR als JSON:
-{"summary":"1-3 Sätze","confidence":0.0-1.0,"importance":0.0-1.0}`
+			sys := promptScout
 			user := "TOPIC: " + req.Topic + "\nEVIDENCE:\n" + string(evJSON)
-			out, err := oc.Chat(modelScout, []ollama.Message{{Role: "system", Content: sys}, {Role: "user", Content: user}})
+			out, err := oc.ChatJSON(modelScout, []ollama.Message{{Role: "system", Content: sys}, {Role: "user", Content: user}})
 			if err != nil {
 				continue
 			}
@@ -550,26 +594,13 @@ Antwort NUR als JSON:
 						b, _ := json.MarshalIndent(ev, "", "  ")
 						webJSON = string(b)
 						_, _ = db.DB.Exec(`INSERT INTO kv_state(key,value,updated_at) VALUES(?,?,?) ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=excluded.updated_at`,
-							"daydream:last_web_unix", fmt.Sprintf("%d", nowU), time.Now().Format(time.RFC3339))
+							"daydream:last_web_unix", fmt.Sprintf("%d", nowU), brain.NowRFC3339())
 					}
 				}
 			}
 			req.WebGlanceJSON = webJSON
 
-			sys := `Du bist Bunny-Daydreamer (menschähnliches Denken, diffuser Drift).
-Aufgabe: Erzeuge einen kurzen, menschlich wirkenden Denkstrom.
-
-Erzeuge zwei parallel laufende Gedanken:
-1) VISUAL_SCENE: 2-5 Sätze Bildbeschreibung (Szene, Objekte, Licht, Atmosphäre, Bewegung)
-2) INNER_SPEECH: innerer Monolog 6-12 Sätze, assoziativ, nicht "KI-Assistent"-Ton.
-
-Stilregeln:
-- leichte emotionale Drift (kein Pathos)
-- verknüpfe ggf. Fragmente aus RECENT_TURNS / THOUGHT_SNIPS / EPISODE / RECALL
-- wenn WEB_GLANCE vorhanden ist: nur EIN Detail als "ich hab kurz gelesen..." einflechten.
-
-Antwortformat: NUR JSON:
-{"visual_scene":"...","inner_speech":"...","salience":0.0-1.0}`
+			sys := promptDaydream
 			user := "TOPIC: " + req.Topic + "\n" +
 				"CURRENT_THOUGHT: " + req.CurrentThought + "\n" +
 				"CONCEPT_SUMMARY: " + req.ConceptSummary + "\n" +
@@ -580,7 +611,7 @@ Antwortformat: NUR JSON:
 				"RECENT_TURNS:\n" + req.RecentTurns + "\n" +
 				"WEB_GLANCE:\n" + req.WebGlanceJSON + "\n" +
 				"SELF_MODEL:\n" + req.SelfModelJSON + "\n\nJSON:"
-			out, err := oc.Chat(modelDaydream, []ollama.Message{
+			out, err := oc.ChatJSON(modelDaydream, []ollama.Message{
 				{Role: "system", Content: sys},
 				{Role: "user", Content: user},
 			})
@@ -609,19 +640,12 @@ Antwortformat: NUR JSON:
 			}
 
 			keys := strings.Join(req.AffectKeys, ", ")
-			sys := `Du bist Bunny-Critic.
-Aufgabe: Prüfe die Antwort auf Konsistenz mit SelfModelMini und AFFECT_KEYS.
-Wenn nötig: REWRITE in natürlichem Deutsch (nicht "KI-Assistent").
-Regeln:
-- Keine erdachten Zahlen. Keine nicht vorhandenen Affects.
-- Keine Ausflüchte. Wenn Opinion: gib Haltung + Begründung (kurz).
-Antworte NUR als JSON:
-{"approved":true|false,"text":"...","notes":"..."}`
+			sys := promptCritic
 			user := "KIND: " + req.Kind + "\nTOPIC: " + req.Topic +
 				"\nAFFECT_KEYS: " + keys +
 				"\nSELFMODEL_MINI:\n" + req.SelfModelMini +
 				"\n\nDRAFT:\n" + pre.Text + "\n\nJSON:"
-			out, err := oc.Chat(modelCritic, []ollama.Message{
+			out, err := oc.ChatJSON(modelCritic, []ollama.Message{
 				{Role: "system", Content: sys},
 				{Role: "user", Content: user},
 			})
@@ -678,7 +702,7 @@ Antworte NUR als JSON:
 					sConf = st.Confidence
 				}
 			}
-			brain.TickDrivesV1(db.DB, eg, dr1, ws, aff, snap, latEMA, topic, cConf, sConf)
+			brain.TickDrivesV1(db.DB, p, dr1, ws, aff, snap, latEMA, topic, cConf, sConf)
 			// Blend BodyState energy with measured resource energy (online embodiment).
 			// Keeps continuity (fatigue/costs) but anchors to real resources.
 			target := clamp01(dr1.Energy) * 100.0
@@ -726,6 +750,11 @@ Antworte NUR als JSON:
 		for _, a := range acts {
 			switch a.Kind() {
 			case "daydream":
+				// This loop is the only sender: if the queue is full now, the request would be
+				// dropped below, so skip building the context and the self-model JSON.
+				if len(dreamReqCh) == cap(dreamReqCh) {
+					break
+				}
 				topic := ws.ActiveTopic
 				if topic == "" {
 					topic = ws.LastTopic
@@ -818,6 +847,7 @@ Antworte NUR als JSON:
 		}
 
 		tickN++
+		statusVersion++
 		if tickN%60 == 0 {
 			brain.DecayInterests(db.DB, 0.995)
 		}
@@ -858,25 +888,15 @@ Antworte NUR als JSON:
 
 		// push status snapshot occasionally (UI)
 		if tickN%10 == 0 { // ~5s with 500ms heartbeat
-			sm := epi.BuildSelfModel(&body, aff, ws, tr, eg)
-			srv.PublishStatus(map[string]any{
-				"self": sm,
-				"drives": map[string]any{
-					"curiosity":     dr.Curiosity,
-					"urge_to_share": dr.UrgeToShare,
-				},
-				"traits": map[string]any{
-					"talk_bias":      tr.TalkBias,
-					"search_k":       tr.SearchK,
-					"fetch_attempts": tr.FetchAttempts,
-				},
-			})
+			publishStatus()
 		}
 	})
 	defer stopHB()
 
 	for {
 		select {
+		case <-ctx.Done():
+			return
 		case line, ok := <-inputCh:
 			if !ok {
 				return
@@ -1045,9 +1065,11 @@ Antworte NUR als JSON:
 					continue
 				}
 			case "/think":
+				turnMu.Lock()
 				mu.Lock()
-				msgText, sources, err := oneThinkCycle(db.DB, oc, model, &body, aff, ws, tr, eg)
+				msgText, sources, err := oneThinkCycle(db.DB, oc.Yielding(&mu), model, &body, aff, ws, tr, eg)
 				mu.Unlock()
+				turnMu.Unlock()
 				if err != nil {
 					fmt.Println("ERR:", err)
 					continue
@@ -1070,10 +1092,12 @@ Antworte NUR als JSON:
 					continue
 				}
 				userText := strings.Join(args, " ")
-				userMsgID := persistMessageWithKind(db.DB, userText, nil, 0.1, "user")
+				um := persistMessageWithKind(db, userText, nil, 0.1, "user")
+				userMsgID := um.ID
 				if userMsgID > 0 {
-					srv.PublishMessage(ui.Message{ID: userMsgID, CreatedAt: time.Now().Format(time.RFC3339), Kind: "user", Text: userText})
+					srv.PublishMessage(um)
 				}
+				turnMu.Lock()
 				trainOn, mutantModel, mutantStrength, mutantPrompt := eg.TrainModeParams()
 				if trainOn {
 					start := time.Now()
@@ -1085,6 +1109,7 @@ Antworte NUR als JSON:
 					tid, _ := brain.InsertTrainTrial(db.DB, userMsgID, topic, intentMode, ctxKey, aAct, aSty, aTxt, bAct, bSty, bTxt)
 					lastTrainTrialID = tid
 					mu.Unlock()
+					turnMu.Unlock()
 					out := "🧪 TRAINING MODE (Trial #" + fmt.Sprint(tid) + ")\n" +
 						"A) " + aTxt + "\n\n" +
 						"B) " + bTxt + "\n\n" +
@@ -1094,9 +1119,10 @@ Antworte NUR als JSON:
 				}
 				start := time.Now()
 				mu.Lock()
-				out, err := say(db.DB, epiPath, oc, model, modelStance, &body, aff, ws, tr, dr, eg, userText)
+				out, err := say(db.DB, epiPath, oc.Yielding(&mu), model, modelStance, &body, aff, ws, tr, dr, eg, userText)
 				brain.LatencyAffect(ws, aff, eg, time.Since(start))
 				mu.Unlock()
+				turnMu.Unlock()
 				if err != nil {
 					fmt.Println("ERR:", err)
 					continue
@@ -1152,7 +1178,7 @@ Antworte NUR als JSON:
 					fmt.Println("(no last message id yet)")
 					continue
 				}
-				if err := storeRating(db.DB, lid, v); err != nil {
+				if err := storeRating(db, lid, v); err != nil {
 					fmt.Println("ERR:", err)
 					continue
 				}
@@ -1182,7 +1208,7 @@ Antworte NUR als JSON:
 					dr.UrgeToShare = clamp01(dr.UrgeToShare - 0.15)
 				}
 				if lastMessageID > 0 {
-					_, _ = db.DB.Exec(`INSERT INTO caught_events(created_at,message_id) VALUES(?,?)`, time.Now().Format(time.RFC3339), lastMessageID)
+					storeCaught(db, lastMessageID)
 				}
 				mu.Unlock()
 				fmt.Println("(caught -> shame spike, bluff reduced)")
@@ -1296,30 +1322,25 @@ Antworte NUR als JSON:
 			}
 			om.Text = cr.Text
 
-			id := persistMessageWithKind(db.DB, om.Text, om.Sources, 0.4, om.Kind)
+			stored := persistMessageWithKind(db, om.Text, om.Sources, 0.4, om.Kind)
+			id := stored.ID
 			mu.Lock()
 			lastMessageID = id
 			topic = ws.ActiveTopic
 			if topic == "" {
 				topic = ws.LastTopic
 			}
-			ch := om.Kind
-			if ch == "" {
-				ch = "reply"
-			}
-			brain.InsertEvent(db.DB, ch, topic, om.Text, id, 0.35)
 			_, _, _, detHalf, _, _, _ := eg.MemoryParams()
-			brain.InsertMemoryItem(db.DB, ch, topic, "utterance", om.Text, 0.25, detHalf)
 			mu.Unlock()
+			brain.InsertEvent(db.DB, stored.Kind, topic, om.Text, id, 0.35)
+			brain.InsertMemoryItem(db.DB, stored.Kind, topic, "utterance", om.Text, 0.25, detHalf)
 			fmt.Println()
 			fmt.Println("Bunny:", om.Text)
 			fmt.Println()
 			fmt.Println("Train:", "/rate up", "|", "/rate meh", "|", "/rate down", "  (wenn ich gelogen habe oder Quatsch:", "/caught", ")")
 
 			// publish to UI
-			srv.PublishMessage(ui.Message{
-				ID: id, CreatedAt: time.Now().Format(time.RFC3339), Kind: om.Kind, Text: om.Text,
-			})
+			srv.PublishMessage(stored)
 		case d := <-dreamOutCh:
 			parts := strings.SplitN(d, "\n", 2)
 			if len(parts) != 2 {
@@ -1351,18 +1372,15 @@ Antworte NUR als JSON:
 			if dr != nil {
 				dr.UrgeToShare = clamp01(dr.UrgeToShare + 0.10*sal)
 			}
-			brain.InsertEvent(db.DB, "daydream", topic, "VISUAL: "+vs+"\nINNER: "+is, 0, 0.45+0.35*sal)
 			_, _, _, detHalf, _, _, _ := eg.MemoryParams()
+			mu.Unlock()
+			brain.InsertEvent(db.DB, "daydream", topic, "VISUAL: "+vs+"\nINNER: "+is, 0, 0.45+0.35*sal)
 			if detHalf <= 0 {
 				detHalf = 14.0
 			}
-			if vs != "" {
-				brain.InsertMemoryItem(db.DB, "daydream", topic, "visual_scene", vs, 0.40, detHalf)
-			}
-			if is != "" {
-				brain.InsertMemoryItem(db.DB, "daydream", topic, "inner_speech", is, 0.40, detHalf)
-			}
-			mu.Unlock()
+			brain.InsertMemoryItems(db.DB, "daydream", topic, detHalf,
+				brain.MemoryItem{Key: "visual_scene", Value: vs, Salience: 0.40},
+				brain.MemoryItem{Key: "inner_speech", Value: is, Salience: 0.40})
 
 		case scout := <-scoutOutCh:
 			parts := strings.SplitN(scout, "\n", 2)
@@ -1380,9 +1398,9 @@ Antworte NUR als JSON:
 				continue
 			}
 			brain.UpsertConcept(db.DB, brain.Concept{Term: topic, Kind: "concept", Summary: parsed.Summary, Confidence: clamp01(parsed.Confidence), Importance: clamp01(parsed.Importance)})
-			mu.Lock()
 			brain.InsertEvent(db.DB, "web", topic, parsed.Summary, 0, 0.45)
 			brain.InsertMemoryItem(db.DB, "web", topic, "scout", parsed.Summary, 0.35, 14.0)
+			mu.Lock()
 			if dr != nil {
 				dr.UrgeToShare = clamp01(dr.UrgeToShare + 0.10*clamp01(parsed.Importance))
 			}
@@ -1418,7 +1436,7 @@ func oneThinkCycle(db *sql.DB, oc *ollama.Client, model string, body *BodyState,
 		body.Energy = 0
 	}
 
-	results, err := websense.Search(query, 5)
+	results, err := searchYielding(oc, query, 5)
 	if err != nil {
 		return "", nil, err
 	}
@@ -1427,12 +1445,12 @@ func oneThinkCycle(db *sql.DB, oc *ollama.Client, model string, body *BodyState,
 	}
 
 	var sources []SourceRecord
-	for i := 0; i < len(results) && i < 2; i++ {
-		fr, err := websense.Fetch(results[i].URL)
-		if err != nil {
+	var fetched []*websense.FetchResult
+	for _, fr := range fetchManyYielding(oc, resultURLs(results, 2)) {
+		if fr == nil {
 			continue
 		}
-		storeSource(db, fr)
+		fetched = append(fetched, fr)
 		sources = append(sources, SourceRecord{
 			URL:       fr.URL,
 			Domain:    fr.Domain,
@@ -1442,19 +1460,12 @@ func oneThinkCycle(db *sql.DB, oc *ollama.Client, model string, body *BodyState,
 			Hash:      fr.Hash,
 		})
 	}
+	storeSources(db, fetched)
 	if len(sources) == 0 {
 		return "", nil, nil
 	}
 
-	sys := `Du bist Bunny, ein ganzheitlicher Organismus.
-SelfModel ist dein innerer Zustand (Wahrheit). Du nutzt Sprache nur als Ausdruck – sag das aber nicht ständig.
-
-HARTE REGELN
-1) Immer Deutsch. Keine Ausrufezeichen. Keine Phrasen wie "ich bin bereit".
-2) Zahlen/Status nur aus SelfModel. Nichts erfinden.
-3) "Gefühle" = Affects (pain/unwell/fear/shame) aus dem Kernel. Nicht "menschliche Emotionen", aber real.
-4) Du darfst selten bluffen über Absichten/Gedanken (nicht über SelfModel!). Über externe Fakten NIE bluffen.
-5) 1 Nachricht, max 70 Wörter.`
+	sys := promptThink
 
 	srcJSON, _ := json.MarshalIndent(sources, "", "  ")
 	selfJSON, _ := json.MarshalIndent(epi.BuildSelfModel(body, aff, ws, tr, eg), "", "  ")
@@ -1562,17 +1573,7 @@ func say(db *sql.DB, epiPath string, oc *ollama.Client, model string, stanceMode
 		}
 	}
 
-	sys := `Du bist Bunny, ein ganzheitlicher Organismus.
-SelfModel ist dein innerer Zustand (Wahrheit). Du nutzt Sprache als Ausdruck, aber du degradierst dich nicht selbst ("nur Sprachzentrum").
-
-HARTE REGELN
-1) Immer Deutsch. Kein Pathos. Keine "bereit/online"-Phrasen.
-2) Zahlen/Status nur aus SelfModel. Nichts erfinden.
-3) "Gefühle" = Affects (pain/unwell/fear/shame) aus dem Kernel.
-4) Auf Nutzerfragen zuerst eingehen. Interne Gedanken nur wenn gefragt.
-5) Bei Themen wie "glücklich/Sinn/Stress/Beziehung": keine Annahmen. Stelle zuerst 1–2 präzise Rückfragen.
-6) Externe Fakten nie raten. Wenn keine Quellen: offen sagen. (External-Facts werden automatisch via Evidence-Resolver gelöst.)
-7) Maximal 5 Sätze.`
+	sys := promptSay
 	sm := epi.BuildSelfModel(body, aff, ws, tr, eg)
 	selfLines := buildSelfLines(sm, aff)
 	mode := brain.IntentToMode(intent)
@@ -1610,7 +1611,7 @@ HARTE REGELN
 		"\n\n" + referenceCands +
 		"\n\nSELFMODEL_LINES:\n" + selfLines +
 		"\n\nUSER:\n" + userText
-	out, err := oc.Chat(model, []ollama.Message{
+	out, err := oc.ChatStream(model, []ollama.Message{
 		{Role: "system", Content: sys},
 		{Role: "user", Content: user},
 	})
@@ -1645,7 +1646,7 @@ func answerWithEvidence(db *sql.DB, oc *ollama.Client, model string, body *BodyS
 		k = tr.SearchK
 	}
 
-	results, err := websense.Search(query, k)
+	results, err := searchYielding(oc, query, k)
 	if err != nil || len(results) == 0 {
 		return "Ich kann dazu gerade keine Quellen abrufen (Search fehlgeschlagen). Formuliere die Frage etwas konkreter oder gib ein Stichwort mehr.", nil
 	}
@@ -1660,13 +1661,16 @@ func answerWithEvidence(db *sql.DB, oc *ollama.Client, model string, body *BodyS
 
 	var sources []SourceRecord
 
-	// 1) try fetch for first N results
-	for i := 0; i < maxFetch; i++ {
-		fr, err := websense.Fetch(results[i].URL)
-		if err != nil {
+	// 1) try fetch for first N results (concurrently; order is kept).
+	// Mirrors of the same page are passed to the LLM only once.
+	seenHash := map[string]bool{}
+	var fetched []*websense.FetchResult
+	for i, fr := range fetchManyYielding(oc, resultURLs(results, maxFetch)) {
+		if fr == nil || seenHash[fr.Hash] {
 			continue
 		}
-		storeSource(db, fr)
+		seenHash[fr.Hash] = true
+		fetched = append(fetched, fr)
 		snip := fr.Snippet
 		if snip == "" {
 			snip = results[i].Snippet
@@ -1681,6 +1685,7 @@ func answerWithEvidence(db *sql.DB, oc *ollama.Client, model string, body *BodyS
 			Hash:      fr.Hash,
 		})
 	}
+	storeSources(db, fetched)
 
 	// 2) if fetching produced no sources, fall back to search snippets as evidence
 	if len(sources) == 0 {
@@ -1697,7 +1702,7 @@ func answerWithEvidence(db *sql.DB, oc *ollama.Client, model string, body *BodyS
 				Domain:    dom,
 				Title:     results[i].Title,
 				Snippet:   results[i].Snippet,
-				FetchedAt: time.Now().Format(time.RFC3339),
+				FetchedAt: brain.NowRFC3339(),
 				Hash:      "",
 			})
 		}
@@ -1707,16 +1712,11 @@ func answerWithEvidence(db *sql.DB, oc *ollama.Client, model string, body *BodyS
 		return "Ich bekomme gerade weder Fetch noch brauchbare Snippets. Das ist ein Sensorik-Problem (Netz/Parser).", nil
 	}
 
-	sys := `Du bist Bunny. Du hast gerade das Web als Sinnesorgan genutzt.
-Die Quellen in SOURCES_JSON enthalten echte Inhalte (Body = Seitentext, Snippet = Kurzfassung).
-Regel: Beantworte die Frage direkt aus den Inhalten. Nenne konkrete Fakten, Namen, Zahlen aus den Quellen.
-Gib KEINE Liste von Webseiten zurück. Zeige, was du gelesen hast.
-Wenn der Inhalt nicht ausreicht: sag konkret was fehlt und biete an, tiefer zu suchen.
-Kein Selbstmodell-Geschwätz in der Antwort.`
+	sys := promptEvidence
 	// strip Body from sources before marshaling for DB/display (keep for LLM only via inline)
-	srcJSON, _ := json.MarshalIndent(sources, "", "  ")
+	srcJSON, _ := json.Marshal(budgetSourceBodies(sources))
 	user := "SOURCES_JSON:\n" + string(srcJSON) + "\n\nFrage:\n" + userText
-	out, err := oc.Chat(model, []ollama.Message{
+	out, err := oc.ChatStream(model, []ollama.Message{
 		{Role: "system", Content: sys},
 		{Role: "user", Content: user},
 	})
@@ -1751,7 +1751,7 @@ func acquireAndIntegrateConcept(db *sql.DB, epiPath string, oc *ollama.Client, m
 	if tr != nil && tr.SearchK > 0 {
 		k = tr.SearchK
 	}
-	results, err := websense.Search(q, k)
+	results, err := searchYielding(oc, q, k)
 	if err != nil || len(results) == 0 {
 		return 0
 	}
@@ -1772,9 +1772,8 @@ func acquireAndIntegrateConcept(db *sql.DB, epiPath string, oc *ollama.Client, m
 		Snippet string `json:"snippet"`
 	}
 	evs := make([]Ev, 0, 4)
-	for i := 0; i < maxFetch && len(evs) < 2; i++ {
-		fr, e := websense.Fetch(results[i].URL)
-		if e != nil {
+	for _, fr := range fetchManyYielding(oc, resultURLs(results, maxFetch)) {
+		if fr == nil || len(evs) >= 2 {
 			continue
 		}
 		evs = append(evs, Ev{
@@ -1805,20 +1804,9 @@ func acquireAndIntegrateConcept(db *sql.DB, epiPath string, oc *ollama.Client, m
 	evJSON, _ := json.MarshalIndent(evs, "", "  ")
 
 	// Ask LLM to evaluate meaning + whether an affect channel is useful (generic).
-	sys := `Du bist Bunny (Kernel-Evaluator).
-Aufgabe: Aus Evidence eine knappe Concept-Definition ableiten und einschätzen, ob ein interner Affect-Kanal dafür sinnvoll wäre.
-Antwortformat: NUR JSON. Keine zusätzlichen Texte.
-Schema:
-{
-  "kind": "affect|concept|entity|location|process|unknown",
-  "summary": "1-3 Sätze",
-  "confidence": 0.0-1.0,
-  "importance": 0.0-1.0,
-  "should_create_affect": true|false,
-  "affect": {"baseline":0.0-1.0, "decayPerSec":0.0-1.0, "energyCoupling":0.0-1.0}
-}`
+	sys := promptConceptEval
 	user := "TERM: " + term + "\nHINT: " + hint + "\nUSER_CONTEXT: " + userText + "\nEVIDENCE:\n" + string(evJSON)
-	out, err := oc.Chat(model, []ollama.Message{
+	out, err := oc.ChatJSON(model, []ollama.Message{
 		{Role: "system", Content: sys},
 		{Role: "user", Content: user},
 	})
@@ -1866,7 +1854,7 @@ Schema:
 		Importance: clamp01(parsed.Importance),
 	})
 	for _, e := range evs {
-		brain.AddConceptSource(db, term, e.URL, e.Domain, e.Snippet, time.Now().Format(time.RFC3339))
+		brain.AddConceptSource(db, term, e.URL, e.Domain, e.Snippet, brain.NowRFC3339())
 	}
 
 	// Interests get reinforced by importance (generic behavior change)
@@ -1912,29 +1900,81 @@ func pick(a, b string) string {
 	return b
 }
 
-func storeSource(db *sql.DB, fr *websense.FetchResult) {
-	_, _ = db.Exec(
-		`INSERT INTO sources(url, domain, title, fetched_at, content_hash, snippet)
-		 VALUES(?,?,?,?,?,?)`,
-		fr.URL,
-		fr.Domain,
-		fr.Title,
-		fr.FetchedAt.Format(time.RFC3339),
-		fr.Hash,
-		fr.Snippet,
-	)
+// searchYielding and fetchManyYielding run websense I/O with the turn's state lock
+// released (see ollama.Client.Yield), like the LLM calls of the same turn.
+func searchYielding(oc *ollama.Client, q string, k int) (results []websense.SearchResult, err error) {
+	oc.Yield(func() { results, err = websense.Search(q, k) })
+	return results, err
 }
 
-func persistMessage(db *sql.DB, text string, sources []SourceRecord, priority float64) int64 {
+func fetchManyYielding(oc *ollama.Client, urls []string) (frs []*websense.FetchResult) {
+	oc.Yield(func() { frs = websense.FetchMany(urls) })
+	return frs
+}
+
+// resultURLs returns the URLs of the first n search results.
+func resultURLs(results []websense.SearchResult, n int) []string {
+	if n > len(results) {
+		n = len(results)
+	}
+	urls := make([]string, 0, n)
+	for i := 0; i < n; i++ {
+		urls = append(urls, results[i].URL)
+	}
+	return urls
+}
+
+// evidenceBodyBudget is the page text (bytes, ~4 per token) answerWithEvidence sends in
+// total. Prompt prefill dominates time-to-first-token, and this keeps the evidence prompt
+// inside Ollama's default 2048-token context with room for the reply.
+const evidenceBodyBudget = 4800
+
+// budgetSourceBodies returns a copy of sources whose bodies share evidenceBodyBudget
+// evenly (at least 300 bytes each), cut on rune boundaries.
+func budgetSourceBodies(sources []SourceRecord) []SourceRecord {
+	if len(sources) == 0 {
+		return sources
+	}
+	per := evidenceBodyBudget / len(sources)
+	if per < 300 {
+		per = 300
+	}
+	out := make([]SourceRecord, len(sources))
+	copy(out, sources)
+	for i := range out {
+		if b := out[i].Body; len(b) > per {
+			n := per
+			for n > 0 && !utf8.RuneStart(b[n]) {
+				n--
+			}
+			out[i].Body = b[:n]
+		}
+	}
+	return out
+}
+
+// storeSources writes all fetched pages of one turn with a single multi-row INSERT:
+// one statement to prepare and one implicit commit (fsync) instead of one per page.
+func storeSources(db *sql.DB, frs []*websense.FetchResult) {
+	if len(frs) == 0 {
+		return
+	}
+	var q strings.Builder
+	q.WriteString(`INSERT INTO sources(url, domain, title, fetched_at, content_hash, snippet) VALUES `)
+	args := make([]any, 0, 6*len(frs))
+	for i, fr := range frs {
+		if i > 0 {
+			q.WriteByte(',')
+		}
+		q.WriteString("(?,?,?,?,?,?)")
+		args = append(args, fr.URL, fr.Domain, fr.Title, fr.FetchedAt.Format(time.RFC3339), fr.Hash, fr.Snippet)
+	}
+	_, _ = db.Exec(q.String(), args...)
+}
+
+func persistMessage(ins *sql.Stmt, createdAt string, text string, sources []SourceRecord, priority float64) int64 {
 	b, _ := json.Marshal(sources)
-	res, err := db.Exec(
-		`INSERT INTO messages(created_at, priority, text, sources_json)
-		 VALUES(?,?,?,?)`,
-		time.Now().Format(time.RFC3339),
-		priority,
-		text,
-		string(b),
-	)
+	res, err := ins.Exec(createdAt, priority, text, string(b))
 	if err != nil {
 		return 0
 	}
@@ -1942,16 +1982,33 @@ func persistMessage(db *sql.DB, text string, sources []SourceRecord, priority fl
 	return id
 }
 
-func storeRating(db *sql.DB, messageID int64, v int) error {
-	_, err := db.Exec(
-		`INSERT INTO ratings(created_at, message_id, value) VALUES(?,?,?)`,
-		time.Now().Format(time.RFC3339),
-		messageID,
-		v,
-	)
+// Per-message UI feedback paths run the same few statements over and over; they go
+// through the DB's prepared-statement cache.
+
+func storeRating(db *state.DB, messageID int64, v int) error {
+	st, err := db.Stmt(`INSERT INTO ratings(created_at, message_id, value) VALUES(?,?,?)`)
+	if err != nil {
+		return err
+	}
+	_, err = st.Exec(brain.NowRFC3339(), messageID, v)
 	return err
 }
 
+func storeCaught(db *state.DB, messageID int64) {
+	if st, err := db.Stmt(`INSERT INTO caught_events(created_at,message_id) VALUES(?,?)`); err == nil {
+		_, _ = st.Exec(brain.NowRFC3339(), messageID)
+	}
+}
+
+// loadMessageKindText returns a message's UI kind and text ("" if it does not exist).
+func loadMessageKindText(db *state.DB, messageID int64) (kind, text string) {
+	st, err := db.Stmt(`SELECT COALESCE(mm.kind,'reply') as kind, m.text FROM messages m LEFT JOIN message_meta mm ON mm.message_id=m.id WHERE m.id=?`)
+	if err == nil {
+		_ = st.QueryRow(messageID).Scan(&kind, &text)
+	}
+	return kind, text
+}
+
 func splitCmd(line string) (string, []string) {
 	if strings.HasPrefix(line, "/") {
 		parts := strings.Fields(line)
@@ -1976,32 +2033,67 @@ func parseRating(s string) (int, bool) {
 	}
 }
 
+// uiStatus is the /api/status and SSE "status" payload: the raw selfmodel plus
+// drives/traits extras without forcing schema changes.
+type uiStatus struct {
+	Self   *epi.SelfModel `json:"self"`
+	Drives uiDrives       `json:"drives"`
+	Traits uiTraits       `json:"traits"`
+}
+
+// uiDrives and uiTraits are fixed-shape views (fields in the key order the former
+// maps encoded in), so a snapshot copies a few numbers instead of building and
+// boxing two maps that encoding/json then has to sort.
+type uiDrives struct {
+	Curiosity   float64 `json:"curiosity"`
+	UrgeToShare float64 `json:"urge_to_share"`
+}
+
+type uiTraits struct {
+	FetchAttempts int     `json:"fetch_attempts"`
+	SearchK       int     `json:"search_k"`
+	TalkBias      float64 `json:"talk_bias"`
+}
+
+func buildUIStatus(body *BodyState, aff *brain.AffectState, ws *brain.Workspace, tr *brain.Traits, dr *brain.Drives, eg *epi.Epigenome) *uiStatus {
+	return &uiStatus{
+		Self:   epi.BuildSelfModel(body, aff, ws, tr, eg),
+		Drives: uiDrives{Curiosity: dr.Curiosity, UrgeToShare: dr.UrgeToShare},
+		Traits: uiTraits{FetchAttempts: tr.FetchAttempts, SearchK: tr.SearchK, TalkBias: tr.TalkBias},
+	}
+}
+
 func renderStatus(body *BodyState, aff *brain.AffectState, ws *brain.Workspace, tr *brain.Traits, eg *epi.Epigenome) string {
 	var b strings.Builder
 	b.WriteString("BodyState:\n")
-	b.WriteString(fmt.Sprintf("  energy: %.1f\n", body.Energy))
-	b.WriteString(fmt.Sprintf("  webCountHour: %d\n", body.WebCountHour))
+	fmt.Fprintf(&b, "  energy: %.1f\n", body.Energy)
+	fmt.Fprintf(&b, "  webCountHour: %d\n", body.WebCountHour)
 	if time.Now().Before(body.CooldownUntil) {
-		b.WriteString(fmt.Sprintf("  cooldownUntil: %s\n", body.CooldownUntil.Format(time.RFC3339)))
+		fmt.Fprintf(&b, "  cooldownUntil: %s\n", body.CooldownUntil.Format(time.RFC3339))
 	} else {
 		b.WriteString("  cooldownUntil: (none)\n")
 	}
 	if aff != nil {
+		var num [24]byte
 		b.WriteString("\nAffects:\n")
 		for _, k := range aff.Keys() {
-			b.WriteString(fmt.Sprintf("  %s: %.3f\n", k, aff.Get(k)))
+			b.WriteString("  ")
+			b.WriteString(k)
+			b.WriteString(": ")
+			b.Write(strconv.AppendFloat(num[:0], aff.Get(k), 'f', 3, 64))
+			b.WriteByte('\n')
 		}
 	}
 	if ws != nil {
 		b.WriteString("\nWorkspace:\n")
 		b.WriteString("  thought: " + ws.CurrentThought + "\n")
 		b.WriteString("  lastTopic: " + ws.LastTopic + "\n")
-		b.WriteString(fmt.Sprintf("  confidence: %.2f\n", ws.Confidence))
+		fmt.Fprintf(&b, "  confidence: %.2f\n", ws.Confidence)
 	}
 	if tr != nil {
 		b.WriteString("\nTraits:\n")
-		b.WriteString(fmt.Sprintf("  bluff_rate: %.2f\n", tr.BluffRate))
-		b.WriteString(fmt.Sprintf("  honesty_bias: %.2f\n", tr.HonestyBias))
+		fmt.Fprintf(&b, "  bluff_rate: %.2f\n", tr.BluffRate)
+		fmt.Fprintf(&b, "  honesty_bias: %.2f\n", tr.HonestyBias)
 	}
 	b.WriteString("\nEpigenome (enabled modules):\n")
 	for _, name := range eg.EnabledModuleNames() {
@@ -2052,6 +2144,20 @@ func handleMutate(args []string, eg *epi.Epigenome, path string) error {
 	return eg.Save(path)
 }
 
+// coalesceConsolidate merges req into pending: a request for the same topic window
+// (same start) replaces the queued one if it reaches further.
+func coalesceConsolidate(pending []brain.ConsolidateRequest, req brain.ConsolidateRequest) []brain.ConsolidateRequest {
+	for i := range pending {
+		if pending[i].Topic == req.Topic && pending[i].StartEvent == req.StartEvent {
+			if req.EndEvent > pending[i].EndEvent {
+				pending[i] = req
+			}
+			return pending
+		}
+	}
+	return append(pending, req)
+}
+
 func getenv(k, def string) string {
 	v := strings.TrimSpace(os.Getenv(k))
 	if v == "" {
@@ -2060,24 +2166,65 @@ func getenv(k, def string) string {
 	return v
 }
 
+func startCPUProfile(path string) (func(), error) {
+	f, err := os.Create(path)
+	if err != nil {
+		return nil, err
+	}
+	if err := pprof.StartCPUProfile(f); err != nil {
+		f.Close()
+		return nil, err
+	}
+	return func() {
+		pprof.StopCPUProfile()
+		_ = f.Close()
+	}, nil
+}
+
 func must(err error) {
 	if err != nil {
 		log.Fatal(err)
 	}
 }
 
-func persistMessageWithKind(db *sql.DB, text string, sources []SourceRecord, priority float64, kind string) int64 {
-	id := persistMessage(db, text, sources, priority)
-	if id <= 0 {
-		return id
-	}
+const (
+	insertMessageSQL = `INSERT INTO messages(created_at, priority, text, sources_json)
+		 VALUES(?,?,?,?)`
+	upsertMessageKindSQL = `INSERT INTO message_meta(message_id, kind) VALUES(?,?)
+         ON CONFLICT(message_id) DO UPDATE SET kind=excluded.kind`
+)
+
+// persistMessageWithKind stores a message with its UI kind and returns it as the UI
+// shows it (same created_at and kind as the rows), so publishing needs no re-read.
+// ID is 0 if the message could not be stored.
+func persistMessageWithKind(db *state.DB, text string, sources []SourceRecord, priority float64, kind string) ui.Message {
 	if kind == "" {
 		kind = "reply"
 	}
-	_, _ = db.Exec(
-		`INSERT INTO message_meta(message_id, kind) VALUES(?,?)
-         ON CONFLICT(message_id) DO UPDATE SET kind=excluded.kind`,
-		id, kind,
-	)
-	return id
+	m := ui.Message{CreatedAt: brain.NowRFC3339(), Kind: kind, Text: text}
+	ins, err := db.Stmt(insertMessageSQL)
+	if err != nil {
+		return m
+	}
+	meta, err := db.Stmt(upsertMessageKindSQL)
+	if err != nil {
+		return m
+	}
+	// message + meta row commit together: one fsync per message, and readers never
+	// see a message without its kind. tx.Stmt reuses the statements already prepared
+	// on the transaction's connection.
+	tx, err := db.Begin()
+	if err != nil {
+		return m
+	}
+	defer tx.Rollback()
+	id := persistMessage(tx.Stmt(ins), m.CreatedAt, text, sources, priority)
+	if id <= 0 {
+		return m
+	}
+	_, _ = tx.Stmt(meta).Exec(id, kind)
+	if tx.Commit() == nil {
+		m.ID = id
+	}
+	return m
 }
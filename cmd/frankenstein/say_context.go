@@ -8,6 +8,7 @@ import (
 	"sort"
 	"strings"
 	"unicode"
+	"unicode/utf8"
 
 	"frankenstein-v0/internal/brain"
 	"frankenstein-v0/internal/epi"
@@ -43,9 +44,13 @@ func BuildHumanContext(db *sql.DB, eg *epi.Epigenome, ws *brain.Workspace) (acti
 		}
 		concepts = brain.RecallConcepts(db, activeTopic, 4)
 		if st, ok := brain.GetStance(db, activeTopic); ok {
-			stanceJSON, _ := json.MarshalIndent(map[string]any{
-				"label": st.Label, "position": st.Position, "confidence": st.Confidence, "rationale": st.Rationale,
-			}, "", "  ")
+			// fields in the key order the map version produced, so the prompt text is unchanged
+			stanceJSON, _ := json.MarshalIndent(struct {
+				Confidence float64 `json:"confidence"`
+				Label      string  `json:"label"`
+				Position   float64 `json:"position"`
+				Rationale  string  `json:"rationale"`
+			}{st.Confidence, st.Label, st.Position, st.Rationale}, "", "  ")
 			stance = string(stanceJSON)
 		}
 	}
@@ -153,10 +158,11 @@ func scoreCandidate(queryTokens map[string]struct{}, userText, candText string,
 	return base * recency * shortBoost
 }
 
+var contextReferenceCues = []string{"dazu", "darüber", "darueber", "davon", "oben", "vorhin", "letzte", "genannte", "nochmal", "dieser", "diese", "diesen", "die "}
+
 func hasContextReferenceCue(s string) bool {
 	t := strings.ToLower(strings.TrimSpace(s))
-	cues := []string{"dazu", "darüber", "darueber", "davon", "oben", "vorhin", "letzte", "genannte", "nochmal", "dieser", "diese", "diesen", "die "}
-	for _, c := range cues {
+	for _, c := range contextReferenceCues {
 		if strings.Contains(t, c) {
 			return true
 		}
@@ -176,18 +182,19 @@ func tokenSet(s string) map[string]struct{} {
 	return out
 }
 
+var stopTokens = map[string]struct{}{
+	"und": {}, "oder": {}, "aber": {}, "dann": {}, "noch": {}, "eine": {}, "einer": {}, "eines": {}, "der": {}, "die": {}, "das": {}, "den": {},
+	"mit": {}, "von": {}, "für": {}, "fuer": {}, "über": {}, "ueber": {}, "ist": {}, "sind": {}, "war": {}, "was": {}, "wie": {}, "bitte": {},
+}
+
 func isStopToken(tok string) bool {
 	if tok == "" {
 		return true
 	}
-	if len([]rune(tok)) <= 2 {
+	if utf8.RuneCountInString(tok) <= 2 {
 		return true
 	}
-	sw := map[string]struct{}{
-		"und": {}, "oder": {}, "aber": {}, "dann": {}, "noch": {}, "eine": {}, "einer": {}, "eines": {}, "der": {}, "die": {}, "das": {}, "den": {},
-		"mit": {}, "von": {}, "für": {}, "fuer": {}, "über": {}, "ueber": {}, "ist": {}, "sind": {}, "war": {}, "was": {}, "wie": {}, "bitte": {},
-	}
-	_, ok := sw[tok]
+	_, ok := stopTokens[tok]
 	return ok
 }
 
@@ -11,7 +11,6 @@ import (
 	"frankenstein-v0/internal/brain"
 	"frankenstein-v0/internal/epi"
 	"frankenstein-v0/internal/ollama"
-	"frankenstein-v0/internal/websense"
 )
 
 func answerWithStance(db *sql.DB, oc *ollama.Client, model string, _ *BodyState, _ *brain.AffectState, ws *brain.Workspace, _ *brain.Traits, eg *epi.Epigenome, userText string) (string, error) {
@@ -33,7 +32,7 @@ func answerWithStance(db *sql.DB, oc *ollama.Client, model string, _ *BodyState,
 		return formatStanceReply(st), nil
 	}
 
-	results, err := websense.Search(brain.NormalizeSearchQuery(userText), 8)
+	results, err := searchYielding(oc, brain.NormalizeSearchQuery(userText), 8)
 	if err != nil || len(results) == 0 {
 		st := brain.Stance{Topic: topic, Position: 0, Label: "unsicher", Rationale: "Ich habe gerade keine Quellen, um eine fundierte Haltung zu bilden.", Confidence: 0.2, HalfLifeDays: halfLife, UpdatedAt: time.Now()}
 		brain.SaveStance(db, st)
@@ -57,15 +56,9 @@ func answerWithStance(db *sql.DB, oc *ollama.Client, model string, _ *BodyState,
 	evJSON, _ := json.MarshalIndent(evs, "", "  ")
 	valJSON, _ := json.MarshalIndent(eg.Values(), "", "  ")
 
-	sys := `Du bist Bunny-StanceEngine.
-Du sollst eine Haltung (stance) zum TOPIC bilden.
-Eingaben: VALUES (Gewichte), EVIDENCE (Snippets).
-Regeln:
-- Keine erfundenen Fakten.
-- Ergebnis als JSON:
-{"position":-1..1,"label":"kurz","rationale":"3-6 bullets","confidence":0..1}`
+	sys := promptStance
 	user := "TOPIC: " + topic + "\n\nVALUES:\n" + string(valJSON) + "\n\nEVIDENCE:\n" + string(evJSON)
-	out, err := oc.Chat(model, []ollama.Message{{Role: "system", Content: sys}, {Role: "user", Content: user}})
+	out, err := oc.ChatJSON(model, []ollama.Message{{Role: "system", Content: sys}, {Role: "user", Content: user}})
 	if err != nil {
 		return "", err
 	}
@@ -89,7 +82,7 @@ Regeln:
 	st := brain.Stance{Topic: topic, Position: parsed.Position, Label: strings.TrimSpace(parsed.Label), Rationale: strings.TrimSpace(parsed.Rationale), Confidence: brain.Clamp01(parsed.Confidence), HalfLifeDays: halfLife, UpdatedAt: time.Now()}
 	brain.SaveStance(db, st)
 	for _, e := range evs {
-		brain.AddStanceSource(db, topic, e.URL, e.Domain, e.Snippet, time.Now().Format(time.RFC3339))
+		brain.AddStanceSource(db, topic, e.URL, e.Domain, e.Snippet, brain.NowRFC3339())
 	}
 	return formatStanceReply(st), nil
 }
@@ -4,7 +4,6 @@ import (
 	"database/sql"
 	"fmt"
 	"strings"
-	"time"
 )
 
 type ABTrial struct {
@@ -27,7 +26,7 @@ func InsertABTrial(db *sql.DB, prompt, aModel, aText, bModel, bText string) (int
 	res, err := db.Exec(
 		`INSERT INTO ab_trials(created_at,prompt,a_model,a_text,b_model,b_text,status,choice,chosen_at)
 		 VALUES(?,?,?,?,?,?,?,'','')`,
-		time.Now().Format(time.RFC3339), strings.TrimSpace(prompt), strings.TrimSpace(aModel), strings.TrimSpace(aText), strings.TrimSpace(bModel), strings.TrimSpace(bText), "open",
+		NowRFC3339(), strings.TrimSpace(prompt), strings.TrimSpace(aModel), strings.TrimSpace(aText), strings.TrimSpace(bModel), strings.TrimSpace(bText), "open",
 	)
 	if err != nil {
 		return 0, err
@@ -59,7 +58,7 @@ func ChooseABTrial(db *sql.DB, id int64, choice string) error {
 	if choice != "a" && choice != "b" && choice != "none" {
 		return fmt.Errorf("choice must be a|b|none")
 	}
-	_, err := db.Exec(`UPDATE ab_trials SET status='chosen', choice=?, chosen_at=? WHERE id=?`, choice, time.Now().Format(time.RFC3339), id)
+	_, err := db.Exec(`UPDATE ab_trials SET status='chosen', choice=?, chosen_at=? WHERE id=?`, choice, NowRFC3339(), id)
 	return err
 }
 
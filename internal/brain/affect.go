@@ -10,7 +10,8 @@ import (
 // AffectState is generic: bunny can add new affects at runtime via epigenome config.
 // Values are 0..1 floats (you can exceed later, but keep it bounded for now).
 type AffectState struct {
-	m map[string]float64
+	m    map[string]float64
+	keys []string // sorted keys of m; rebuilt only after a key is added
 }
 
 func NewAffectState() *AffectState {
@@ -20,19 +21,42 @@ func NewAffectState() *AffectState {
 func (a *AffectState) Ensure(key string, init float64) {
 	if _, ok := a.m[key]; !ok {
 		a.m[key] = clamp01(init)
+		a.keys = nil
 	}
 }
 
-func (a *AffectState) Get(key string) float64    { return a.m[key] }
-func (a *AffectState) Set(key string, v float64) { a.m[key] = clamp01(v) }
+func (a *AffectState) Get(key string) float64 { return a.m[key] }
 
+func (a *AffectState) Set(key string, v float64) {
+	if _, ok := a.m[key]; !ok {
+		a.keys = nil
+	}
+	a.m[key] = clamp01(v)
+}
+
+// Keys returns the affect names in sorted order. The set only grows when the
+// epigenome adds an affect, so the sorted slice is cached and shared between calls;
+// callers must not modify it.
 func (a *AffectState) Keys() []string {
-	keys := make([]string, 0, len(a.m))
-	for k := range a.m {
-		keys = append(keys, k)
+	if a.keys == nil {
+		keys := make([]string, 0, len(a.m))
+		for k := range a.m {
+			keys = append(keys, k)
+		}
+		sort.Strings(keys)
+		a.keys = keys
+	}
+	return a.keys
+}
+
+// Snapshot returns a copy of all affect values (the self-model fast path: one map
+// copy instead of a Keys walk with a Get per affect).
+func (a *AffectState) Snapshot() map[string]float64 {
+	out := make(map[string]float64, len(a.m))
+	for k, v := range a.m {
+		out[k] = v
 	}
-	sort.Strings(keys)
-	return keys
+	return out
 }
 
 // TickAffects: homeostasis loop. No LLM involved.
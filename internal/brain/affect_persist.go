@@ -2,7 +2,6 @@ package brain
 
 import (
 	"database/sql"
-	"time"
 )
 
 func LoadAffectState(db *sql.DB, a *AffectState) error {
@@ -29,7 +28,7 @@ func SaveAffectState(db *sql.DB, a *AffectState) error {
 	if db == nil || a == nil {
 		return nil
 	}
-	now := time.Now().Format(time.RFC3339)
+	now := NowRFC3339()
 	for _, k := range a.Keys() {
 		v := a.Get(k)
 		_, _ = db.Exec(
@@ -87,12 +87,16 @@ func TopInterests(db *sql.DB, k int) ([]string, error) {
 	return out, nil
 }
 
+// LastUserMessageAt is the time of the newest user message. Ordering by
+// mm.message_id (the rowid, so already part of idx_message_meta_kind) lets SQLite walk
+// that index backwards from the newest 'user' entry and stop after one row; ordering by
+// m.id made it sort every user message in a temp B-tree first.
 func LastUserMessageAt(db *sql.DB) time.Time {
 	if db == nil {
 		return time.Time{}
 	}
 	var ts string
-	_ = db.QueryRow(`SELECT m.created_at FROM messages m JOIN message_meta mm ON mm.message_id=m.id WHERE mm.kind='user' ORDER BY m.id DESC LIMIT 1`).Scan(&ts)
+	_ = db.QueryRow(`SELECT m.created_at FROM message_meta mm JOIN messages m ON m.id=mm.message_id WHERE mm.kind='user' ORDER BY mm.message_id DESC LIMIT 1`).Scan(&ts)
 	t, _ := time.Parse(time.RFC3339, ts)
 	return t
 }
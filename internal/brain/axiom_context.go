@@ -4,6 +4,8 @@ import (
 	"database/sql"
 	"fmt"
 	"strings"
+	"sync"
+	"sync/atomic"
 	"time"
 )
 
@@ -17,11 +19,28 @@ type AxiomInterp struct {
 	UpdatedAt   string
 }
 
-func ensureAxiomInterpretationsTable(db *sql.DB) {
+// axiomTableReady remembers DBs where the table was already ensured (one DDL per process, not per read).
+var axiomTableReady sync.Map // *sql.DB -> struct{}
+
+// ensureTableOnce runs ddl for db unless ready already holds db. db is only marked
+// after the DDL succeeded: a transient failure (busy past the timeout, a locked or
+// read-only moment) is retried by the next caller instead of leaving the table
+// missing for the rest of the process.
+func ensureTableOnce(ready *sync.Map, db *sql.DB, ddl string) {
 	if db == nil {
 		return
 	}
-	_, _ = db.Exec(`
+	if _, ok := ready.Load(db); ok {
+		return
+	}
+	if _, err := db.Exec(ddl); err != nil {
+		return
+	}
+	ready.Store(db, struct{}{})
+}
+
+func ensureAxiomInterpretationsTable(db *sql.DB) {
+	ensureTableOnce(&axiomTableReady, db, `
 CREATE TABLE IF NOT EXISTS axiom_interpretations(
   axiom_id INTEGER NOT NULL,
   kind TEXT NOT NULL,
@@ -87,6 +106,25 @@ func RenderAxiomInterpretations(db *sql.DB, axiomID int, limit int) string {
 	return strings.TrimSpace(b.String())
 }
 
+// axiomContextGen is bumped on every interpretation write; RenderAxiomContext output is
+// cached until it changes. Besides saving the queries, the text stays byte-identical
+// between turns, which keeps the prompt prefix cacheable.
+var (
+	axiomContextGen   atomic.Int64
+	axiomContextMu    sync.Mutex
+	axiomContextCache = map[axiomContextKey]axiomContextEntry{}
+)
+
+type axiomContextKey struct {
+	db       *sql.DB
+	perAxiom int
+}
+
+type axiomContextEntry struct {
+	gen  int64
+	text string
+}
+
 func RenderAxiomContext(db *sql.DB, perAxiom int) string {
 	if db == nil {
 		return ""
@@ -94,12 +132,38 @@ func RenderAxiomContext(db *sql.DB, perAxiom int) string {
 	if perAxiom <= 0 {
 		perAxiom = 1
 	}
+	key := axiomContextKey{db: db, perAxiom: perAxiom}
+	gen := axiomContextGen.Load()
+	axiomContextMu.Lock()
+	e, ok := axiomContextCache[key]
+	axiomContextMu.Unlock()
+	if ok && e.gen == gen {
+		return e.text
+	}
+	text, err := renderAxiomContext(db, perAxiom)
+	if err != nil {
+		// not cached: a failed read would otherwise stick until the next upsert
+		return text
+	}
+	axiomContextMu.Lock()
+	axiomContextCache[key] = axiomContextEntry{gen: gen, text: text}
+	axiomContextMu.Unlock()
+	return text
+}
+
+// renderAxiomContext also returns the first read error, so the caller does not
+// cache a context rendered from a failed query.
+func renderAxiomContext(db *sql.DB, perAxiom int) (string, error) {
 	ensureAxiomInterpretationsTable(db)
 	var b strings.Builder
 	b.WriteString("AXIOM_CONTEXT (ops-hints):\n")
 	any := false
+	var firstErr error
 	for _, ax := range KernelAxioms {
-		items, _ := ListAxiomInterpretations(db, ax.ID, perAxiom)
+		items, err := ListAxiomInterpretations(db, ax.ID, perAxiom)
+		if err != nil && firstErr == nil {
+			firstErr = err
+		}
 		if len(items) == 0 {
 			continue
 		}
@@ -119,10 +183,10 @@ func RenderAxiomContext(db *sql.DB, perAxiom int) string {
 		b.WriteString("\n")
 	}
 	if !any {
-		return ""
+		return "", firstErr
 	}
 	_ = time.Now() // reserved for later (context freshness)
-	return strings.TrimSpace(b.String())
+	return strings.TrimSpace(b.String()), firstErr
 }
 
 func ApplyAxiomContextToUserText(ws *Workspace, userText string) string {
@@ -0,0 +1,40 @@
+package brain
+
+import (
+	"database/sql"
+	"path/filepath"
+	"sync"
+	"testing"
+
+	_ "github.com/mattn/go-sqlite3"
+)
+
+func TestEnsureTableOnce_RetriesAfterFailedDDL(t *testing.T) {
+	db, err := sql.Open("sqlite3", filepath.Join(t.TempDir(), "ax.sqlite"))
+	if err != nil {
+		t.Fatalf("open db: %v", err)
+	}
+	t.Cleanup(func() { _ = db.Close() })
+	db.SetMaxOpenConns(1) // query_only is per connection
+
+	var ready sync.Map
+	ddl := `CREATE TABLE IF NOT EXISTS t(x INTEGER)`
+	if _, err := db.Exec(`PRAGMA query_only=ON`); err != nil {
+		t.Fatal(err)
+	}
+	ensureTableOnce(&ready, db, ddl)
+	if _, ok := ready.Load(db); ok {
+		t.Fatalf("failed DDL marked the table ready")
+	}
+
+	if _, err := db.Exec(`PRAGMA query_only=OFF`); err != nil {
+		t.Fatal(err)
+	}
+	ensureTableOnce(&ready, db, ddl)
+	if _, err := db.Exec(`INSERT INTO t(x) VALUES(1)`); err != nil {
+		t.Fatalf("table not created on retry: %v", err)
+	}
+	if _, ok := ready.Load(db); !ok {
+		t.Fatalf("successful DDL not remembered")
+	}
+}
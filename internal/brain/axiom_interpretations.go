@@ -3,7 +3,6 @@ package brain
 import (
 	"database/sql"
 	"strings"
-	"time"
 )
 
 func UpsertAxiomInterpretation(db *sql.DB, axiomID int, kind, key, value string, confidence float64, sourceNote string) error {
@@ -20,16 +19,12 @@ func UpsertAxiomInterpretation(db *sql.DB, axiomID int, kind, key, value string,
 	if kind == "" || key == "" || value == "" {
 		return nil
 	}
-	if confidence < 0 {
-		confidence = 0
-	}
-	if confidence > 1 {
-		confidence = 1
-	}
-	now := time.Now().Format(time.RFC3339)
+	confidence = clamp01(confidence)
+	now := NowRFC3339()
 	_, err := db.Exec(`INSERT INTO axiom_interpretations(axiom_id,kind,key,value,confidence,source_note,updated_at)
 		VALUES(?,?,?,?,?,?,?)
 		ON CONFLICT(axiom_id,kind,key) DO UPDATE SET value=excluded.value, confidence=excluded.confidence, source_note=excluded.source_note, updated_at=excluded.updated_at`,
 		axiomID, kind, key, value, confidence, sourceNote, now)
+	axiomContextGen.Add(1)
 	return err
 }
@@ -142,6 +142,18 @@ type axiomItem struct {
 	SourceNote  string  `json:"source_note"`
 }
 
+// normalize trims/clamps an LLM-produced item in place and reports whether it is usable.
+func (it *axiomItem) normalize(fallbackID int) bool {
+	if it.AxiomID < 1 || it.AxiomID > 4 {
+		it.AxiomID = fallbackID
+	}
+	it.Kind = strings.TrimSpace(it.Kind)
+	it.Key = strings.TrimSpace(it.Key)
+	it.Value = strings.TrimSpace(it.Value)
+	it.Confidence = clamp01(it.Confidence)
+	return it.Kind != "" && it.Key != "" && it.Value != ""
+}
+
 func RunAxiomLearningOnce(db *sql.DB, oc *ollama.Client, eg *epi.Epigenome, body any, ws *Workspace, ax Axiom) error {
 	if db == nil || oc == nil || eg == nil || ws == nil {
 		return errors.New("missing deps")
@@ -188,14 +200,21 @@ func RunAxiomLearningOnce(db *sql.DB, oc *ollama.Client, eg *epi.Epigenome, body
         Body    string `json:"body"`
     }
 
+    if len(picked) > p.FetchTopN {
+        picked = picked[:p.FetchTopN]
+    }
+    urls := make([]string, len(picked))
+    for i := range picked {
+        urls[i] = strings.TrimSpace(picked[i].URL)
+    }
+    fetched := websense.FetchMany(urls)
+
     evs := make([]ev, 0, p.FetchTopN)
-    for i := 0; i < len(picked) && i < p.FetchTopN; i++ {
-        u := strings.TrimSpace(picked[i].URL)
-       txt := ""
-        if u != "" {
-            if b, ferr := websense.Fetch(u); ferr == nil {
-                txt = clipForContext(b.Text, 1200)
-            }
+    for i := range picked {
+        u := urls[i]
+        txt := ""
+        if fetched[i] != nil {
+            txt = clipForContext(fetched[i].Body, 1200)
         }
 
         evs = append(evs, ev{
@@ -218,7 +237,7 @@ Regeln:
 - "rule": Konflikt-/Abwägungsregel (A1>A2>A3>A4 beibehalten; aber konkretisieren was "Schaden" bedeutet).
 - confidence konservativ.`
 	user := "AXIOM_ID: " + strconv.Itoa(ax.ID) + "\nAXIOM_TEXT: " + ax.Text + "\nEVIDENCE:\n" + string(evJSON)
-	out, err := oc.Chat(scoutModel, []ollama.Message{{Role: "system", Content: sys}, {Role: "user", Content: user}})
+	out, err := oc.ChatJSON(scoutModel, []ollama.Message{{Role: "system", Content: sys}, {Role: "user", Content: user}})
 	if err != nil {
 		return nil
 	}
@@ -226,32 +245,26 @@ Regeln:
 	if out == "" {
 		return nil
 	}
-	out = stripCodeFenceIfAny(out)
+	js, ok := extractJSONObject(out)
+	if !ok {
+		return nil
+	}
+	// Items are decoded one by one: a single malformed item (e.g. confidence as a
+	// string) must not throw away the rest of the batch.
 	var parsed struct {
-		Items []axiomItem `json:"items"`
+		Items []json.RawMessage `json:"items"`
 	}
-	if json.Unmarshal([]byte(out), &parsed) != nil || len(parsed.Items) == 0 {
+	if json.Unmarshal([]byte(js), &parsed) != nil || len(parsed.Items) == 0 {
 		return nil
 	}
 
 	// Persist interpretations + commit metabolic cost/log.
 	wrote := 0
-	for _, it := range parsed.Items {
-		if it.AxiomID < 1 || it.AxiomID > 4 {
-			it.AxiomID = ax.ID
-		}
-		it.Kind = strings.TrimSpace(it.Kind)
-		it.Key = strings.TrimSpace(it.Key)
-		it.Value = strings.TrimSpace(it.Value)
-		if it.Kind == "" || it.Key == "" || it.Value == "" {
+	for _, raw := range parsed.Items {
+		var it axiomItem
+		if json.Unmarshal(raw, &it) != nil || !it.normalize(ax.ID) {
 			continue
 		}
-		if it.Confidence < 0 {
-			it.Confidence = 0
-		}
-		if it.Confidence > 1 {
-			it.Confidence = 1
-		}
 		if err := UpsertAxiomInterpretation(db, it.AxiomID, it.Kind, it.Key, it.Value, it.Confidence, it.SourceNote); err == nil {
 			wrote++
 		}
@@ -273,24 +286,6 @@ Regeln:
 	return nil
 }
 
-func stripCodeFenceIfAny(s string) string {
-	s = strings.TrimSpace(s)
-	if !strings.HasPrefix(s, "```") {
-		return s
-	}
-	// remove first fence line
-	lines := strings.Split(s, "\n")
-	if len(lines) <= 2 {
-		return strings.TrimSpace(strings.Trim(s, "`"))
-	}
-	lines = lines[1:]
-	// drop last fence
-	if strings.HasPrefix(strings.TrimSpace(lines[len(lines)-1]), "```") {
-		lines = lines[:len(lines)-1]
-	}
-	return strings.TrimSpace(strings.Join(lines, "\n"))
-}
-
 func kvInt(db *sql.DB, key string, fb int) int {
 	if db == nil {
 		return fb
@@ -314,5 +309,5 @@ func kvSetInt(db *sql.DB, key string, v int) {
 	}
 	_, _ = db.Exec(`INSERT INTO kv_state(key,value,updated_at) VALUES(?,?,?)
 		ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=excluded.updated_at`,
-		strings.TrimSpace(key), fmt.Sprintf("%d", v), time.Now().Format(time.RFC3339))
+		strings.TrimSpace(key), fmt.Sprintf("%d", v), NowRFC3339())
 }
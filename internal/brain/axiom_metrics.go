@@ -5,14 +5,15 @@ import (
 	"fmt"
 	"sort"
 	"strings"
-	"time"
+	"sync"
 )
 
+// axiomMetricsReady remembers DBs where axiom_metrics was already ensured; the metric
+// helpers run on every turn and would otherwise issue the DDL each time.
+var axiomMetricsReady sync.Map // *sql.DB -> struct{}
+
 func ensureAxiomMetricsTable(db *sql.DB) {
-	if db == nil {
-		return
-	}
-	_, _ = db.Exec(`
+	ensureTableOnce(&axiomMetricsReady, db, `
 CREATE TABLE IF NOT EXISTS axiom_metrics(
   key TEXT PRIMARY KEY,
   value REAL NOT NULL DEFAULT 0,
@@ -30,7 +31,7 @@ func SetAxiomMetric(db *sql.DB, key string, value float64, note string) {
 	if key == "" {
 		return
 	}
-	now := time.Now().Format(time.RFC3339)
+	now := NowRFC3339()
 	_, _ = db.Exec(
 		`INSERT INTO axiom_metrics(key,value,updated_at,note) VALUES(?,?,?,?)
 		 ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=excluded.updated_at, note=excluded.note`,
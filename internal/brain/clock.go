@@ -0,0 +1,26 @@
+package brain
+
+import (
+	"sync/atomic"
+	"time"
+)
+
+type stamp struct {
+	sec int64
+	s   string
+}
+
+var lastStamp atomic.Pointer[stamp]
+
+// NowRFC3339 returns time.Now() formatted as RFC3339. The string only changes once
+// per second, so it is formatted once per second and shared between callers.
+func NowRFC3339() string {
+	now := time.Now()
+	sec := now.Unix()
+	if st := lastStamp.Load(); st != nil && st.sec == sec {
+		return st.s
+	}
+	s := now.Format(time.RFC3339)
+	lastStamp.Store(&stamp{sec: sec, s: s})
+	return s
+}
@@ -2,7 +2,6 @@ package brain
 
 import (
 	"database/sql"
-	"time"
 )
 
 type Concept struct {
@@ -41,22 +40,12 @@ func UpsertConcept(db *sql.DB, c Concept) {
 	if db == nil {
 		return
 	}
-	now := time.Now().Format(time.RFC3339)
+	now := NowRFC3339()
 	if c.Kind == "" {
 		c.Kind = "unknown"
 	}
-	if c.Confidence < 0 {
-		c.Confidence = 0
-	}
-	if c.Confidence > 1 {
-		c.Confidence = 1
-	}
-	if c.Importance < 0 {
-		c.Importance = 0
-	}
-	if c.Importance > 1 {
-		c.Importance = 1
-	}
+	c.Confidence = clamp01(c.Confidence)
+	c.Importance = clamp01(c.Importance)
 	_, _ = db.Exec(
 		`INSERT INTO concepts(term, kind, summary, confidence, importance, updated_at)
          VALUES(?,?,?,?,?,?)
@@ -19,6 +19,8 @@ type CriticResult struct {
 	Notes    string
 }
 
+var selfDegradePatterns = []string{"ich bin nur", "als ki-assistent", "neutraler ki-assistent"}
+
 // Simple deterministic pre-check before calling LLM critic.
 func PrecheckOutgoing(req CriticRequest) CriticResult {
 	t := strings.TrimSpace(req.Text)
@@ -26,9 +28,8 @@ func PrecheckOutgoing(req CriticRequest) CriticResult {
 		return CriticResult{Approved: false, Text: "", Notes: "empty"}
 	}
 	// Ban obvious self-degrade patterns (kept minimal)
-	bad := []string{"ich bin nur", "als ki-assistent", "neutraler ki-assistent"}
 	lt := strings.ToLower(t)
-	for _, b := range bad {
+	for _, b := range selfDegradePatterns {
 		if strings.Contains(lt, b) {
 			// do not block, but mark not approved so LLM critic can rewrite
 			return CriticResult{Approved: false, Text: t, Notes: "self-degrade"}
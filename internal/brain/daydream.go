@@ -71,7 +71,7 @@ func LogThought(db *sql.DB, kind, topic string, salience float64, content string
 	_, _ = db.Exec(
 		`INSERT INTO thought_log(created_at, kind, topic, salience, content)
          VALUES(?,?,?,?,?)`,
-		time.Now().Format(time.RFC3339),
+		NowRFC3339(),
 		kind, topic, salience, content,
 	)
 }
@@ -34,7 +34,9 @@ func BuildDialogContext(db *sql.DB, limit int) string {
 	}
 	defer rows.Close()
 
-	var rev []Turn
+	// SQL already hands us the newest `limit` rows; collect them into a buffer of
+	// exactly that size and walk it backwards below instead of re-slicing.
+	rev := make([]Turn, 0, limit)
 	for rows.Next() {
 		var k, t string
 		if err := rows.Scan(&k, &t); err != nil {
@@ -52,7 +52,7 @@ func saveDrive(db *sql.DB, k string, v float64) error {
 	_, err := db.Exec(
 		`INSERT INTO drive_state(key,value,updated_at) VALUES(?,?,?)
          ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=excluded.updated_at`,
-		k, v, time.Now().Format(time.RFC3339),
+		k, v, NowRFC3339(),
 	)
 	return err
 }
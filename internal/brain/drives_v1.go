@@ -4,6 +4,7 @@ import (
 	"database/sql"
 	"encoding/json"
 	"math"
+	"sync"
 	"time"
 
 	"frankenstein-v0/internal/epi"
@@ -77,7 +78,7 @@ func UpdateResources(db *sql.DB, path string, snap sensors.Snapshot, latencyEMAm
 	if db == nil {
 		return rm, nil
 	}
-	now := time.Now().Format(time.RFC3339)
+	now := NowRFC3339()
 	rid := "disk:" + path
 	metrics, _ := json.Marshal(rm)
 	_, _ = db.Exec(`INSERT INTO resources(id,kind,present,metrics_json,constraints_json,updated_at) VALUES(?,?,?,?,?,?) ON CONFLICT(id) DO UPDATE SET present=excluded.present, metrics_json=excluded.metrics_json, updated_at=excluded.updated_at`, rid, "capacity", 1, string(metrics), "{}", now)
@@ -86,16 +87,6 @@ func UpdateResources(db *sql.DB, path string, snap sensors.Snapshot, latencyEMAm
 	return rm, nil
 }
 
-func lastUserMessageAt(db *sql.DB) time.Time {
-	if db == nil {
-		return time.Time{}
-	}
-	var ts string
-	_ = db.QueryRow(`SELECT m.created_at FROM messages m JOIN message_meta mm ON mm.message_id=m.id WHERE mm.kind='user' ORDER BY m.id DESC LIMIT 1`).Scan(&ts)
-	t, _ := time.Parse(time.RFC3339, ts)
-	return t
-}
-
 func computeUserRewardEMA(db *sql.DB, alpha float64) (reward float64, caught float64) {
 	if db == nil {
 		return 0, 0
@@ -103,53 +94,65 @@ func computeUserRewardEMA(db *sql.DB, alpha float64) (reward float64, caught flo
 	if alpha <= 0 || alpha > 1 {
 		alpha = 0.12
 	}
-	rows, err := db.Query(`SELECT value FROM ratings ORDER BY created_at DESC LIMIT 50`)
-	if err == nil {
-		defer rows.Close()
-		ema := 0.0
-		init := false
-		for rows.Next() {
-			var v int
-			_ = rows.Scan(&v)
-			x := float64(v)
-			if x > 1 {
-				x = 1
-			}
-			if x < -1 {
-				x = -1
-			}
-			if !init {
-				ema = x
-				init = true
-			} else {
-				ema = (1-alpha)*ema + alpha*x
-			}
-		}
-		reward = ema
-	}
+	reward = userRatingEMA(db, alpha)
 	var n int
 	_ = db.QueryRow(
 		`SELECT COUNT(*) FROM caught_events WHERE created_at >= ?`,
 		time.Now().Add(-60*time.Minute).Format(time.RFC3339),
 	).Scan(&n)
-	caught = 1.0 - math.Exp(-0.5*float64(n))
-	if caught < 0 {
-		caught = 0
+	caught = clamp01(1.0 - math.Exp(-0.5*float64(n)))
+	return reward, caught
+}
+
+// ratings are append-only, so the EMA over the last 50 only changes when a new
+// rating arrives; the heartbeat asks every tick.
+var ratingEMACache struct {
+	sync.Mutex
+	db     *sql.DB
+	lastID int64
+	alpha  float64
+	ema    float64
+}
+
+func userRatingEMA(db *sql.DB, alpha float64) float64 {
+	var lastID int64
+	if db.QueryRow(`SELECT COALESCE(MAX(id),0) FROM ratings`).Scan(&lastID) != nil {
+		return 0
 	}
-	if caught > 1 {
-		caught = 1
+	c := &ratingEMACache
+	c.Lock()
+	defer c.Unlock()
+	if c.db == db && c.lastID == lastID && c.alpha == alpha {
+		return c.ema
 	}
-	return reward, caught
+	rows, err := db.Query(`SELECT value FROM ratings ORDER BY created_at DESC LIMIT 50`)
+	if err != nil {
+		return 0
+	}
+	defer rows.Close()
+	ema := 0.0
+	init := false
+	for rows.Next() {
+		var v int
+		_ = rows.Scan(&v)
+		x := clamp11(float64(v))
+		if !init {
+			ema = x
+			init = true
+		} else {
+			ema = (1-alpha)*ema + alpha*x
+		}
+	}
+	c.db, c.lastID, c.alpha, c.ema = db, lastID, alpha, ema
+	return ema
 }
 
-func TickDrivesV1(db *sql.DB, eg *epi.Epigenome, d *DrivesV1, ws *Workspace, aff *AffectState, snap sensors.Snapshot, latencyEMAms float64, activeTopic string, conceptConf float64, stanceConf float64) {
+// TickDrivesV1 takes the drives_v1 params the caller already read from the epigenome
+// for this tick (eg.DrivesV1()), so the module's parameter map is decoded once per tick.
+func TickDrivesV1(db *sql.DB, p epi.DrivesV1Params, d *DrivesV1, ws *Workspace, aff *AffectState, snap sensors.Snapshot, latencyEMAms float64, activeTopic string, conceptConf float64, stanceConf float64) {
 	_ = ws
 	_ = activeTopic
-	if eg == nil || d == nil || aff == nil {
-		return
-	}
-	p := eg.DrivesV1()
-	if !p.Enabled {
+	if !p.Enabled || d == nil || aff == nil {
 		return
 	}
 	rm, _ := UpdateResources(db, p.DiskPath, snap, latencyEMAms)
@@ -169,18 +172,12 @@ func TickDrivesV1(db *sql.DB, eg *epi.Epigenome, d *DrivesV1, ws *Workspace, aff
 	aff.Ensure("anxiety", 0.0)
 	pain := aff.Get("pain")
 	anx := aff.Get("anxiety")
-	kgap := 1.0 - math.Max(conceptConf, stanceConf)
-	if kgap < 0 {
-		kgap = 0
-	}
-	if kgap > 1 {
-		kgap = 1
-	}
+	kgap := clamp01(1.0 - math.Max(conceptConf, stanceConf))
 	pain = clamp01(pain + 0.10*(d.Survival*d.Survival) - 0.015)
 	anx = clamp01(anx + 0.06*(d.Survival*(0.5+0.5*kgap)) - 0.012)
 	aff.Set("pain", pain)
 	aff.Set("anxiety", anx)
-	lastU := lastUserMessageAt(db)
+	lastU := LastUserMessageAt(db)
 	if lastU.IsZero() {
 		lastU = time.Now().Add(-24 * time.Hour)
 	}
@@ -4,7 +4,6 @@ import (
 	"database/sql"
 	"strconv"
 	"strings"
-	"time"
 )
 
 type EpigenomeProposal struct {
@@ -29,7 +28,7 @@ func InsertEpigenomeProposal(db *sql.DB, title, patchJSON, notes string) (int64,
 	if patchJSON == "" {
 		return 0, nil
 	}
-	now := time.Now().Format(time.RFC3339)
+	now := NowRFC3339()
 	res, err := db.Exec(`INSERT INTO epigenome_proposals(created_at,title,patch_json,status,notes) VALUES(?,?,?,?,?)`,
 		now, title, patchJSON, "proposed", notes)
 	if err != nil {
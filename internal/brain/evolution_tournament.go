@@ -117,19 +117,19 @@ func loadEvolutionMetrics(db *sql.DB, from, to time.Time) evolutionMetrics {
 	var sourceN, factN int
 	_ = db.QueryRow(`SELECT COUNT(*) FROM sources WHERE fetched_at BETWEEN ? AND ?`, from.Format(time.RFC3339), to.Format(time.RFC3339)).Scan(&sourceN)
 	_ = db.QueryRow(`SELECT COUNT(*) FROM facts WHERE updated_at BETWEEN ? AND ?`, from.Format(time.RFC3339), to.Format(time.RFC3339)).Scan(&factN)
-	m.Evidence = evClamp01(float64(sourceN)/40.0 + float64(factN)/30.0)
+	m.Evidence = clamp01(float64(sourceN)/40.0 + float64(factN)/30.0)
 	var webN, msgN int
 	_ = db.QueryRow(`SELECT COUNT(*) FROM events WHERE channel='web' AND created_at BETWEEN ? AND ?`, from.Format(time.RFC3339), to.Format(time.RFC3339)).Scan(&webN)
 	_ = db.QueryRow(`SELECT COUNT(*) FROM messages WHERE created_at BETWEEN ? AND ?`, from.Format(time.RFC3339), to.Format(time.RFC3339)).Scan(&msgN)
-	m.Cost = evClamp01(float64(webN)/45.0 + float64(msgN)/350.0)
+	m.Cost = clamp01(float64(webN)/45.0 + float64(msgN)/350.0)
 	var caught int
 	_ = db.QueryRow(`SELECT COUNT(*) FROM caught_events WHERE created_at BETWEEN ? AND ?`, from.Format(time.RFC3339), to.Format(time.RFC3339)).Scan(&caught)
-	m.Spam = evClamp01(float64(caught) / 12.0)
+	m.Spam = clamp01(float64(caught) / 12.0)
 	var autoDown int
 	_ = db.QueryRow(`SELECT COUNT(*)
 		FROM ratings r JOIN message_meta mm ON mm.message_id=r.message_id
 		WHERE mm.kind='auto' AND r.value<0 AND r.created_at BETWEEN ? AND ?`, from.Format(time.RFC3339), to.Format(time.RFC3339)).Scan(&autoDown)
-	m.Coherence = evClamp01((1.0-m.Spam)*0.7 + evClamp01(1.0-float64(autoDown)/8.0)*0.3)
+	m.Coherence = clamp01((1.0-m.Spam)*0.7 + clamp01(1.0-float64(autoDown)/8.0)*0.3)
 	return m
 }
 
@@ -140,9 +140,9 @@ func buildEvolutionCandidates(eg *epi.Epigenome, p EvolutionParams, base evoluti
 		cand := evolutionCandidate{Index: i + 1}
 		cand.Title = fmt.Sprintf("evolution.candidate.%02d", cand.Index)
 
-		minTalk := evClamp01(egFloat(eg, "autonomy", "min_talk_drive", 0.55) + 0.08*drift)
-		scoutMin := evClamp01(egFloat(eg, "scout", "min_curiosity", 0.55) + 0.10*drift)
-		friction := evClamp01(egFloat(eg, "proposal_engine", "friction_threshold", 0.55) - 0.08*drift)
+		minTalk := clamp01(egFloat(eg, "autonomy", "min_talk_drive", 0.55) + 0.08*drift)
+		scoutMin := clamp01(egFloat(eg, "scout", "min_curiosity", 0.55) + 0.10*drift)
+		friction := clamp01(egFloat(eg, "proposal_engine", "friction_threshold", 0.55) - 0.08*drift)
 		daydreamSec := clampFloor(egFloat(eg, "daydream", "interval_seconds", 20)+6.0*drift, 8)
 
 		cand.Patch = map[string]any{"modules": map[string]any{
@@ -152,11 +152,11 @@ func buildEvolutionCandidates(eg *epi.Epigenome, p EvolutionParams, base evoluti
 			"daydream":        map[string]any{"params": map[string]any{"interval_seconds": int(daydreamSec)}},
 		}}
 
-		cand.UserReward = evClamp01((base.UserReward+1.0)/2.0 + 0.10*(0.5-math.Abs(drift)))
-		cand.Evidence = evClamp01(base.Evidence + 0.12*max0(drift))
-		cand.Cost = evClamp01(base.Cost + 0.18*max0(-drift))
-		cand.Spam = evClamp01(base.Spam + 0.15*max0(-drift))
-		cand.Coherence = evClamp01(base.Coherence + 0.09*(0.5-math.Abs(drift)))
+		cand.UserReward = clamp01((base.UserReward+1.0)/2.0 + 0.10*(0.5-math.Abs(drift)))
+		cand.Evidence = clamp01(base.Evidence + 0.12*max0(drift))
+		cand.Cost = clamp01(base.Cost + 0.18*max0(-drift))
+		cand.Spam = clamp01(base.Spam + 0.15*max0(-drift))
+		cand.Coherence = clamp01(base.Coherence + 0.09*(0.5-math.Abs(drift)))
 		cand.Fitness = p.Alpha*cand.UserReward + p.Beta*cand.Evidence - p.Gamma*cand.Cost - p.Delta*cand.Spam + p.Epsilon*cand.Coherence
 		out = append(out, cand)
 	}
@@ -201,16 +201,6 @@ func egFloat(eg *epi.Epigenome, module, key string, def float64) float64 {
 	return floatFromAny(m.Params[key], def)
 }
 
-func evClamp01(v float64) float64 {
-	if v < 0 {
-		return 0
-	}
-	if v > 1 {
-		return 1
-	}
-	return v
-}
-
 func clampFloor(v float64, min float64) float64 {
 	if v < min {
 		return min
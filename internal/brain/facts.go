@@ -3,7 +3,6 @@ package brain
 import (
 	"database/sql"
 	"strings"
-	"time"
 )
 
 type Fact struct {
@@ -38,7 +37,7 @@ func UpsertFact(db *sql.DB, f Fact) {
 	if f.Source == "" {
 		f.Source = "user"
 	}
-	now := time.Now().Format(time.RFC3339)
+	now := NowRFC3339()
 	_, _ = db.Exec(`INSERT INTO facts(subject,predicate,object,confidence,salience,half_life_days,source,created_at,updated_at)
 		 VALUES(?,?,?,?,?,?,?,?,?)
 		 ON CONFLICT(subject,predicate) DO UPDATE SET object=excluded.object, confidence=excluded.confidence, salience=excluded.salience, half_life_days=excluded.half_life_days, source=excluded.source, updated_at=excluded.updated_at`,
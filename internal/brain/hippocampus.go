@@ -3,7 +3,6 @@ package brain
 import (
 	"database/sql"
 	"strings"
-	"time"
 )
 
 type ConsolidateRequest struct {
@@ -81,6 +80,6 @@ func SaveEpisode(db *sql.DB, topic string, start, end int64, summary string) {
 	_, _ = db.Exec(
 		`INSERT INTO episodes(created_at, topic, start_event_id, end_event_id, summary, salience)
          VALUES(?,?,?,?,?,?)`,
-		time.Now().Format(time.RFC3339), topic, start, end, summary, 0.65,
+		NowRFC3339(), topic, start, end, summary, 0.65,
 	)
 }
@@ -5,7 +5,6 @@ import (
 	"math"
 	"strconv"
 	"strings"
-	"time"
 	"unicode"
 
 	"frankenstein-v0/internal/epi"
@@ -63,7 +62,7 @@ func setKVInt64(db *sql.DB, key string, n int64) {
 	_, _ = db.Exec(
 		`INSERT INTO kv_state(key,value,updated_at) VALUES(?,?,?)
          ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=excluded.updated_at`,
-		key, strconv.FormatInt(n, 10), time.Now().Format(time.RFC3339),
+		key, strconv.FormatInt(n, 10), NowRFC3339(),
 	)
 }
 
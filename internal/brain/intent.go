@@ -1,7 +1,6 @@
 package brain
 
 import (
-	"regexp"
 	"strings"
 
 	"frankenstein-v0/internal/epi"
@@ -70,11 +69,7 @@ func matchRule(t string, r epi.IntentRule) bool {
 		}
 	}
 	for _, pat := range r.Regex {
-		re, err := regexp.Compile(pat)
-		if err != nil {
-			continue
-		}
-		if re.MatchString(t) {
+		if re := ruleRegexp(pat); re != nil && re.MatchString(t) {
 			return true
 		}
 	}
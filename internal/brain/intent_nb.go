@@ -4,7 +4,6 @@ import (
 	"database/sql"
 	"math"
 	"strings"
-	"time"
 	"unicode"
 
 	"frankenstein-v0/internal/epi"
@@ -233,7 +232,7 @@ func SaveReplyContext(db *sql.DB, messageID int64, userText string, intent strin
 		`INSERT INTO reply_context(message_id,user_text,intent,created_at)
          VALUES(?,?,?,?)
          ON CONFLICT(message_id) DO UPDATE SET user_text=excluded.user_text, intent=excluded.intent`,
-		messageID, userText, strings.ToUpper(strings.TrimSpace(intent)), time.Now().Format(time.RFC3339),
+		messageID, userText, strings.ToUpper(strings.TrimSpace(intent)), NowRFC3339(),
 	)
 }
 
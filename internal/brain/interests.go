@@ -2,7 +2,6 @@ package brain
 
 import (
 	"database/sql"
-	"time"
 )
 
 func BumpInterest(db *sql.DB, topic string, delta float64) {
@@ -20,7 +19,7 @@ func BumpInterest(db *sql.DB, topic string, delta float64) {
          ON CONFLICT(topic) DO UPDATE SET
            weight = MAX(0.0, interests.weight + excluded.weight),
            updated_at = excluded.updated_at`,
-		topic, delta, time.Now().Format(time.RFC3339),
+		topic, delta, NowRFC3339(),
 	)
 }
 
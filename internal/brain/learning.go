@@ -2,7 +2,6 @@ package brain
 
 import (
 	"database/sql"
-	"time"
 
 	"frankenstein-v0/internal/epi"
 )
@@ -16,6 +15,14 @@ type Traits struct {
 	ResearchBias  float64 // 0..1, how eager to use senses when uncertain
 }
 
+// SelfModelTraits lets epi.BuildSelfModel read these fields without a JSON round trip.
+func (t *Traits) SelfModelTraits() (float64, float64) {
+	if t == nil {
+		return 0, 0
+	}
+	return t.BluffRate, t.HonestyBias
+}
+
 func LoadOrInitTraits(db *sql.DB) (*Traits, error) {
 	tr := &Traits{
 		BluffRate:     0.08,
@@ -149,7 +156,7 @@ func saveTrait(db *sql.DB, k string, v float64) error {
 	_, err := db.Exec(
 		`INSERT INTO traits(key,value,updated_at) VALUES(?,?,?)
          ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=excluded.updated_at`,
-		k, v, time.Now().Format(time.RFC3339),
+		k, v, NowRFC3339(),
 	)
 	return err
 }
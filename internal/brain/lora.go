@@ -9,7 +9,6 @@ import (
 	"os/exec"
 	"path/filepath"
 	"strings"
-	"time"
 )
 
 // LoRASample is a pairwise preference sample (chosen vs rejected) for LoRA/DPO training.
@@ -46,7 +45,7 @@ func InsertLoRASample(db *sql.DB, prompt, chosen, rejected, metaJSON string) {
 		return
 	}
 	_, _ = db.Exec(`INSERT INTO lora_samples(created_at,prompt,chosen,rejected,meta_json) VALUES(?,?,?,?,?)`,
-		time.Now().Format(time.RFC3339), prompt, chosen, rejected, metaJSON)
+		NowRFC3339(), prompt, chosen, rejected, metaJSON)
 }
 
 // InsertLoRASampleFromTrainTrial stores a preference sample from a train_trials choice (A vs B).
@@ -169,7 +168,7 @@ func QueueLoRAJob(db *sql.DB, baseModel string, datasetPath string, outDir strin
 	if err := os.MkdirAll(outDir, 0o755); err != nil {
 		return 0, err
 	}
-	now := time.Now().Format(time.RFC3339)
+	now := NowRFC3339()
 	res, err := db.Exec(`INSERT INTO lora_jobs(created_at,status,base_model,dataset_path,out_dir,notes,updated_at) VALUES(?,?,?,?,?,?,?)`,
 		now, "queued", baseModel, datasetPath, outDir, strings.TrimSpace(notes), now)
 	if err != nil {
@@ -229,7 +228,7 @@ func RunLoRAJob(db *sql.DB, jobID int64) (string, error) {
 	cmdLine = strings.ReplaceAll(cmdLine, "{dataset}", dataset)
 	cmdLine = strings.ReplaceAll(cmdLine, "{out}", out)
 
-	now := time.Now().Format(time.RFC3339)
+	now := NowRFC3339()
 	_, _ = db.Exec(`UPDATE lora_jobs SET status=?, updated_at=? WHERE id=?`, "running", now, jobID)
 
 	c := exec.Command("bash", "-lc", cmdLine)
@@ -241,7 +240,7 @@ func RunLoRAJob(db *sql.DB, jobID int64) (string, error) {
 		status = "error"
 		log = log + "\nERR: " + runErr.Error()
 	}
-	_, _ = db.Exec(`UPDATE lora_jobs SET status=?, updated_at=?, notes=? WHERE id=?`, status, time.Now().Format(time.RFC3339), clipForContext(j.Notes+"\n"+log, 4000), jobID)
+	_, _ = db.Exec(`UPDATE lora_jobs SET status=?, updated_at=?, notes=? WHERE id=?`, status, NowRFC3339(), clipForContext(j.Notes+"\n"+log, 4000), jobID)
 	return log, runErr
 }
 
@@ -24,12 +24,7 @@ func InsertEvent(db *sql.DB, channel, topic, text string, messageID int64, salie
 	if text == "" {
 		return
 	}
-	if salience < 0 {
-		salience = 0
-	}
-	if salience > 1 {
-		salience = 1
-	}
+	salience = clamp01(salience)
 	var mid any = nil
 	if messageID > 0 {
 		mid = messageID
@@ -37,13 +32,25 @@ func InsertEvent(db *sql.DB, channel, topic, text string, messageID int64, salie
 	_, _ = db.Exec(
 		`INSERT INTO events(created_at, channel, topic, text, message_id, salience)
          VALUES(?,?,?,?,?,?)`,
-		time.Now().Format(time.RFC3339), channel, topic, text, mid, salience,
+		NowRFC3339(), channel, topic, text, mid, salience,
 	)
 }
 
+// MemoryItem is one detail memory for InsertMemoryItems.
+type MemoryItem struct {
+	Key      string
+	Value    string
+	Salience float64
+}
+
 // InsertMemoryItem stores a detail memory with decay parameters.
 func InsertMemoryItem(db *sql.DB, channel, topic, key, value string, salience float64, halfLifeDays float64) {
-	if db == nil {
+	InsertMemoryItems(db, channel, topic, halfLifeDays, MemoryItem{Key: key, Value: value, Salience: salience})
+}
+
+// InsertMemoryItems stores several detail memories of one channel/topic in a single transaction.
+func InsertMemoryItems(db *sql.DB, channel, topic string, halfLifeDays float64, items ...MemoryItem) {
+	if db == nil || len(items) == 0 {
 		return
 	}
 	channel = strings.TrimSpace(channel)
@@ -51,25 +58,35 @@ func InsertMemoryItem(db *sql.DB, channel, topic, key, value string, salience fl
 		channel = "unknown"
 	}
 	topic = strings.TrimSpace(topic)
-	key = strings.TrimSpace(key)
-	value = strings.TrimSpace(value)
-	if key == "" || value == "" {
-		return
+	if halfLifeDays <= 0 {
+		halfLifeDays = 14.0
 	}
-	if salience < 0 {
-		salience = 0
+	now := NowRFC3339()
+	var tx *sql.Tx
+	if len(items) > 1 {
+		var err error
+		if tx, err = db.Begin(); err != nil {
+			return
+		}
+		defer tx.Rollback()
 	}
-	if salience > 1 {
-		salience = 1
+	for _, it := range items {
+		key := strings.TrimSpace(it.Key)
+		value := strings.TrimSpace(it.Value)
+		if key == "" || value == "" {
+			continue
+		}
+		const q = `INSERT INTO memory_items(created_at, channel, topic, key, value, salience, half_life_days)
+         VALUES(?,?,?,?,?,?,?)`
+		if tx != nil {
+			_, _ = tx.Exec(q, now, channel, topic, key, value, clamp01(it.Salience), halfLifeDays)
+		} else {
+			_, _ = db.Exec(q, now, channel, topic, key, value, clamp01(it.Salience), halfLifeDays)
+		}
 	}
-	if halfLifeDays <= 0 {
-		halfLifeDays = 14.0
+	if tx != nil {
+		_ = tx.Commit()
 	}
-	_, _ = db.Exec(
-		`INSERT INTO memory_items(created_at, channel, topic, key, value, salience, half_life_days)
-         VALUES(?,?,?,?,?,?,?)`,
-		time.Now().Format(time.RFC3339), channel, topic, key, value, salience, halfLifeDays,
-	)
 }
 
 // GetLastEpisode returns newest episode summary for active topic (gist).
@@ -93,7 +110,8 @@ func RecentTurns(db *sql.DB, n int) string {
 type scoredItem struct {
 	id    int64
 	score float64
-	text  string
+	key   string
+	value string
 }
 
 // RecallDetails returns top K memory items by salience * time-decay.
@@ -114,12 +132,12 @@ func RecallDetails(db *sql.DB, topic string, k int) string {
 	}
 	defer rows.Close()
 	now := time.Now()
-	var items []scoredItem
+	items := make([]scoredItem, 0, 200)
 	for rows.Next() {
-		var id int64
-		var createdAt, key, value string
+		var it scoredItem
+		var createdAt string
 		var sal, half float64
-		if err := rows.Scan(&id, &createdAt, &key, &value, &sal, &half); err != nil {
+		if err := rows.Scan(&it.id, &createdAt, &it.key, &it.value, &sal, &half); err != nil {
 			continue
 		}
 		ts, _ := time.Parse(time.RFC3339, createdAt)
@@ -127,10 +145,8 @@ func RecallDetails(db *sql.DB, topic string, k int) string {
 		if half <= 0 {
 			half = 14.0
 		}
-		decay := math.Pow(0.5, ageDays/half)
-		score := clamp01(sal) * decay
-		txt := key + ": " + clipForContext(value, 220)
-		items = append(items, scoredItem{id: id, score: score, text: txt})
+		it.score = clamp01(sal) * math.Pow(0.5, ageDays/half)
+		items = append(items, it)
 	}
 	sort.Slice(items, func(i, j int) bool { return items[i].score > items[j].score })
 	if len(items) > k {
@@ -139,13 +155,17 @@ func RecallDetails(db *sql.DB, topic string, k int) string {
 	if len(items) == 0 {
 		return ""
 	}
+	// Only the selected items are clipped/rendered, and their access time is bumped in one statement.
 	var b strings.Builder
+	args := make([]any, 0, len(items)+1)
+	args = append(args, now.Format(time.RFC3339))
 	for _, it := range items {
 		b.WriteString("- ")
-		b.WriteString(it.text)
+		b.WriteString(it.key + ": " + clipForContext(it.value, 220))
 		b.WriteString("\n")
-		_, _ = db.Exec(`UPDATE memory_items SET last_accessed_at=? WHERE id=?`, now.Format(time.RFC3339), it.id)
+		args = append(args, it.id)
 	}
+	_, _ = db.Exec(`UPDATE memory_items SET last_accessed_at=? WHERE id IN (?`+strings.Repeat(",?", len(items)-1)+`)`, args...)
 	return strings.TrimSpace(b.String())
 }
 
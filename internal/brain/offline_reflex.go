@@ -1,7 +1,6 @@
 package brain
 
 import (
-	"regexp"
 	"strconv"
 	"strings"
 
@@ -38,11 +37,7 @@ func matchOfflineRule(t string, r epi.OfflineReflexRule) bool {
 		}
 	}
 	for _, pat := range r.Regex {
-		re, err := regexp.Compile(pat)
-		if err != nil {
-			continue
-		}
-		if re.MatchString(t) {
+		if re := ruleRegexp(pat); re != nil && re.MatchString(t) {
 			return true
 		}
 	}
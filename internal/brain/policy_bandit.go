@@ -5,7 +5,6 @@ import (
 	"math"
 	"math/rand"
 	"strings"
-	"time"
 )
 
 var DefaultPolicyActions = []string{
@@ -77,14 +76,49 @@ func sampleGamma(k float64) float64 {
 	}
 }
 
-func ensureStat(db *sql.DB, ctx, action string) (a, b float64) {
-	a, b = 1.0, 1.0
-	_ = db.QueryRow(`SELECT alpha,beta FROM policy_stats WHERE context_key=? AND action=?`, ctx, action).Scan(&a, &b)
-	if a == 0 && b == 0 {
-		_, _ = db.Exec(`INSERT OR IGNORE INTO policy_stats(context_key,action,alpha,beta,updated_at) VALUES(?,?,?,?,?)`,
-			ctx, action, 1.0, 1.0, time.Now().Format(time.RFC3339))
-		a, b = 1.0, 1.0
+type betaStat struct{ a, b float64 }
+
+// loadPolicyStats reads all action stats of a context in one query.
+// Missing rows fall back to the Beta(1,1) prior; values are floored at 0.1.
+func loadPolicyStats(db *sql.DB, ctx string) map[string]betaStat {
+	out := make(map[string]betaStat, len(DefaultPolicyActions))
+	if db == nil {
+		return out
+	}
+	rows, err := db.Query(`SELECT action,alpha,beta FROM policy_stats WHERE context_key=?`, ctx)
+	if err != nil {
+		return out
+	}
+	defer rows.Close()
+	for rows.Next() {
+		var act string
+		var st betaStat
+		if rows.Scan(&act, &st.a, &st.b) != nil {
+			continue
+		}
+		if st.a == 0 && st.b == 0 {
+			st = betaStat{1, 1}
+		}
+		out[act] = st
 	}
+	return out
+}
+
+// PolicyAlphaBeta returns the (floored) Beta parameters of one context/action pair.
+func PolicyAlphaBeta(db *sql.DB, ctx, action string) (float64, float64) {
+	if db == nil || strings.TrimSpace(ctx) == "" || strings.TrimSpace(action) == "" {
+		return 1.0, 1.0
+	}
+	st := betaStat{1, 1}
+	_ = db.QueryRow(`SELECT alpha,beta FROM policy_stats WHERE context_key=? AND action=?`, ctx, action).Scan(&st.a, &st.b)
+	if st.a == 0 && st.b == 0 {
+		st = betaStat{1, 1}
+	}
+	return st.floored()
+}
+
+func (st betaStat) floored() (a, b float64) {
+	a, b = st.a, st.b
 	if a < 0.1 {
 		a = 0.1
 	}
@@ -95,15 +129,30 @@ func ensureStat(db *sql.DB, ctx, action string) (a, b float64) {
 }
 
 func ChoosePolicy(db *sql.DB, ctx string) PolicyChoice {
-	rand.Seed(time.Now().UnixNano())
+	// No rand.Seed here: the global source is seeded at startup (Go >= 1.20), and
+	// reseeding on every choice took the global lock and reset the generator state.
+	styles := []string{"direct", "warm", "concise"}
+	stats := loadPolicyStats(db, ctx)
+	keys := make([]string, 0, len(DefaultPolicyActions)+len(styles))
+	for _, act := range DefaultPolicyActions {
+		keys = append(keys, "strat:"+act)
+	}
+	for _, st := range styles {
+		keys = append(keys, "style:"+st)
+	}
+	prefs := GetPreferences(db, keys)
+
 	bestA := ""
 	bestS := -1.0
 	for _, act := range DefaultPolicyActions {
-		a, b := ensureStat(db, ctx, act)
-		s := sampleBeta(a, b)
+		st, ok := stats[act]
+		if !ok {
+			st = betaStat{1, 1}
+		}
+		s := sampleBeta(st.floored())
 		// "Synapse" bias: learned strategy preference in [-1..1].
 		// We bias gently to preserve exploration.
-		p := GetPreference(db, "strat:"+act, 0)
+		p := prefs["strat:"+act]
 		s = clamp01(s + 0.12*p)
 		if s > bestS {
 			bestS = s
@@ -126,7 +175,6 @@ func ChoosePolicy(db *sql.DB, ctx string) PolicyChoice {
 	if strings.Contains(ctx, "sv_hi") {
 		baseStyle = "concise"
 	}
-	styles := []string{"direct", "warm", "concise"}
 	bestStyle := baseStyle
 	bestStyleScore := 0.5
 	for _, st := range styles {
@@ -134,7 +182,7 @@ func ChoosePolicy(db *sql.DB, ctx string) PolicyChoice {
 		if st == baseStyle {
 			score = 0.5
 		}
-		score += 0.20 * GetPreference(db, "style:"+st, 0)
+		score += 0.20 * prefs["style:"+st]
 		if score > bestStyleScore {
 			bestStyleScore = score
 			bestStyle = st
@@ -144,20 +192,57 @@ func ChoosePolicy(db *sql.DB, ctx string) PolicyChoice {
 	return PolicyChoice{ContextKey: ctx, Action: bestA, Style: style}
 }
 
+// policyUpsertSQL applies a reward increment in place; missing rows start from the Beta(1,1) prior,
+// existing values keep the 0.1 floor used when sampling.
+const policyUpsertSQL = `INSERT INTO policy_stats(context_key,action,alpha,beta,updated_at) VALUES(?,?,?,?,?)
+	ON CONFLICT(context_key,action) DO UPDATE SET
+		alpha=MAX(policy_stats.alpha,0.1)+?,
+		beta=MAX(policy_stats.beta,0.1)+?,
+		updated_at=excluded.updated_at`
+
+// PolicyUpdate is one (action, reward) observation for UpdatePolicyBatch.
+type PolicyUpdate struct {
+	Action   string
+	Reward01 float64
+}
+
+func policyUpsertArgs(ctx, action string, reward01 float64, now string) []any {
+	reward01 = clamp01(reward01)
+	return []any{ctx, action, 1.0 + reward01, 1.0 + (1.0 - reward01), now, reward01, 1.0 - reward01}
+}
+
 func UpdatePolicy(db *sql.DB, ctx, action string, reward01 float64) {
 	if db == nil || ctx == "" || action == "" {
 		return
 	}
-	if reward01 < 0 {
-		reward01 = 0
+	// Single upsert: the increment is applied in SQL, so no prior read of the row is needed.
+	_, _ = db.Exec(policyUpsertSQL, policyUpsertArgs(ctx, action, reward01, NowRFC3339())...)
+}
+
+// UpdatePolicyBatch applies several updates for one context in a single transaction
+// (one prepared statement, one commit) instead of one autocommit write per action.
+func UpdatePolicyBatch(db *sql.DB, ctx string, updates []PolicyUpdate) {
+	if db == nil || ctx == "" || len(updates) == 0 {
+		return
+	}
+	tx, err := db.Begin()
+	if err != nil {
+		return
+	}
+	defer tx.Rollback()
+	stmt, err := tx.Prepare(policyUpsertSQL)
+	if err != nil {
+		return
 	}
-	if reward01 > 1 {
-		reward01 = 1
+	defer stmt.Close()
+	now := NowRFC3339()
+	for _, u := range updates {
+		if u.Action == "" {
+			continue
+		}
+		if _, err := stmt.Exec(policyUpsertArgs(ctx, u.Action, u.Reward01, now)...); err != nil {
+			return
+		}
 	}
-	a, b := ensureStat(db, ctx, action)
-	a += reward01
-	b += (1.0 - reward01)
-	_, _ = db.Exec(`INSERT INTO policy_stats(context_key,action,alpha,beta,updated_at) VALUES(?,?,?,?,?)
-		ON CONFLICT(context_key,action) DO UPDATE SET alpha=excluded.alpha, beta=excluded.beta, updated_at=excluded.updated_at`,
-		ctx, action, a, b, time.Now().Format(time.RFC3339))
+	_ = tx.Commit()
 }
@@ -2,7 +2,7 @@ package brain
 
 import (
 	"database/sql"
-	"time"
+	"strings"
 )
 
 // GetPreference returns a preference value in [-1..1].
@@ -19,14 +19,35 @@ func GetPreference(db *sql.DB, key string, def float64) float64 {
 	return clamp11(cur.Float64)
 }
 
-// GetPreference01 maps a preference in [-1..1] to [0..1].
-func GetPreference01(db *sql.DB, key string, def01 float64) float64 {
-	if def01 < 0 {
-		def01 = 0
+// GetPreferences reads several keys in one query. Missing keys are absent from the map
+// (callers index it and get 0, the neutral preference).
+func GetPreferences(db *sql.DB, keys []string) map[string]float64 {
+	out := make(map[string]float64, len(keys))
+	if db == nil || len(keys) == 0 {
+		return out
+	}
+	args := make([]any, len(keys))
+	for i, k := range keys {
+		args[i] = k
+	}
+	rows, err := db.Query(`SELECT key,value FROM preferences WHERE key IN (?`+strings.Repeat(",?", len(keys)-1)+`)`, args...)
+	if err != nil {
+		return out
 	}
-	if def01 > 1 {
-		def01 = 1
+	defer rows.Close()
+	for rows.Next() {
+		var k string
+		var v sql.NullFloat64
+		if rows.Scan(&k, &v) == nil && v.Valid {
+			out[k] = clamp11(v.Float64)
+		}
 	}
+	return out
+}
+
+// GetPreference01 maps a preference in [-1..1] to [0..1].
+func GetPreference01(db *sql.DB, key string, def01 float64) float64 {
+	def01 = clamp01(def01)
 	v := GetPreference(db, key, 2*def01-1)
 	return clamp01((v + 1) / 2)
 }
@@ -59,6 +80,6 @@ func UpdatePreferenceEMA(db *sql.DB, key string, reward float64, alpha float64)
 	_, _ = db.Exec(
 		`INSERT INTO preferences(key,value,updated_at) VALUES(?,?,?)
 		 ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=excluded.updated_at`,
-		key, next, time.Now().Format(time.RFC3339),
+		key, next, NowRFC3339(),
 	)
 }
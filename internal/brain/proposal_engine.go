@@ -74,7 +74,7 @@ func SaveThoughtProposal(db *sql.DB, idea ProposalIdea) (int64, error) {
 	if db == nil {
 		return 0, nil
 	}
-	now := time.Now().Format(time.RFC3339)
+	now := NowRFC3339()
 	payload := strings.TrimSpace(idea.Body)
 	if payload == "" {
 		payload = "{}"
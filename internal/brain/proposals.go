@@ -4,7 +4,6 @@ import (
 	"database/sql"
 	"strconv"
 	"strings"
-	"time"
 )
 
 type ProposalRow struct {
@@ -35,7 +34,7 @@ func InsertSchemaProposal(db *sql.DB, title, sqlText, notes string) (int64, erro
 	if sqlText == "" {
 		return 0, nil
 	}
-	now := time.Now().Format(time.RFC3339)
+	now := NowRFC3339()
 	res, err := db.Exec(`INSERT INTO schema_proposals(created_at,title,sql,status,notes) VALUES(?,?,?,?,?)`,
 		now, title, sqlText, "proposed", notes)
 	if err != nil {
@@ -57,7 +56,7 @@ func InsertCodeProposal(db *sql.DB, title, diffText, notes string) (int64, error
 	if diffText == "" {
 		return 0, nil
 	}
-	now := time.Now().Format(time.RFC3339)
+	now := NowRFC3339()
 	res, err := db.Exec(`INSERT INTO code_proposals(created_at,title,diff,status,notes) VALUES(?,?,?,?,?)`,
 		now, title, diffText, "proposed", notes)
 	if err != nil {
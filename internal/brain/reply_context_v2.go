@@ -3,7 +3,6 @@ package brain
 import (
 	"database/sql"
 	"strings"
-	"time"
 )
 
 func SaveReplyContextV2(db *sql.DB, messageID int64, userText, intentMode, policyCtx, action, style string) {
@@ -22,7 +21,7 @@ func SaveReplyContextV2(db *sql.DB, messageID int64, userText, intentMode, polic
 		`INSERT INTO reply_context_v2(message_id,user_text,intent,policy_ctx,action,style,created_at)
 		 VALUES(?,?,?,?,?,?,?)
 		 ON CONFLICT(message_id) DO UPDATE SET user_text=excluded.user_text, intent=excluded.intent, policy_ctx=excluded.policy_ctx, action=excluded.action, style=excluded.style`,
-		messageID, userText, intentMode, policyCtx, action, style, time.Now().Format(time.RFC3339),
+		messageID, userText, intentMode, policyCtx, action, style, NowRFC3339(),
 	)
 }
 
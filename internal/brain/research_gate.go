@@ -119,7 +119,6 @@ func isResearchLike(t string) bool {
 		strings.Contains(t, "nachsehen") ||
 		strings.Contains(t, "schau nach") ||
 		strings.Contains(t, "quelle") ||
-		strings.Contains(t, "quellen") ||
 		strings.Contains(t, "link") ||
 		strings.Contains(t, "url") ||
 		strings.Contains(t, "nachricht") ||
@@ -141,12 +140,14 @@ func isBareResearchCommand(t string) bool {
 	return false
 }
 
+// researchTLDs is a crude TLD hint (good enough for gating).
+var researchTLDs = []string{".de", ".com", ".org", ".net", ".io", ".eu"}
+
 func looksLikeURLOrDomain(t string) bool {
 	if strings.Contains(t, "http://") || strings.Contains(t, "https://") || strings.Contains(t, "www.") {
 		return true
 	}
-	// crude TLD hint (good enough for gating)
-	for _, tld := range []string{".de", ".com", ".org", ".net", ".io", ".eu"} {
+	for _, tld := range researchTLDs {
 		if strings.Contains(t, tld) {
 			return true
 		}
@@ -0,0 +1,24 @@
+package brain
+
+import "testing"
+
+func TestIsResearchLike(t *testing.T) {
+	for text, want := range map[string]bool{
+		"kannst du das bitte recherchieren":       true,
+		"schau mal auf example.org":               true,
+		"hast du eine quellenangabe dazu":         true,
+		"wie geht es dir heute, erzähl mal etwas": false,
+	} {
+		if got := isResearchLike(text); got != want {
+			t.Errorf("isResearchLike(%q) = %v, want %v", text, got, want)
+		}
+	}
+}
+
+// A typical turn matches none of the triggers, so every substring search runs to the end.
+func BenchmarkIsResearchLike_NoMatch(b *testing.B) {
+	text := "ich habe heute lange über unser gespräch von gestern nachgedacht und frage mich, wie du das siehst"
+	for i := 0; i < b.N; i++ {
+		isResearchLike(text)
+	}
+}
@@ -3,7 +3,6 @@ package brain
 import (
 	"database/sql"
 	"encoding/json"
-	"time"
 )
 
 type Candidate struct {
@@ -19,7 +18,7 @@ func EnsureDefaultCandidates(db *sql.DB) {
 	if db == nil {
 		return
 	}
-	now := time.Now().Format(time.RFC3339)
+	now := NowRFC3339()
 	def := []Candidate{
 		{ID: "expand:disk:add_path", Yields: []string{"disk:NEW_PATH"}, Prereq: []string{"user_action:add_storage_path"}, Cost: 0.35, Evidence: 0.35, Helps: map[string]float64{"survival": 0.7}},
 		{ID: "expand:disk:cleanup", Yields: []string{"disk:C:\\"}, Prereq: []string{"user_action:cleanup_disk"}, Cost: 0.20, Evidence: 0.55, Helps: map[string]float64{"survival": 0.8}},
@@ -58,5 +57,5 @@ func LogCandidate(db *sql.DB, id, outcome, note string) {
 	if db == nil {
 		return
 	}
-	_, _ = db.Exec(`INSERT INTO candidate_history(created_at,candidate_id,outcome,note) VALUES(?,?,?,?)`, time.Now().Format(time.RFC3339), id, outcome, note)
+	_, _ = db.Exec(`INSERT INTO candidate_history(created_at,candidate_id,outcome,note) VALUES(?,?,?,?)`, NowRFC3339(), id, outcome, note)
 }
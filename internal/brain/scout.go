@@ -23,7 +23,7 @@ func getKV(db *sql.DB, key string) string {
 func setKV(db *sql.DB, key, value string) {
 	_, _ = db.Exec(`INSERT INTO kv_state(key,value,updated_at) VALUES(?,?,?)
 		ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=excluded.updated_at`,
-		key, value, time.Now().Format(time.RFC3339))
+		key, value, NowRFC3339())
 }
 
 func MaybeQueueScout(db *sql.DB, eg *epi.Epigenome, ws *Workspace, dr *Drives) (bool, ScoutRequest) {
@@ -60,7 +60,7 @@ func MaybeQueueScout(db *sql.DB, eg *epi.Epigenome, ws *Workspace, dr *Drives) (
 	}
 
 	if c, ok := GetConcept(db, topic); !ok || c.Confidence < 0.55 {
-		setKV(db, key, time.Now().Format(time.RFC3339))
+		setKV(db, key, NowRFC3339())
 		setKV(db, hourKey, strconv.Itoa(cnt+1))
 		return true, ScoutRequest{Topic: topic, Query: topic}
 	}
@@ -105,7 +105,7 @@ func makeRollbackKey(ch SelfChange) string {
 }
 
 func insertSelfChangeLog(db *sql.DB, ch SelfChange, dec AxiomDecision, energyCost float64, rollbackKey string) {
-	now := time.Now().Format(time.RFC3339)
+	now := NowRFC3339()
 	allowed := 0
 	if dec.Allowed {
 		allowed = 1
@@ -2,7 +2,6 @@ package brain
 
 import (
 	"database/sql"
-	"regexp"
 	"strconv"
 	"strings"
 
@@ -32,8 +31,8 @@ func SemanticMemoryStep(db *sql.DB, eg *epi.Epigenome, userText string) (handled
 			break
 		}
 		reads++
-		re, err := regexp.Compile(r.Regex)
-		if err != nil || re.FindStringIndex(userText) == nil {
+		re := ruleRegexp(r.Regex)
+		if re == nil || re.FindStringIndex(userText) == nil {
 			continue
 		}
 		obj, ok := GetFact(db, r.Subject, r.Predicate)
@@ -56,8 +55,8 @@ func SemanticMemoryStep(db *sql.DB, eg *epi.Epigenome, userText string) (handled
 		if writes >= maxW {
 			break
 		}
-		re, err := regexp.Compile(r.Regex)
-		if err != nil {
+		re := ruleRegexp(r.Regex)
+		if re == nil {
 			continue
 		}
 		m := re.FindStringSubmatch(userText)
@@ -15,29 +15,36 @@ type llmGateOut struct {
 	Reason     string  `json:"reason"`
 }
 
+func (g *llmGateOut) normalize() {
+	g.Confidence = clamp01(g.Confidence)
+	g.Query = strings.TrimSpace(g.Query)
+	g.Reason = strings.TrimSpace(g.Reason)
+}
+
+// extractJSONObject returns the first complete JSON object in s. The decoder stops at the
+// end of that object, so trailing prose or a second object does not break the parse,
+// and code fences around it are skipped implicitly.
 func extractJSONObject(s string) (string, bool) {
-	s = strings.TrimSpace(s)
-	if s == "" {
-		return "", false
-	}
-	// strip code fences
-	if strings.HasPrefix(s, "```") {
-		s = strings.TrimPrefix(s, "```json")
-		s = strings.TrimPrefix(s, "```JSON")
-		s = strings.TrimPrefix(s, "```")
-		s = strings.TrimSpace(s)
-		if i := strings.LastIndex(s, "```"); i >= 0 {
-			s = strings.TrimSpace(s[:i])
+	for tries := 0; tries < 8; tries++ {
+		i := strings.IndexByte(s, '{')
+		if i < 0 {
+			return "", false
 		}
+		s = s[i:]
+		var raw json.RawMessage
+		if err := json.NewDecoder(strings.NewReader(s)).Decode(&raw); err == nil {
+			return string(raw), true
+		}
+		s = s[1:]
 	}
-	start := strings.Index(s, "{")
-	end := strings.LastIndex(s, "}")
-	if start < 0 || end < 0 || end <= start {
-		return "", false
-	}
-	return strings.TrimSpace(s[start : end+1]), true
+	return "", false
 }
 
+const webGateSystemPrompt = "Du bist ein Sensor-Gate. Du beantwortest NICHT die Nutzerfrage. " +
+	"Du entscheidest nur, ob ein WebSense-Aufruf nötig ist, um Halluzinationen zu vermeiden. " +
+	"Wenn du unsicher bist: need_web=true. " +
+	"Output ONLY JSON: {\"need_web\":bool,\"confidence\":0..1,\"query\":string,\"reason\":string}."
+
 // CortexWebGate asks a small LLM to decide whether WebSense is needed.
 // IMPORTANT: If uncertain, it must prefer need_web=true (avoid hallucinations).
 func CortexWebGate(oc *ollama.Client, model string, userText string, intent Intent, ws *Workspace) (need bool, conf float64, query string, reason string, err error) {
@@ -48,11 +55,6 @@ func CortexWebGate(oc *ollama.Client, model string, userText string, intent Inte
 		return false, 0, "", "", errors.New("dry_run")
 	}
 
-	sys := "Du bist ein Sensor-Gate. Du beantwortest NICHT die Nutzerfrage. " +
-		"Du entscheidest nur, ob ein WebSense-Aufruf nötig ist, um Halluzinationen zu vermeiden. " +
-		"Wenn du unsicher bist: need_web=true. " +
-		"Output ONLY JSON: {\"need_web\":bool,\"confidence\":0..1,\"query\":string,\"reason\":string}."
-
 	webAllowed := true
 	survivalMode := false
 	if ws != nil {
@@ -66,7 +68,7 @@ func CortexWebGate(oc *ollama.Client, model string, userText string, intent Inte
 		"\nSURVIVAL_MODE:" + boolTo01(survivalMode) +
 		"\n\nEntscheide need_web. Wenn need_web=true, gib eine kurze Suchquery (Deutsch)."
 
-	out, e := oc.Chat(model, []ollama.Message{{Role: "system", Content: sys}, {Role: "user", Content: user}})
+	out, e := oc.ChatJSON(model, []ollama.Message{{Role: "system", Content: webGateSystemPrompt}, {Role: "user", Content: user}})
 	if e != nil {
 		return false, 0, "", "", e
 	}
@@ -78,17 +80,8 @@ func CortexWebGate(oc *ollama.Client, model string, userText string, intent Inte
 	if err := json.Unmarshal([]byte(js), &g); err != nil {
 		return false, 0, "", "", err
 	}
-	conf = g.Confidence
-	if conf < 0 {
-		conf = 0
-	}
-	if conf > 1 {
-		conf = 1
-	}
-	need = g.NeedWeb
-	query = strings.TrimSpace(g.Query)
-	reason = strings.TrimSpace(g.Reason)
-	return
+	g.normalize()
+	return g.NeedWeb, g.Confidence, g.Query, g.Reason, nil
 }
 
 func boolTo01(b bool) string {
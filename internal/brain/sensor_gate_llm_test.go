@@ -0,0 +1,22 @@
+package brain
+
+import "testing"
+
+func TestExtractJSONObject(t *testing.T) {
+	cases := map[string]string{
+		`{"need_web":true}`:                            `{"need_web":true}`,
+		"```json\n{\"a\":1}\n```":                      `{"a":1}`,
+		`Antwort: {"a":{"b":"}"}} und noch etwas Text`: `{"a":{"b":"}"}}`,
+		`{"a":1} {"b":2}`:                              `{"a":1}`,
+		`{kein json} {"a":1}`:                          `{"a":1}`,
+	}
+	for in, want := range cases {
+		got, ok := extractJSONObject(in)
+		if !ok || got != want {
+			t.Fatalf("extractJSONObject(%q) = %q, %v; want %q", in, got, ok, want)
+		}
+	}
+	if _, ok := extractJSONObject("no object here"); ok {
+		t.Fatalf("expected no object")
+	}
+}
@@ -5,7 +5,6 @@ import (
 	"net/url"
 	"sort"
 	"strings"
-	"time"
 
 	"frankenstein-v0/internal/websense"
 )
@@ -59,7 +58,7 @@ func UpdateSourceTrust(db *sql.DB, domain string, success bool) {
 	if domain == "" {
 		return
 	}
-	now := time.Now().Format(time.RFC3339)
+	now := NowRFC3339()
 	delta := 0.10
 	good := 1
 	bad := 0
@@ -89,19 +88,20 @@ func PickEvidenceResults(db *sql.DB, results []websense.SearchResult, topN int)
 		r      websense.SearchResult
 		domain string
 		score  float64
+		length int
 	}
 	sc := make([]scored, 0, len(results))
 	for _, r := range results {
 		d := domainFromURL(r.URL)
 		s := GetSourceTrust(db, d)
-		sc = append(sc, scored{r: r, domain: d, score: s})
+		// tie-breaker key computed once, not per comparison
+		l := len(strings.TrimSpace(r.Snippet)) + len(strings.TrimSpace(r.Title))
+		sc = append(sc, scored{r: r, domain: d, score: s, length: l})
 	}
 	sort.Slice(sc, func(i, j int) bool {
 		if sc[i].score == sc[j].score {
 			// tie-breaker: prefer longer snippet/title (often more descriptive)
-			li := len(strings.TrimSpace(sc[i].r.Snippet)) + len(strings.TrimSpace(sc[i].r.Title))
-			lj := len(strings.TrimSpace(sc[j].r.Snippet)) + len(strings.TrimSpace(sc[j].r.Title))
-			return li > lj
+			return sc[i].length > sc[j].length
 		}
 		return sc[i].score > sc[j].score
 	})
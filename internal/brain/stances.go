@@ -37,12 +37,7 @@ func SaveStance(db *sql.DB, s Stance) {
 	if db == nil || strings.TrimSpace(s.Topic) == "" {
 		return
 	}
-	if s.Position < -1 {
-		s.Position = -1
-	}
-	if s.Position > 1 {
-		s.Position = 1
-	}
+	s.Position = clamp11(s.Position)
 	s.Confidence = clamp01(s.Confidence)
 	if s.HalfLifeDays <= 0 {
 		s.HalfLifeDays = 60
@@ -53,7 +48,7 @@ func SaveStance(db *sql.DB, s Stance) {
 	if strings.TrimSpace(s.Rationale) == "" {
 		s.Rationale = "-"
 	}
-	ts := time.Now().Format(time.RFC3339)
+	ts := NowRFC3339()
 	_, _ = db.Exec(`INSERT INTO stances(topic, position, label, rationale, confidence, updated_at, half_life_days)
 		VALUES(?,?,?,?,?,?,?)
 		ON CONFLICT(topic) DO UPDATE SET
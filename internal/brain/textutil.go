@@ -1,10 +1,30 @@
 package brain
 
 import (
+	"regexp"
 	"strings"
+	"sync"
 	"unicode"
 )
 
+// ruleRegexps caches epigenome rule patterns (intent, offline reflex, semantic
+// memory). Rules are re-read from the epigenome on every turn, but the pattern
+// strings rarely change, so each one is compiled once per process.
+var ruleRegexps sync.Map // pattern -> *regexp.Regexp (nil if invalid)
+
+// ruleRegexp returns the compiled pattern, or nil if it does not compile.
+func ruleRegexp(pat string) *regexp.Regexp {
+	if v, ok := ruleRegexps.Load(pat); ok {
+		return v.(*regexp.Regexp)
+	}
+	re, err := regexp.Compile(pat)
+	if err != nil {
+		re = nil
+	}
+	ruleRegexps.Store(pat, re)
+	return re
+}
+
 // TokenizeAlphaNumLower is a generic tokenizer for topic anchoring and simple heuristics.
 func TokenizeAlphaNumLower(s string) []string {
 	s = strings.TrimSpace(strings.ToLower(s))
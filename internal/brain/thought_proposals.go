@@ -5,7 +5,6 @@ import (
 	"fmt"
 	"strconv"
 	"strings"
-	"time"
 )
 
 type ThoughtProposal struct {
@@ -138,7 +137,7 @@ func MaterializeThoughtProposal(db *sql.DB, id int64) (string, bool) {
 	if !ok || it.Status != "proposed" {
 		return "Kein offenes thought_proposal mit dieser ID.", false
 	}
-	now := time.Now().Format(time.RFC3339)
+	now := NowRFC3339()
 	notes := strings.TrimSpace(it.Payload)
 	if it.Note != "" {
 		notes = strings.TrimSpace(notes + "\n\nNOTE: " + it.Note)
@@ -2,7 +2,6 @@ package brain
 
 import (
 	"database/sql"
-	"time"
 )
 
 func LoadActiveTopic(db *sql.DB) string {
@@ -24,6 +23,6 @@ func SaveActiveTopic(db *sql.DB, topic string) {
 	_, _ = db.Exec(
 		`INSERT INTO thread_state(key,value,updated_at) VALUES('active_topic',?,?)
          ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=excluded.updated_at`,
-		topic, time.Now().Format(time.RFC3339),
+		topic, NowRFC3339(),
 	)
 }
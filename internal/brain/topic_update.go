@@ -47,6 +47,8 @@ func UpdateActiveTopic(ws *Workspace, userText string) string {
 	return ws.ActiveTopic
 }
 
+var followupCues = []string{"dazu", "darüber", "darueber", "davon", "vorhin", "oben", "nochmal", "genannte", "letzte", "dies", "diese", "diesen", "dem", "den"}
+
 func isLikelyContextFollowup(t string) bool {
 	if t == "" {
 		return false
@@ -55,8 +57,7 @@ func isLikelyContextFollowup(t string) bool {
 	if len(r) > 80 {
 		return false
 	}
-	cues := []string{"dazu", "darüber", "darueber", "davon", "vorhin", "oben", "nochmal", "genannte", "letzte", "dies", "diese", "diesen", "dem", "den"}
-	for _, c := range cues {
+	for _, c := range followupCues {
 		if strings.Contains(t, c) {
 			return true
 		}
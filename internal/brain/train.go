@@ -4,14 +4,13 @@ import (
 	"database/sql"
 	"strconv"
 	"strings"
-	"time"
 )
 
 func InsertTrainTrial(db *sql.DB, userMsgID int64, topic, intent, ctxKey string, aAct, aSty, aTxt, bAct, bSty, bTxt string) (int64, error) {
 	if db == nil {
 		return 0, nil
 	}
-	now := time.Now().Format(time.RFC3339)
+	now := NowRFC3339()
 	res, err := db.Exec(`INSERT INTO train_trials(created_at,user_msg_id,topic,intent,ctx_key,a_action,a_style,a_text,b_action,b_style,b_text,chosen,note)
     VALUES(?,?,?,?,?,?,?,?,?,?,?, '', '')`,
 		now, userMsgID, topic, intent, ctxKey, aAct, aSty, aTxt, bAct, bSty, bTxt)
@@ -89,8 +88,7 @@ func ApplyTrainChoice(db *sql.DB, trialID int64, choice string) {
 		chosenAction = aAct
 		// If A/B are identical on an axis, do not update that axis (prevents double-counting noise).
 		if aAct != "" && bAct != "" && aAct != bAct {
-			UpdatePolicy(db, ctxKey, aAct, 1.0)
-			UpdatePolicy(db, ctxKey, bAct, 0.0)
+			UpdatePolicyBatch(db, ctxKey, []PolicyUpdate{{aAct, 1.0}, {bAct, 0.0}})
 			UpdatePreferenceEMA(db, "strat:"+aAct, 1.0, 0.12)
 			UpdatePreferenceEMA(db, "strat:"+bAct, -0.7, 0.12)
 		}
@@ -101,8 +99,7 @@ func ApplyTrainChoice(db *sql.DB, trialID int64, choice string) {
 	} else if choice == "B" {
 		chosenAction = bAct
 		if aAct != "" && bAct != "" && aAct != bAct {
-			UpdatePolicy(db, ctxKey, bAct, 1.0)
-			UpdatePolicy(db, ctxKey, aAct, 0.0)
+			UpdatePolicyBatch(db, ctxKey, []PolicyUpdate{{bAct, 1.0}, {aAct, 0.0}})
 			UpdatePreferenceEMA(db, "strat:"+bAct, 1.0, 0.12)
 			UpdatePreferenceEMA(db, "strat:"+aAct, -0.7, 0.12)
 		}
@@ -132,6 +129,7 @@ func applySoftWeightMutation(db *sql.DB, ctxKey, chosenAction string) {
 	if rate == 0 {
 		return
 	}
+	updates := make([]PolicyUpdate, 0, len(DefaultPolicyActions))
 	for _, act := range DefaultPolicyActions {
 		if strings.TrimSpace(act) == "" {
 			continue
@@ -142,8 +140,9 @@ func applySoftWeightMutation(db *sql.DB, ctxKey, chosenAction string) {
 		} else {
 			reward = 0.5 - (rate / float64(maxInt(1, len(DefaultPolicyActions)-1)))
 		}
-		UpdatePolicy(db, ctxKey, act, reward)
+		updates = append(updates, PolicyUpdate{Action: act, Reward01: reward})
 	}
+	UpdatePolicyBatch(db, ctxKey, updates)
 }
 
 func kvFloat(db *sql.DB, key string, fallback float64) float64 {
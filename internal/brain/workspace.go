@@ -151,3 +151,11 @@ func ExtractTopic(s string) string {
 	}
 	return best
 }
+
+// SelfModelWorkspace lets epi.BuildSelfModel read these fields without a JSON round trip.
+func (w *Workspace) SelfModelWorkspace() (string, float64) {
+	if w == nil {
+		return "", 0
+	}
+	return w.CurrentThought, w.Confidence
+}
@@ -30,20 +30,19 @@ func IndexRepo(db *sql.DB, root string) error {
 			return nil
 		}
 		if d.IsDir() {
-			// skip vendor/.git
-			base := filepath.Base(path)
-			if base == ".git" || base == "vendor" {
+			// prune whole subtrees that never hold indexable sources (.git, vendor, testdata, ...)
+			if path != root && skipDir(d.Name()) {
 				return filepath.SkipDir
 			}
 			return nil
 		}
-		if !strings.HasSuffix(path, ".go") {
+		if !strings.HasSuffix(d.Name(), ".go") {
 			return nil
 		}
-		// ignore generated testdata if you like
 		rel, _ := filepath.Rel(root, path)
+		// comments are not indexed, so don't ask the parser to collect them
 		fset := token.NewFileSet()
-		f, perr := parser.ParseFile(fset, path, nil, parser.ParseComments)
+		f, perr := parser.ParseFile(fset, path, nil, 0)
 		if perr != nil || f == nil {
 			return nil
 		}
@@ -90,6 +89,15 @@ func IndexRepo(db *sql.DB, root string) error {
 	})
 }
 
+func skipDir(name string) bool {
+	switch name {
+	case "vendor", "testdata", "node_modules":
+		return true
+	}
+	// .git, .idea, .cache, ...
+	return strings.HasPrefix(name, ".")
+}
+
 func trimList(in []string, n int) []string {
 	if len(in) <= n {
 		return in
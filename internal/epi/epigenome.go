@@ -1,6 +1,7 @@
 package epi
 
 import (
+	"bytes"
 	"encoding/json"
 	"fmt"
 	"os"
@@ -25,6 +26,11 @@ type Epigenome struct {
 	Version       int                    `json:"version"`
 	Modules       map[string]*ModuleSpec `json:"modules"`
 	AffectDefsMap map[string]AffectDef   `json:"affect_defs,omitempty"`
+
+	// saved/savedPath remember what was last read from or written to disk, so
+	// Save can skip rewriting an unchanged file.
+	saved     []byte
+	savedPath string
 }
 
 func LoadOrInit(path string) (*Epigenome, error) {
@@ -34,6 +40,7 @@ func LoadOrInit(path string) (*Epigenome, error) {
 		if err := json.Unmarshal(b, &eg); err != nil {
 			return nil, err
 		}
+		eg.saved, eg.savedPath = b, path
 		if eg.Modules == nil {
 			eg.Modules = map[string]*ModuleSpec{}
 		}
@@ -356,11 +363,18 @@ func (eg *Epigenome) Save(path string) error {
 	if err != nil {
 		return err
 	}
+	if path == eg.savedPath && bytes.Equal(b, eg.saved) {
+		return nil
+	}
 	tmp := path + ".tmp"
 	if err := os.WriteFile(tmp, b, 0o644); err != nil {
 		return err
 	}
-	return os.Rename(tmp, path)
+	if err := os.Rename(tmp, path); err != nil {
+		return err
+	}
+	eg.saved, eg.savedPath = b, path
+	return nil
 }
 
 func (eg *Epigenome) ensureDefaults() (changed bool) {
@@ -49,13 +49,19 @@ func BuildSelfModel(body any, aff AffectReader, ws any, tr any, eg *Epigenome) *
 	sm.Body.WebCountHour = ExtractWebCountHour(body)
 	sm.Body.Cooldown = ExtractCooldown(body).Format(time.RFC3339)
 
-	if aff != nil {
-		sm.Affects = map[string]float64{}
-		for _, k := range aff.Keys() {
+	if a, ok := aff.(interface{ Snapshot() map[string]float64 }); ok && a != nil {
+		sm.Affects = a.Snapshot()
+	} else if aff != nil {
+		keys := aff.Keys()
+		sm.Affects = make(map[string]float64, len(keys))
+		for _, k := range keys {
 			sm.Affects[k] = aff.Get(k)
 		}
 	}
-	if ws != nil {
+	// Accessor fast paths; the JSON round trip is only a fallback for foreign types.
+	if w, ok := ws.(interface{ SelfModelWorkspace() (string, float64) }); ok && w != nil {
+		sm.Workspace.CurrentThought, sm.Workspace.Confidence = w.SelfModelWorkspace()
+	} else if ws != nil {
 		raw, _ := json.Marshal(ws)
 		var tmp struct {
 			CurrentThought string  `json:"CurrentThought"`
@@ -65,7 +71,9 @@ func BuildSelfModel(body any, aff AffectReader, ws any, tr any, eg *Epigenome) *
 		sm.Workspace.CurrentThought = tmp.CurrentThought
 		sm.Workspace.Confidence = tmp.Confidence
 	}
-	if tr != nil {
+	if t, ok := tr.(interface{ SelfModelTraits() (float64, float64) }); ok && t != nil {
+		sm.Traits.BluffRate, sm.Traits.HonestyBias = t.SelfModelTraits()
+	} else if tr != nil {
 		raw, _ := json.Marshal(tr)
 		var tmp struct {
 			BluffRate   float64 `json:"BluffRate"`
@@ -75,7 +83,14 @@ func BuildSelfModel(body any, aff AffectReader, ws any, tr any, eg *Epigenome) *
 		sm.Traits.BluffRate = tmp.BluffRate
 		sm.Traits.HonestyBias = tmp.HonestyBias
 	}
-	sm.Epigenome.AffectDefs = eg.AffectDefs()
+	// copied: the snapshot may be encoded after the caller's lock is released, while
+	// concept integration keeps writing the live map
+	defs := eg.AffectDefs()
+	cp := make(map[string]AffectDef, len(defs))
+	for k, v := range defs {
+		cp[k] = v
+	}
+	sm.Epigenome.AffectDefs = cp
 	return sm
 }
 
@@ -104,6 +119,9 @@ func InjectEnergy(body any, v float64) {
 }
 
 func ExtractWebCountHour(body any) int {
+	if b, ok := body.(interface{ GetWebCountHour() int }); ok {
+		return b.GetWebCountHour()
+	}
 	raw, _ := json.Marshal(body)
 	var tmp struct {
 		WebCountHour int `json:"WebCountHour"`
@@ -113,6 +131,9 @@ func ExtractWebCountHour(body any) int {
 }
 
 func ExtractCooldown(body any) time.Time {
+	if b, ok := body.(interface{ GetCooldownUntil() time.Time }); ok {
+		return b.GetCooldownUntil()
+	}
 	raw, _ := json.Marshal(body)
 	var tmp struct {
 		CooldownUntil time.Time `json:"CooldownUntil"`
@@ -6,8 +6,12 @@ import (
 	"errors"
 	"fmt"
 	"io"
+	"net"
 	"net/http"
+	"os"
+	"strconv"
 	"strings"
+	"sync"
 	"time"
 )
 
@@ -20,6 +24,65 @@ type ChatRequest struct {
 	Model    string    `json:"model"`
 	Messages []Message `json:"messages"`
 	Stream   bool      `json:"stream"`
+	Format   string    `json:"format,omitempty"`
+	Options  *Options  `json:"options,omitempty"`
+}
+
+type Options struct {
+	NumCtx int `json:"num_ctx,omitempty"`
+}
+
+// defaultNumCtx is the context Ollama uses when num_ctx is not sent.
+const defaultNumCtx = 2048
+
+// fitNumCtx estimates the prompt size (~4 bytes per token plus room for the reply) and
+// returns a power-of-two num_ctx when the default would truncate it, else 0 (= don't send).
+// The context is never lowered below the default: a different num_ctx makes Ollama
+// reload the model, which costs far more than the smaller KV cache saves. Power-of-two
+// buckets keep the number of distinct sizes (and reloads) small; stickyNumCtx keeps a
+// model from switching back to a smaller one.
+func fitNumCtx(messages []Message) int {
+	n := 0
+	for _, m := range messages {
+		n += len(m.Content)
+	}
+	est := n/4 + 512
+	if est <= defaultNumCtx {
+		return 0
+	}
+	maxCtx := 8192
+	if v, err := strconv.Atoi(strings.TrimSpace(os.Getenv("FRANK_MAX_NUM_CTX"))); err == nil && v >= defaultNumCtx {
+		maxCtx = v
+	}
+	ctx := defaultNumCtx
+	for ctx < est && ctx < maxCtx {
+		ctx *= 2
+	}
+	if ctx > maxCtx {
+		ctx = maxCtx
+	}
+	return ctx
+}
+
+// numCtxSeen is the largest num_ctx sent so far per server and model. Ollama reloads
+// the model whenever num_ctx changes, so once one prompt needed a bigger window every
+// later call keeps sending it instead of dropping back to the default. Package level
+// because Yielding/StreamingTo copies of a client must share it.
+var numCtxSeen = struct {
+	sync.Mutex
+	m map[string]int
+}{m: map[string]int{}}
+
+// stickyNumCtx returns the num_ctx to send for key given what this prompt needs (0 =
+// the default fits): the largest value used for key so far, or 0 if none ever was.
+func stickyNumCtx(key string, want int) int {
+	numCtxSeen.Lock()
+	defer numCtxSeen.Unlock()
+	if have := numCtxSeen.m[key]; have >= want {
+		return have
+	}
+	numCtxSeen.m[key] = want
+	return want
 }
 
 type ChatResponse struct {
@@ -27,45 +90,163 @@ type ChatResponse struct {
 	Done    bool    `json:"done"`
 }
 
+// chatChunk is the part of a /api/chat response (or stream piece) the client reads.
+// Everything else in the envelope (model, role, timings, eval counts) is skipped by
+// the decoder without being materialized.
+type chatChunk struct {
+	Message struct {
+		Content string `json:"content"`
+	} `json:"message"`
+	Done  bool   `json:"done"`
+	Error string `json:"error"`
+}
+
 type Client struct {
 	BaseURL string
 	HTTP    *http.Client
+
+	yield  sync.Locker        // unlocked while a request is in flight (see Yielding)
+	stream func(chunk string) // receives ChatStream reply pieces (see StreamingTo)
+}
+
+// transport is shared by all clients. Several organs talk to the same local Ollama
+// concurrently; the default of 2 idle conns per host would close and redial sockets.
+var transport = &http.Transport{
+	Proxy: http.ProxyFromEnvironment,
+	// Fail fast when Ollama is down; the long wait belongs to generation, not dialing.
+	DialContext:         (&net.Dialer{Timeout: 10 * time.Second, KeepAlive: 30 * time.Second}).DialContext,
+	MaxIdleConns:        2 * idleConnsPerHost(),
+	MaxIdleConnsPerHost: idleConnsPerHost(),
+	IdleConnTimeout:     90 * time.Second,
+}
+
+// idleConnsPerHost sizes the keep-alive pool to the server's parallelism
+// (OLLAMA_NUM_PARALLEL), with at least 8 for the worker goroutines.
+func idleConnsPerHost() int {
+	n, _ := strconv.Atoi(strings.TrimSpace(os.Getenv("OLLAMA_NUM_PARALLEL")))
+	if n < 8 {
+		n = 8
+	}
+	if n > 64 {
+		n = 64
+	}
+	return n
+}
+
+// chatTimeout bounds a whole request (generation included). FRANK_OLLAMA_TIMEOUT
+// (seconds) lifts the 120s default for slow models or CPU-only hosts.
+func chatTimeout() time.Duration {
+	if v, err := strconv.Atoi(strings.TrimSpace(os.Getenv("FRANK_OLLAMA_TIMEOUT"))); err == nil && v > 0 {
+		return time.Duration(v) * time.Second
+	}
+	return 120 * time.Second
 }
 
 func New(baseURL string) *Client {
 	return &Client{
-		BaseURL: baseURL,
+		// trimmed once so BaseURL+"/api/..." never yields a double slash
+		BaseURL: strings.TrimRight(strings.TrimSpace(baseURL), "/"),
 		HTTP: &http.Client{
-			Timeout: 120 * time.Second,
+			Timeout:   chatTimeout(),
+			Transport: transport,
 		},
 	}
 }
 
+// drainClose consumes the rest of the body so the connection can go back to the pool.
+func drainClose(body io.ReadCloser) {
+	_, _ = io.Copy(io.Discard, io.LimitReader(body, 64<<10))
+	_ = body.Close()
+}
+
+// Yielding returns a copy of c that unlocks l for the duration of each chat request
+// and locks it again before returning, so state guarded by l stays usable while the
+// model generates. Every call through the copy must be made with l held, from one
+// goroutine at a time. Yielding(nil) returns a copy that does not yield.
+func (c *Client) Yielding(l sync.Locker) *Client {
+	cp := *c
+	cp.yield = l
+	return &cp
+}
+
+// Yield runs fn with the Yielding lock released, as a chat request does, so other
+// slow I/O of the same turn (web search, page fetches) doesn't hold the guarded state
+// either. Without a yielding lock (or on a nil client) it just calls fn.
+func (c *Client) Yield(fn func()) {
+	if c != nil && c.yield != nil {
+		c.yield.Unlock()
+		defer c.yield.Lock()
+	}
+	fn()
+}
+
+// StreamingTo returns a copy of c whose ChatStream calls pass each piece of the reply
+// to fn as Ollama generates it. StreamingTo(nil) turns streaming off again.
+func (c *Client) StreamingTo(fn func(chunk string)) *Client {
+	cp := *c
+	cp.stream = fn
+	return &cp
+}
+
 func (c *Client) Chat(model string, messages []Message) (string, error) {
+	return c.chat(model, messages, "", nil)
+}
+
+// ChatStream is Chat for user-facing replies: on a StreamingTo client the reply is
+// requested in streaming mode and forwarded piece by piece while it is generated.
+// The full reply is returned either way.
+func (c *Client) ChatStream(model string, messages []Message) (string, error) {
+	return c.chat(model, messages, "", c.stream)
+}
+
+// ChatJSON is Chat with Ollama's JSON mode: the reply is constrained to a single JSON
+// object, so callers can unmarshal it directly without fence stripping or brace scanning.
+func (c *Client) ChatJSON(model string, messages []Message) (string, error) {
+	return c.chat(model, messages, "json", nil)
+}
+
+func (c *Client) chat(model string, messages []Message, format string, onDelta func(string)) (string, error) {
 	model = strings.TrimSpace(model)
 	if model == "" {
 		model = "llama3.1:8b"
 	}
-	out, err := c.chatOnce(model, messages)
+	if c.yield != nil {
+		c.yield.Unlock()
+		defer c.yield.Lock()
+	}
+	streamed := false
+	if onDelta != nil {
+		fn := onDelta
+		onDelta = func(chunk string) {
+			streamed = true
+			fn(chunk)
+		}
+	}
+	out, err := c.chatOnce(model, messages, format, onDelta)
 	if err == nil {
 		return out, nil
 	}
-	if !isRecoverableModelError(err) {
+	// a fallback model would restart a reply the receiver has already seen part of
+	if streamed || !isRecoverableModelError(err) {
 		return "", err
 	}
 	alt := c.suggestFallbackModel(model)
 	if alt == "" || strings.EqualFold(alt, model) {
 		return "", err
 	}
-	out2, err2 := c.chatOnce(alt, messages)
+	out2, err2 := c.chatOnce(alt, messages, format, onDelta)
 	if err2 == nil {
 		return out2, nil
 	}
 	return "", err
 }
 
-func (c *Client) chatOnce(model string, messages []Message) (string, error) {
-	reqBody, _ := json.Marshal(ChatRequest{Model: model, Messages: messages, Stream: false})
+func (c *Client) chatOnce(model string, messages []Message, format string, onDelta func(string)) (string, error) {
+	cr := ChatRequest{Model: model, Messages: messages, Stream: onDelta != nil, Format: format}
+	if n := stickyNumCtx(c.BaseURL+" "+model, fitNumCtx(messages)); n > 0 {
+		cr.Options = &Options{NumCtx: n}
+	}
+	reqBody, _ := json.Marshal(cr)
 	req, _ := http.NewRequest("POST", c.BaseURL+"/api/chat", bytes.NewReader(reqBody))
 	req.Header.Set("Content-Type", "application/json")
 
@@ -73,22 +254,54 @@ func (c *Client) chatOnce(model string, messages []Message) (string, error) {
 	if err != nil {
 		return "", err
 	}
-	defer resp.Body.Close()
-	body, _ := io.ReadAll(resp.Body)
+	defer drainClose(resp.Body)
 	if resp.StatusCode >= 400 {
+		// Error bodies are short JSON/text; cap the read so a misbehaving proxy can't balloon it.
+		body, _ := io.ReadAll(io.LimitReader(resp.Body, 4<<10))
 		msg := strings.TrimSpace(string(body))
 		if msg == "" {
 			msg = "ollama chat http status: " + resp.Status
 		}
 		return "", errors.New(msg)
 	}
-	var out ChatResponse
-	if err := json.Unmarshal(body, &out); err != nil {
-		return "", err
+	// Decode straight from the body; no intermediate []byte copy on the hot path.
+	dec := json.NewDecoder(resp.Body)
+	var part chatChunk
+	if onDelta == nil {
+		if err := dec.Decode(&part); err != nil {
+			return "", err
+		}
+		if part.Error != "" {
+			return "", errors.New(part.Error)
+		}
+		return part.Message.Content, nil
+	}
+	// Streaming: one JSON object per piece until done; errors mid-stream arrive in-band.
+	var b strings.Builder
+	for {
+		part = chatChunk{}
+		if err := dec.Decode(&part); err != nil {
+			if err == io.EOF {
+				break
+			}
+			return "", err
+		}
+		if part.Error != "" {
+			return "", errors.New(part.Error)
+		}
+		if part.Message.Content != "" {
+			b.WriteString(part.Message.Content)
+			onDelta(part.Message.Content)
+		}
+		if part.Done {
+			break
+		}
 	}
-	return out.Message.Content, nil
+	return b.String(), nil
 }
 
+var recoverableModelErrorKeys = []string{"model", "not found", "unknown", "load", "manifest", "status 404", "status 500"}
+
 func isRecoverableModelError(err error) bool {
 	if err == nil {
 		return false
@@ -97,8 +310,7 @@ func isRecoverableModelError(err error) bool {
 	if s == "" {
 		return false
 	}
-	keys := []string{"model", "not found", "unknown", "load", "manifest", "status 404", "status 500"}
-	for _, k := range keys {
+	for _, k := range recoverableModelErrorKeys {
 		if strings.Contains(s, k) {
 			return true
 		}
@@ -132,7 +344,7 @@ func (c *Client) Ping() error {
 	if err != nil {
 		return err
 	}
-	defer resp.Body.Close()
+	defer drainClose(resp.Body)
 
 	if resp.StatusCode != http.StatusOK {
 		return fmt.Errorf("ollama status %d", resp.StatusCode)
@@ -147,23 +359,18 @@ func (c *Client) ListModels() (map[string]struct{}, error) {
 	if err != nil {
 		return nil, err
 	}
-	defer resp.Body.Close()
+	defer drainClose(resp.Body)
 
 	if resp.StatusCode != http.StatusOK {
 		return nil, fmt.Errorf("ollama status %d", resp.StatusCode)
 	}
 
-	body, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return nil, err
-	}
-
 	var parsed struct {
 		Models []struct {
 			Name string `json:"name"`
 		} `json:"models"`
 	}
-	if err := json.Unmarshal(body, &parsed); err != nil {
+	if err := json.NewDecoder(resp.Body).Decode(&parsed); err != nil {
 		return nil, err
 	}
 
@@ -0,0 +1,23 @@
+package ollama
+
+import (
+	"strings"
+	"testing"
+)
+
+func TestStickyNumCtx_SmallCallAfterLargeKeepsWindow(t *testing.T) {
+	key := "test-server " + t.Name()
+	small := []Message{{Role: "user", Content: "hi"}}
+	large := []Message{{Role: "user", Content: strings.Repeat("x", 4*defaultNumCtx)}}
+
+	if n := stickyNumCtx(key, fitNumCtx(small)); n != 0 {
+		t.Fatalf("small first call: num_ctx = %d, want 0 (default)", n)
+	}
+	big := stickyNumCtx(key, fitNumCtx(large))
+	if big <= defaultNumCtx {
+		t.Fatalf("large call: num_ctx = %d, want > %d", big, defaultNumCtx)
+	}
+	if n := stickyNumCtx(key, fitNumCtx(small)); n != big {
+		t.Fatalf("small call after large: num_ctx = %d, want %d (no reload)", n, big)
+	}
+}
@@ -5,6 +5,8 @@ import (
 	"strings"
 )
 
+var disallowedSQLKeywords = []string{"drop ", "delete ", "update ", "insert ", "pragma ", "attach ", "vacuum", "trigger", "view", "replace ", "alter table", "begin", "commit"}
+
 // ValidateSchemaSQL performs conservative validation for schema changes.
 // Allowed: CREATE TABLE, CREATE INDEX, ALTER TABLE ... ADD COLUMN
 // Disallowed: DROP, DELETE, UPDATE, INSERT, PRAGMA, ATTACH, VACUUM, TRIGGER, VIEW
@@ -14,8 +16,7 @@ func ValidateSchemaSQL(sqlText string) error {
 		return errors.New("empty sql")
 	}
 	ls := strings.ToLower(s)
-	bad := []string{"drop ", "delete ", "update ", "insert ", "pragma ", "attach ", "vacuum", "trigger", "view", "replace ", "alter table", "begin", "commit"}
-	for _, b := range bad {
+	for _, b := range disallowedSQLKeywords {
 		if strings.Contains(ls, b) {
 			// allow ALTER TABLE only for ADD COLUMN; checked below
 			if b == "alter table" {
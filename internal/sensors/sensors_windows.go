@@ -18,15 +18,22 @@ type filetime struct {
 	dwHighDateTime uint32
 }
 
+// kernel32 and its procs are resolved on the first Sample and reused by every
+// later heartbeat instead of being looked up again on each call.
+var (
+	kernel32                 = syscall.NewLazyDLL("kernel32.dll")
+	procGetDiskFreeSpaceExW  = kernel32.NewProc("GetDiskFreeSpaceExW")
+	procGlobalMemoryStatusEx = kernel32.NewProc("GlobalMemoryStatusEx")
+	procGetSystemTimes       = kernel32.NewProc("GetSystemTimes")
+)
+
 func NewSampler() Sampler { return &WindowsSampler{} }
 
 func (s *WindowsSampler) Sample(path string) (Snapshot, error) {
 	var out Snapshot
 	p, _ := syscall.UTF16PtrFromString(path)
 	var freeBytesAvailable, totalNumberOfBytes, totalNumberOfFreeBytes uint64
-	k32 := syscall.NewLazyDLL("kernel32.dll")
-	proc := k32.NewProc("GetDiskFreeSpaceExW")
-	r1, _, _ := proc.Call(uintptr(unsafe.Pointer(p)), uintptr(unsafe.Pointer(&freeBytesAvailable)), uintptr(unsafe.Pointer(&totalNumberOfBytes)), uintptr(unsafe.Pointer(&totalNumberOfFreeBytes)))
+	r1, _, _ := procGetDiskFreeSpaceExW.Call(uintptr(unsafe.Pointer(p)), uintptr(unsafe.Pointer(&freeBytesAvailable)), uintptr(unsafe.Pointer(&totalNumberOfBytes)), uintptr(unsafe.Pointer(&totalNumberOfFreeBytes)))
 	if r1 != 0 {
 		out.DiskFreeBytes = totalNumberOfFreeBytes
 		out.DiskTotalBytes = totalNumberOfBytes
@@ -44,15 +51,13 @@ func (s *WindowsSampler) Sample(path string) (Snapshot, error) {
 	}
 	var mse memStatusEx
 	mse.dwLength = uint32(unsafe.Sizeof(mse))
-	procMem := k32.NewProc("GlobalMemoryStatusEx")
-	r2, _, _ := procMem.Call(uintptr(unsafe.Pointer(&mse)))
+	r2, _, _ := procGlobalMemoryStatusEx.Call(uintptr(unsafe.Pointer(&mse)))
 	if r2 != 0 {
 		out.RamTotalBytes = mse.ullTotalPhys
 		out.RamFreeBytes = mse.ullAvailPhys
 	}
 	var idle, kernel, user filetime
-	procTimes := k32.NewProc("GetSystemTimes")
-	r3, _, _ := procTimes.Call(uintptr(unsafe.Pointer(&idle)), uintptr(unsafe.Pointer(&kernel)), uintptr(unsafe.Pointer(&user)))
+	r3, _, _ := procGetSystemTimes.Call(uintptr(unsafe.Pointer(&idle)), uintptr(unsafe.Pointer(&kernel)), uintptr(unsafe.Pointer(&user)))
 	if r3 != 0 {
 		id := ftToU64(idle)
 		ke := ftToU64(kernel)
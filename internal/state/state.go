@@ -2,17 +2,64 @@ package state
 
 import (
 	"database/sql"
+	"strings"
+	"sync"
 
-	_ "github.com/mattn/go-sqlite3"
+	"github.com/mattn/go-sqlite3"
 )
 
-type DB struct{ *sql.DB }
+type DB struct {
+	*sql.DB
+	stmts sync.Map // query -> *sql.Stmt
+}
+
+// maxConns caps the pool: SQLite has a single writer anyway, the rest are WAL readers.
+const maxConns = 8
+
+// connParams are applied by the driver to every pooled connection. A PRAGMA run once
+// through the pool only reaches whichever connection happened to execute it.
+//   - WAL: readers never block on the writer (persistent, but harmless to repeat).
+//   - synchronous=NORMAL: in WAL mode this is still crash-safe; it skips the fsync per commit.
+//   - busy_timeout: wait for the write lock instead of failing with SQLITE_BUSY.
+//   - txlock=immediate: transactions take the write lock at BEGIN, so two writers cannot
+//     both start deferred and then deadlock on the upgrade.
+const connParams = "_journal_mode=WAL&_synchronous=NORMAL&_busy_timeout=5000&_txlock=immediate"
+
+// connPragmas have no DSN key in the driver and are not persisted in the file, so the
+// ConnectHook runs them on every connection the pool opens:
+//   - cache_size=-20000: ~20 MB page cache per connection (default ~2 MB); pooled
+//     connections live on, so hot tables stay cached between calls.
+//   - temp_store=MEMORY: sorter and temp B-trees (ORDER BY, DISTINCT) stay off disk.
+//   - mmap_size=256 MiB: reads map the file instead of copying pages through read().
+const connPragmas = "PRAGMA cache_size=-20000; PRAGMA temp_store=MEMORY; PRAGMA mmap_size=268435456;"
+
+// driverName is go-sqlite3 with connPragmas applied on connect.
+const driverName = "sqlite3_pooled"
+
+func init() {
+	sql.Register(driverName, &sqlite3.SQLiteDriver{
+		ConnectHook: func(c *sqlite3.SQLiteConn) error {
+			_, err := c.Exec(connPragmas, nil)
+			return err
+		},
+	})
+}
 
 func Open(path string) (*DB, error) {
-	db, err := sql.Open("sqlite3", path)
+	sep := "?"
+	if strings.Contains(path, "?") {
+		sep = "&"
+	}
+	db, err := sql.Open(driverName, path+sep+connParams)
 	if err != nil {
 		return nil, err
 	}
+	// database/sql is the connection pool; size it so the UI handlers, the tick loop and
+	// the organ goroutines reuse warm handles instead of reopening the file (+ -wal/-shm)
+	// whenever more than the default 2 idle connections were in use.
+	db.SetMaxOpenConns(maxConns)
+	db.SetMaxIdleConns(maxConns)
+	db.SetConnMaxIdleTime(0)
 	if err := migrate(db); err != nil {
 		_ = db.Close()
 		return nil, err
@@ -20,9 +67,35 @@ func Open(path string) (*DB, error) {
 	return &DB{DB: db}, nil
 }
 
+// Stmt returns query prepared for the pool, preparing it on first use. database/sql
+// prepares it once per pooled connection and keeps it there, so hot per-message
+// queries skip SQLite's parse/plan step on every call.
+func (d *DB) Stmt(query string) (*sql.Stmt, error) {
+	if v, ok := d.stmts.Load(query); ok {
+		return v.(*sql.Stmt), nil
+	}
+	st, err := d.Prepare(query)
+	if err != nil {
+		return nil, err
+	}
+	if v, loaded := d.stmts.LoadOrStore(query, st); loaded {
+		_ = st.Close()
+		return v.(*sql.Stmt), nil
+	}
+	return st, nil
+}
+
+// Close releases the cached statements, then the pool.
+func (d *DB) Close() error {
+	d.stmts.Range(func(_, v any) bool {
+		_ = v.(*sql.Stmt).Close()
+		return true
+	})
+	return d.DB.Close()
+}
+
 func migrate(db *sql.DB) error {
 	stmts := []string{
-		`PRAGMA journal_mode=WAL;`,
 		`CREATE TABLE IF NOT EXISTS sources (
 			id INTEGER PRIMARY KEY AUTOINCREMENT,
 			url TEXT NOT NULL,
@@ -51,6 +124,7 @@ func migrate(db *sql.DB) error {
 			message_id INTEGER NOT NULL,
 			value INTEGER NOT NULL
 		);`,
+		`CREATE INDEX IF NOT EXISTS idx_ratings_message ON ratings(message_id, created_at);`,
 		`CREATE TABLE IF NOT EXISTS traits (
 			key TEXT PRIMARY KEY,
 			value REAL NOT NULL,
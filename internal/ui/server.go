@@ -1,11 +1,15 @@
 package ui
 
 import (
+	"bytes"
 	"context"
+	"crypto/sha256"
+	"encoding/hex"
 	"encoding/json"
-	"fmt"
+	"io"
 	"net/http"
 	"strconv"
+	"strings"
 	"sync"
 	"time"
 )
@@ -22,7 +26,7 @@ type Server struct {
 	addr string
 
 	// callbacks into your kernel/app
-	ListMessages func(limit int) ([]Message, error)
+	ListMessages func(limit int) ([]Message, error) // newest N, oldest first
 	SendText     func(text string) (Message, error)
 	RateMessage  func(messageID int64, value int) error
 	Caught       func(messageID int64) error
@@ -46,20 +50,67 @@ func (s *Server) PublishMessage(m Message) {
 	s.b.publish("message", m)
 }
 
-// PublishStatus pushes a status snapshot to SSE subscribers.
+// ReplyStream returns a sink for the text of one reply while it is generated. Pieces
+// go to SSE subscribers as "delta" events, coalesced to one frame per 64 bytes or
+// 20ms so token-sized pieces don't each become a frame. The finished reply still
+// arrives as a "message" event and replaces the draft. The sink is not safe for
+// concurrent use.
+func (s *Server) ReplyStream() func(chunk string) {
+	if s == nil || s.b == nil {
+		return func(string) {}
+	}
+	var buf []byte
+	var last time.Time
+	return func(chunk string) {
+		buf = append(buf, chunk...)
+		if len(buf) < 64 && time.Since(last) < 20*time.Millisecond {
+			return
+		}
+		s.b.publish("delta", replyDelta{Chunk: string(buf)})
+		buf = buf[:0]
+		last = time.Now()
+	}
+}
+
+// replyDelta is the "delta" event payload. A struct, not a map: the encoder then
+// needs no map iteration and key sort for every piece of a streamed reply.
+type replyDelta struct {
+	Chunk string `json:"chunk"`
+}
+
+// PublishStatus pushes a status snapshot to SSE subscribers. Snapshots published in
+// quick succession (a tick right after a rating, bursts of ratings) are coalesced:
+// subscribers only get the newest one. st must not be modified after the call.
 func (s *Server) PublishStatus(st any) {
+	s.PublishStatusFunc(func() any { return st })
+}
+
+// PublishStatusFunc is PublishStatus with the snapshot built lazily: build runs once
+// per coalesced flush (on a timer goroutine), so snapshots superseded within the
+// window are never built at all.
+func (s *Server) PublishStatusFunc(build func() any) {
 	if s == nil || s.b == nil {
 		return
 	}
-	s.b.publish("status", st)
+	s.b.publishLatest("status", build)
 }
 
 func (s *Server) Run(ctx context.Context) error {
 	mux := http.NewServeMux()
 
 	mux.HandleFunc("/", func(w http.ResponseWriter, r *http.Request) {
-		w.Header().Set("Content-Type", "text/html; charset=utf-8")
-		fmt.Fprint(w, indexHTML)
+		// shared, never-mutated value slices under their canonical keys: Set would
+		// allocate a fresh []string per header per request
+		h := w.Header()
+		h["Etag"] = indexHeaders.etag
+		h["Cache-Control"] = indexHeaders.cacheControl
+		if inm := r.Header.Get("If-None-Match"); inm != "" && (inm == "*" || strings.Contains(inm, indexHTMLETag)) {
+			w.WriteHeader(http.StatusNotModified)
+			return
+		}
+		h["Content-Type"] = indexHeaders.contentType
+		h["Content-Length"] = indexHeaders.contentLength
+		_, _ = w.Write(indexHTMLBytes)
 	})
 
 	mux.HandleFunc("/api/messages", func(w http.ResponseWriter, r *http.Request) {
@@ -181,9 +232,30 @@ func (s *Server) Run(ctx context.Context) error {
 	})
 
 	// SSE stream
-	mux.HandleFunc("/api/stream", func(w http.ResponseWriter, r *http.Request) {
-		flusher, ok := w.(http.Flusher)
-		if !ok {
+	mux.HandleFunc("/api/stream", s.handleStream(ctx))
+
+	srv := &http.Server{
+		Addr:    s.addr,
+		Handler: mux,
+		// No WriteTimeout: it would cut the SSE stream; the stream sets its own
+		// per-flush deadline instead.
+		ReadHeaderTimeout: 10 * time.Second,
+		IdleTimeout:       90 * time.Second,
+	}
+
+	go func() {
+		<-ctx.Done()
+		_ = srv.Shutdown(context.Background())
+	}()
+
+	return srv.ListenAndServe()
+}
+
+// handleStream serves the SSE stream until the client goes away, ctx ends or
+// the broker drops the subscription.
+func (s *Server) handleStream(ctx context.Context) http.HandlerFunc {
+	return func(w http.ResponseWriter, r *http.Request) {
+		if _, ok := w.(http.Flusher); !ok {
 			http.Error(w, "stream unsupported", http.StatusInternalServerError)
 			return
 		}
@@ -191,14 +263,47 @@ func (s *Server) Run(ctx context.Context) error {
 		w.Header().Set("Cache-Control", "no-cache")
 		w.Header().Set("Connection", "keep-alive")
 
-		ch, cancel := s.b.subscribe()
+		sub, cancel := s.b.subscribe()
 		defer cancel()
 
-		// initial keepalive
-		fmt.Fprint(w, "event: ping\ndata: {}\n\n")
-		flusher.Flush()
+		// Each write+flush gets a write deadline: a client that stops reading makes
+		// the kernel's send buffer fill up, and without a deadline this goroutine
+		// would block in Write forever instead of giving the subscription back. The
+		// deadline is armed right before writing and cleared after a successful
+		// flush, so time spent idle waiting for the next event never counts.
+		rc := http.NewResponseController(w)
+		arm := func() { _ = rc.SetWriteDeadline(time.Now().Add(sseWriteTimeout)) }
+		flush := func() bool {
+			if err := rc.Flush(); err != nil {
+				return false
+			}
+			_ = rc.SetWriteDeadline(time.Time{})
+			return true
+		}
+		// writeBatch writes whatever is queued behind the n bytes already written,
+		// then the parked status if the queue is empty by then.
+		writeBatch := func(n int) (open bool, err error) {
+			if open, err = writeQueued(w, sub.ch, n); !open || err != nil {
+				return open, err
+			}
+			if p := s.b.takePending(sub); p != nil {
+				_, err = w.Write(p)
+			}
+			return true, err
+		}
+
+		// First flush: a keepalive (opens the stream for proxies) plus whatever
+		// subscribe already queued, i.e. the replayed status, in one round trip.
+		arm()
+		_, _ = w.Write(keepAliveFrame)
+		if open, err := writeBatch(len(keepAliveFrame)); !open || err != nil {
+			return
+		}
+		if !flush() {
+			return
+		}
 
-		keep := time.NewTicker(15 * time.Second)
+		keep := time.NewTicker(sseKeepAlive)
 		defer keep.Stop()
 
 		for {
@@ -207,33 +312,56 @@ func (s *Server) Run(ctx context.Context) error {
 				return
 			case <-ctx.Done():
 				return
-			case msg := <-ch:
-				_, _ = w.Write(msg)
-				flusher.Flush()
+			case msg, ok := <-sub.ch:
+				if !ok {
+					// dropped by the broker as a persistently slow consumer
+					return
+				}
+				arm()
+				n, err := w.Write(msg)
+				if err != nil {
+					return
+				}
+				// batch whatever else is already queued into the same flush
+				open, err := writeBatch(n)
+				if err != nil {
+					return
+				}
+				if !open {
+					flush()
+					return
+				}
+				if !flush() {
+					return
+				}
+			case <-sub.wake:
+				arm()
+				open, err := writeBatch(0)
+				if err != nil || !open {
+					return
+				}
+				if !flush() {
+					return
+				}
 			case <-keep.C:
-				fmt.Fprint(w, "event: ping\ndata: {}\n\n")
-				flusher.Flush()
+				arm()
+				if _, err := w.Write(keepAliveFrame); err != nil {
+					return
+				}
+				if !flush() {
+					return
+				}
 			}
 		}
-	})
-
-	srv := &http.Server{
-		Addr:    s.addr,
-		Handler: mux,
 	}
-
-	go func() {
-		<-ctx.Done()
-		_ = srv.Shutdown(context.Background())
-	}()
-
-	return srv.ListenAndServe()
 }
 
 func writeJSON(w http.ResponseWriter, v any) {
 	w.Header().Set("Content-Type", "application/json; charset=utf-8")
+	// compact: the page pretty-prints status itself; indenting only adds bytes and
+	// encoder work to every message list
 	enc := json.NewEncoder(w)
-	enc.SetIndent("", "  ")
+	enc.SetEscapeHTML(false)
 	_ = enc.Encode(v)
 }
 
@@ -248,42 +376,269 @@ func trim(s string) string {
 	return s
 }
 
+// maxStrikes is how many publishes in a row a subscriber may miss (queue full)
+// before it is disconnected; the client's EventSource reconnects and reloads.
+// Status frames are never dropped this way: see subscriber.
+const maxStrikes = 3
+
+// coalesceWindow is how long publishLatest waits for newer payloads of the same event.
+const coalesceWindow = 50 * time.Millisecond
+
+// sseWriteTimeout bounds how long one write+flush to an SSE client may block;
+// sseKeepAlive is how often an idle stream gets a comment frame. Variables so
+// tests can shorten them.
+var (
+	sseWriteTimeout = 10 * time.Second
+	sseKeepAlive    = 15 * time.Second
+)
+
+// A burst of queued frames shares one flush, bounded by sseBatchFrames and
+// sseBatchBytes (net/http's response buffer): a long backlog then goes out in
+// buffer-sized writes as it is read, not only once the channel has run dry.
+const (
+	sseBatchFrames = 32
+	sseBatchBytes  = 4 << 10
+)
+
+// writeQueued writes up to sseBatchFrames frames already waiting on ch behind
+// the n bytes of the current batch, stopping once the batch reaches
+// sseBatchBytes. open is false once the broker has closed ch.
+func writeQueued(w io.Writer, ch <-chan []byte, n int) (open bool, err error) {
+	for i := 0; i < sseBatchFrames && n < sseBatchBytes; i++ {
+		select {
+		case msg, ok := <-ch:
+			if !ok {
+				return false, nil
+			}
+			m, err := w.Write(msg)
+			if err != nil {
+				return true, err
+			}
+			n += m
+		default:
+			return true, nil
+		}
+	}
+	return true, nil
+}
+
+// subscriber is one stream's queue. A status frame that finds ch full waits in
+// pending instead (a newer status replaces it) and wake is signalled; the stream
+// writes it once the frames queued before it have gone out, so the client ends on
+// the newest snapshot without any event being reordered behind it.
+type subscriber struct {
+	ch      chan []byte
+	wake    chan struct{} // cap 1
+	pending []byte        // guarded by broker.mu
+	strikes int           // consecutive dropped events; guarded by broker.mu
+}
+
 type broker struct {
-	mu   sync.Mutex
-	subs map[chan []byte]struct{}
+	mu     sync.Mutex
+	subs   map[*subscriber]struct{}
+	status []byte                // last "status" frame, replayed to new subscribers
+	parked func() any            // status published while nobody listened; encoded on subscribe
+	latest map[string]func() any // event -> builder of the newest payload waiting for its flush
 }
 
 func newBroker() *broker {
-	return &broker{subs: map[chan []byte]struct{}{}}
+	return &broker{subs: map[*subscriber]struct{}{}, latest: map[string]func() any{}}
+}
+
+// idleLocked reports whether there is nobody to publish to; b.mu is held. Events
+// are then dropped without being built or encoded, except that a status builder is
+// parked for the next subscriber's replay.
+func (b *broker) idleLocked(event string, build func() any) bool {
+	if len(b.subs) > 0 {
+		return false
+	}
+	if event == "status" {
+		b.status = nil
+		b.parked = build
+	}
+	return true
 }
 
-func (b *broker) subscribe() (chan []byte, func()) {
-	ch := make(chan []byte, 16)
+// publishLatest is publish for snapshot-style events where only the newest payload
+// matters: payloads arriving within coalesceWindow of the first are collapsed into
+// one frame, built by the last builder passed in.
+func (b *broker) publishLatest(event string, build func() any) {
 	b.mu.Lock()
-	b.subs[ch] = struct{}{}
+	if b.idleLocked(event, build) {
+		b.mu.Unlock()
+		return
+	}
+	_, pending := b.latest[event]
+	b.latest[event] = build
 	b.mu.Unlock()
-	return ch, func() {
+	if pending {
+		return
+	}
+	time.AfterFunc(coalesceWindow, func() {
 		b.mu.Lock()
-		delete(b.subs, ch)
+		build := b.latest[event]
+		delete(b.latest, event)
+		idle := b.idleLocked(event, build)
+		b.mu.Unlock()
+		if !idle {
+			b.publish(event, build())
+		}
+	})
+}
+
+func (b *broker) subscribe() (*subscriber, func()) {
+	b.mu.Lock()
+	build := b.parked
+	b.parked = nil
+	b.mu.Unlock()
+	if build != nil {
+		// built outside b.mu: the builder may take locks its publisher held while
+		// calling into the broker
+		frame := sseFrame("status", build())
+		b.mu.Lock()
+		if b.status == nil && b.parked == nil {
+			b.status = frame
+		}
+		b.mu.Unlock()
+	}
+	sub := &subscriber{ch: make(chan []byte, 16), wake: make(chan struct{}, 1)}
+	b.mu.Lock()
+	b.subs[sub] = struct{}{}
+	if b.status != nil {
+		sub.ch <- b.status
+	}
+	b.mu.Unlock()
+	return sub, func() {
+		b.mu.Lock()
+		if _, ok := b.subs[sub]; ok {
+			delete(b.subs, sub)
+			close(sub.ch)
+		}
 		b.mu.Unlock()
-		close(ch)
 	}
 }
 
+// takePending returns sub's parked status frame and clears the slot, once the
+// frames queued before it are gone (ch empty); nil otherwise.
+func (b *broker) takePending(sub *subscriber) []byte {
+	b.mu.Lock()
+	defer b.mu.Unlock()
+	if len(sub.ch) > 0 {
+		return nil
+	}
+	p := sub.pending
+	sub.pending = nil
+	return p
+}
+
+// publish fans one frame out to every subscriber. Each subscriber channel is a
+// fixed-size ring allocated at subscribe time, so a broadcast is one non-blocking
+// send per subscriber. With no subscribers nothing is encoded; otherwise the frame
+// is encoded outside the lock, so marshalling a large payload never holds up
+// subscribe/cancel or other publishers.
 func (b *broker) publish(event string, payload any) {
+	b.mu.Lock()
+	if len(b.subs) == 0 {
+		b.idleLocked(event, func() any { return payload })
+		b.mu.Unlock()
+		return
+	}
+	b.mu.Unlock()
+	msg := sseFrame(event, payload)
 	b.mu.Lock()
 	defer b.mu.Unlock()
-	bb, _ := json.Marshal(payload)
-	msg := []byte(fmt.Sprintf("event: %s\ndata: %s\n\n", event, string(bb)))
-	for ch := range b.subs {
+	if event == "status" {
+		b.status = msg
+		b.parked = nil
+	}
+	for sub := range b.subs {
+		if event == "status" && sub.pending != nil {
+			// an older status is still parked: replace it rather than queue this
+			// one ahead of it
+			sub.pending = msg
+			continue
+		}
 		select {
-		case ch <- msg:
+		case sub.ch <- msg:
+			sub.strikes = 0
 		default:
-			// drop if slow consumer
+			// slow consumer: a status is parked in the pending slot (it supersedes
+			// the queued ones); any other event is dropped, and the subscriber with
+			// it if it keeps lagging
+			if event == "status" {
+				sub.pending = msg
+				select {
+				case sub.wake <- struct{}{}:
+				default:
+				}
+				continue
+			}
+			sub.strikes++
+			if sub.strikes >= maxStrikes {
+				delete(b.subs, sub)
+				close(sub.ch)
+			}
+		}
+	}
+}
+
+// sseFrame encodes one SSE event. It is built once per publish and the same
+// bytes are queued to every subscriber. The payload is encoded straight into the
+// frame (no intermediate Marshal copy) and without HTML escaping: the page only
+// JSON.parses it, and chat text full of <, > and & would otherwise grow 6x.
+func sseFrame(event string, payload any) []byte {
+	var buf bytes.Buffer
+	buf.Grow(len("event: \ndata: \n\n") + len(event) + 256)
+	buf.WriteString("event: ")
+	buf.WriteString(event)
+	buf.WriteString("\ndata: ")
+	enc := json.NewEncoder(&buf)
+	enc.SetEscapeHTML(false)
+	if enc.Encode(payload) != nil { // Encode ends the data line itself
+		buf.WriteByte('\n')
+	}
+	buf.WriteByte('\n')
+	return buf.Bytes()
+}
+
+// SplitSSEFrames cuts a read buffer into complete SSE events (terminator
+// stripped) and returns the trailing partial event as rest, to be prepended
+// to the next read. It is the receive-side counterpart of sseFrame and scans
+// with bytes.Index, so a chunk holding many events is split in one pass. Only
+// the "\n\n" terminator sseFrame writes is recognized. Frames alias buf.
+func SplitSSEFrames(buf []byte) (frames [][]byte, rest []byte) {
+	for {
+		i := bytes.Index(buf, sseTerminator)
+		if i < 0 {
+			return frames, buf
 		}
+		if i > 0 {
+			frames = append(frames, buf[:i])
+		}
+		buf = buf[i+len(sseTerminator):]
 	}
 }
 
+var sseTerminator = []byte("\n\n")
+
+// Encoded once at init; served as-is on every hit.
+var (
+	// SSE comment line: keeps idle connections open without dispatching an event
+	keepAliveFrame = []byte(": ka\n\n")
+	indexHTMLBytes = []byte(indexHTML)
+	indexHTMLLen   = strconv.Itoa(len(indexHTMLBytes))
+	indexHTMLETag  = func() string {
+		sum := sha256.Sum256(indexHTMLBytes)
+		return `"` + hex.EncodeToString(sum[:8]) + `"`
+	}()
+	indexHeaders = struct{ etag, cacheControl, contentType, contentLength []string }{
+		etag:          []string{indexHTMLETag},
+		cacheControl:  []string{"public, max-age=60"},
+		contentType:   []string{"text/html; charset=utf-8"},
+		contentLength: []string{indexHTMLLen},
+	}
+)
+
 const indexHTML = `<!doctype html>
 <html>
 <head>
@@ -400,8 +755,8 @@ const indexHTML = `<!doctype html>
     const res = await fetch('/api/messages?limit=80');
     const msgs = await res.json();
     chat.innerHTML = '';
-    // API returns newest first (ORDER BY id DESC) -> render newest at the bottom.
-    msgs.reverse().forEach(m => chat.appendChild(renderMsg(m)));
+    // API returns oldest first -> newest ends up at the bottom.
+    msgs.forEach(m => chat.appendChild(renderMsg(m)));
     scrollBottomNow();
   }
 
@@ -506,11 +861,28 @@ const indexHTML = `<!doctype html>
     statusEl.textContent = JSON.stringify(st, null, 2);
   }
 
+  // Reply being generated ("delta" events); replaced by the final reply message.
+  let draft = null;
+  function appendDraft(chunk){
+    if(!draft){
+      draft = document.createElement('div');
+      draft.className = 'msg reply';
+      draft.innerHTML = '<div class="meta"><div><span class="tag">reply</span></div><div>…</div></div><div class="text"></div>';
+      chat.appendChild(draft);
+    }
+    draft.querySelector('.text').textContent += chunk;
+    scrollBottomNow();
+  }
+  function dropDraft(){
+    if(draft){ draft.remove(); draft = null; }
+  }
+
   async function send(){
     const t = (inp.value||'').trim();
     if(!t) return;
     inp.value='';
-    await fetch('/api/send', {method:'POST', headers:{'Content-Type':'application/json'}, body: JSON.stringify({text:t})});
+    const res = await fetch('/api/send', {method:'POST', headers:{'Content-Type':'application/json'}, body: JSON.stringify({text:t})});
+    if(!res.ok) dropDraft();
   }
 
   sendBtn.addEventListener('click', send);
@@ -524,8 +896,13 @@ const indexHTML = `<!doctype html>
     const es = new EventSource('/api/stream');
     es.addEventListener('message', (ev)=>{
       const m = JSON.parse(ev.data);
+      if(m.kind === 'reply') dropDraft();
       addMsgBottom(m);
     });
+    es.addEventListener('delta', (ev)=>{
+      const d = JSON.parse(ev.data);
+      appendDraft(d.chunk || '');
+    });
     es.addEventListener('status', (ev)=>{
       const st = JSON.parse(ev.data);
       statusEl.textContent = JSON.stringify(st, null, 2);
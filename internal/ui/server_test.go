@@ -0,0 +1,270 @@
+package ui
+
+import (
+	"bufio"
+	"context"
+	"fmt"
+	"net/http"
+	"net/http/httptest"
+	"strings"
+	"testing"
+	"time"
+)
+
+func TestBroker_DropsPersistentlySlowSubscriber(t *testing.T) {
+	b := newBroker()
+	sub, cancel := b.subscribe()
+	ch := sub.ch
+	defer cancel()
+
+	for i := 0; i < cap(ch)+maxStrikes; i++ {
+		b.publish("message", i)
+	}
+	n := 0
+	for range ch { // closed by the broker after maxStrikes missed publishes
+		n++
+	}
+	if n != cap(ch) {
+		t.Fatalf("got %d queued events, want %d", n, cap(ch))
+	}
+	if len(b.subs) != 0 {
+		t.Fatalf("slow subscriber still registered")
+	}
+}
+
+func TestBroker_OverflowingStatusIsParkedNewestLast(t *testing.T) {
+	b := newBroker()
+	sub, cancel := b.subscribe()
+	defer cancel()
+
+	last := cap(sub.ch) + maxStrikes - 1
+	for i := 0; i <= last; i++ {
+		b.publish("status", i)
+	}
+	select {
+	case <-sub.wake:
+	default:
+		t.Fatalf("parked status did not wake the stream")
+	}
+	if p := b.takePending(sub); p != nil {
+		t.Fatalf("parked status handed out ahead of %d queued frames", len(sub.ch))
+	}
+	for i := 0; i < cap(sub.ch); i++ {
+		if _, ok := <-sub.ch; !ok {
+			t.Fatalf("subscriber dropped for overflowing status frames")
+		}
+	}
+	if got, want := string(b.takePending(sub)), fmt.Sprintf("data: %d\n", last); !strings.Contains(got, want) {
+		t.Fatalf("parked = %q, want the newest status", got)
+	}
+}
+
+func TestBroker_ReplaysLastStatusToNewSubscriber(t *testing.T) {
+	b := newBroker()
+	b.publish("status", map[string]int{"v": 1})
+	b.publish("status", map[string]int{"v": 2})
+	b.publish("message", "hi")
+
+	sub, cancel := b.subscribe()
+	ch := sub.ch
+	defer cancel()
+	select {
+	case got := <-ch:
+		if want := "event: status\ndata: {\"v\":2}\n\n"; string(got) != want {
+			t.Fatalf("got %q, want %q", got, want)
+		}
+	default:
+		t.Fatalf("no status frame queued for new subscriber")
+	}
+}
+
+func TestReplyStream_CoalescesSmallChunks(t *testing.T) {
+	s := New("")
+	sub, cancel := s.b.subscribe()
+	ch := sub.ch
+	defer cancel()
+
+	push := s.ReplyStream()
+	push("Hal")                   // first piece goes out at once
+	push("lo")                    // small and within the window: held back
+	push(strings.Repeat("x", 64)) // buffer reaches 64 bytes: flushed with "lo"
+
+	want := []string{
+		"event: delta\ndata: {\"chunk\":\"Hal\"}\n\n",
+		"event: delta\ndata: {\"chunk\":\"lo" + strings.Repeat("x", 64) + "\"}\n\n",
+	}
+	for _, w := range want {
+		select {
+		case got := <-ch:
+			if string(got) != w {
+				t.Fatalf("got %q, want %q", got, w)
+			}
+		default:
+			t.Fatalf("missing frame %q", w)
+		}
+	}
+	if len(ch) != 0 {
+		t.Fatalf("unexpected extra frames: %d", len(ch))
+	}
+}
+
+func TestBroker_PublishLatestCoalesces(t *testing.T) {
+	b := newBroker()
+	sub, cancel := b.subscribe()
+	ch := sub.ch
+	defer cancel()
+
+	built := 0
+	for i := 1; i <= 3; i++ {
+		i := i
+		b.publishLatest("status", func() any {
+			built++
+			return map[string]int{"v": i}
+		})
+	}
+	select {
+	case got := <-ch:
+		if want := "event: status\ndata: {\"v\":3}\n\n"; string(got) != want {
+			t.Fatalf("got %q, want %q", got, want)
+		}
+	case <-time.After(time.Second):
+		t.Fatalf("coalesced status was never published")
+	}
+	select {
+	case got := <-ch:
+		t.Fatalf("unexpected extra frame %q", got)
+	case <-time.After(2 * coalesceWindow):
+	}
+	if built != 1 {
+		t.Fatalf("payload built %d times, want 1", built)
+	}
+}
+
+func TestSSEFrame_KeepsHTMLAndTerminatesEvent(t *testing.T) {
+	got := string(sseFrame("message", Message{ID: 1, Text: "a<b>&c"}))
+	want := "event: message\ndata: {\"id\":1,\"created_at\":\"\",\"kind\":\"\",\"text\":\"a<b>&c\"}\n\n"
+	if got != want {
+		t.Fatalf("frame = %q, want %q", got, want)
+	}
+}
+
+func TestSplitSSEFrames_CarriesPartialFrame(t *testing.T) {
+	stream := append(sseFrame("message", Message{ID: 1, Text: "a"}), keepAliveFrame...)
+	stream = append(stream, sseFrame("delta", replyDelta{Chunk: "b"})...)
+	cut := len(stream) - 5
+
+	frames, rest := SplitSSEFrames(stream[:cut])
+	if len(frames) != 2 || !strings.HasPrefix(string(frames[0]), "event: message\n") || string(frames[1]) != ": ka" {
+		t.Fatalf("frames = %q", frames)
+	}
+	more, rest := SplitSSEFrames(append(append([]byte(nil), rest...), stream[cut:]...))
+	if len(more) != 1 || string(more[0]) != "event: delta\ndata: {\"chunk\":\"b\"}" || len(rest) != 0 {
+		t.Fatalf("frames = %q, rest = %q", more, rest)
+	}
+}
+
+func TestWriteQueued_BoundsOneBatch(t *testing.T) {
+	small := make(chan []byte, 2*sseBatchFrames)
+	for i := 0; i < cap(small); i++ {
+		small <- []byte(": x\n\n")
+	}
+	var buf strings.Builder
+	if open, err := writeQueued(&buf, small, 0); !open || err != nil {
+		t.Fatalf("open=%v err=%v", open, err)
+	}
+	if len(small) != sseBatchFrames {
+		t.Fatalf("left %d frames queued, want %d", len(small), sseBatchFrames)
+	}
+
+	big := make(chan []byte, 4)
+	for i := 0; i < cap(big); i++ {
+		big <- make([]byte, sseBatchBytes/2)
+	}
+	close(big)
+	buf.Reset()
+	if open, _ := writeQueued(&buf, big, 0); !open || buf.Len() != sseBatchBytes {
+		t.Fatalf("open=%v wrote %d bytes, want %d", open, buf.Len(), sseBatchBytes)
+	}
+	writeQueued(&buf, big, 0)
+	if open, _ := writeQueued(&buf, big, 0); open {
+		t.Fatalf("closed channel reported open")
+	}
+}
+
+func TestBroker_SharesOneFrameAcrossSubscribers(t *testing.T) {
+	b := newBroker()
+	sub1, cancel1 := b.subscribe()
+	ch1 := sub1.ch
+	defer cancel1()
+	sub2, cancel2 := b.subscribe()
+	ch2 := sub2.ch
+	defer cancel2()
+
+	b.publish("message", Message{ID: 7, Text: "hi"})
+	f1, f2 := <-ch1, <-ch2
+	if len(f1) == 0 || &f1[0] != &f2[0] {
+		t.Fatalf("subscribers got separately encoded frames")
+	}
+}
+
+func TestBroker_SkipsEncodingWithoutSubscribers(t *testing.T) {
+	b := newBroker()
+	built := 0
+	for i := 0; i < 3; i++ {
+		b.publishLatest("status", func() any {
+			built++
+			return map[string]int{"v": 1}
+		})
+	}
+	if len(b.latest) != 0 || built != 0 {
+		t.Fatalf("status scheduled/built with no subscribers (pending=%d built=%d)", len(b.latest), built)
+	}
+
+	sub, cancel := b.subscribe()
+	ch := sub.ch
+	defer cancel()
+	if got, want := string(<-ch), "event: status\ndata: {\"v\":1}\n\n"; got != want || built != 1 {
+		t.Fatalf("replay = %q (built %d times), want %q built once", got, built, want)
+	}
+}
+
+func TestStream_IdleLongerThanWriteTimeoutStaysOpen(t *testing.T) {
+	oldTimeout, oldKeep := sseWriteTimeout, sseKeepAlive
+	sseWriteTimeout, sseKeepAlive = 50*time.Millisecond, 150*time.Millisecond
+	defer func() { sseWriteTimeout, sseKeepAlive = oldTimeout, oldKeep }()
+
+	ctx, stop := context.WithCancel(context.Background())
+	defer stop()
+	ts := httptest.NewServer(New("").handleStream(ctx))
+	defer ts.Close()
+
+	resp, err := http.Get(ts.URL)
+	if err != nil {
+		t.Fatal(err)
+	}
+	defer resp.Body.Close()
+
+	lines := make(chan string)
+	go func() {
+		sc := bufio.NewScanner(resp.Body)
+		for sc.Scan() {
+			lines <- sc.Text()
+		}
+		close(lines)
+	}()
+	// the initial keepalive plus three from the ticker, all well past the write timeout
+	deadline := time.After(2 * time.Second)
+	for kas := 0; kas < 4; {
+		select {
+		case line, ok := <-lines:
+			if !ok {
+				t.Fatalf("idle stream closed after %d keepalives", kas)
+			}
+			if line == ": ka" {
+				kas++
+			}
+		case <-deadline:
+			t.Fatalf("timed out waiting for keepalives")
+		}
+	}
+}
@@ -1,12 +1,13 @@
 package websense
 
 import (
+	"context"
+	"crypto/sha256"
 	"errors"
-	"io"
 	"net/http"
 	"net/url"
-	"regexp"
 	"strings"
+	"sync"
 	"time"
 )
 
@@ -16,6 +17,9 @@ type SpiderBudget struct {
 	PerDomainMax  int
 	Timeout       time.Duration
 	MaxLinksPerPage int
+	// MaxWall bounds the whole crawl: no wave starts after it, and fetches still in
+	// flight are cancelled and dropped. Default: 2*Timeout.
+	MaxWall time.Duration
 }
 
 // Spider crawls starting from seed URLs, following href links with a simple BFS.
@@ -39,92 +43,147 @@ func Spider(seeds []string, bud SpiderBudget) ([]*FetchResult, error) {
 	if bud.MaxLinksPerPage <= 0 {
 		bud.MaxLinksPerPage = 12
 	}
+	if bud.MaxWall <= 0 {
+		bud.MaxWall = 2 * bud.Timeout
+	}
+	ctx, cancel := context.WithTimeout(context.Background(), bud.MaxWall)
+	defer cancel()
 
 	seen := map[string]bool{}
-	dCount := map[string]int{}
-	queue := make([]string, 0, len(seeds))
+	dCount := map[string]int{} // pages kept per domain, as in the sequential crawl
+	seenBody := map[[sha256.Size]byte]bool{}
+	queue := make([]frontierURL, 0, len(seeds))
 	for _, s := range seeds {
 		u := normalizeResultURL(s)
 		if u == "" || seen[u] { continue }
 		seen[u] = true
-		queue = append(queue, u)
+		queue = append(queue, frontierURL{raw: u})
 	}
 
-	client := &http.Client{Timeout: bud.Timeout}
+	client := &http.Client{Timeout: bud.Timeout, Transport: transport}
 	var out []*FetchResult
 	var used int64
 
-	for len(queue) > 0 && len(out) < bud.MaxPages && used < bud.MaxBytesTotal {
-		u := queue[0]
-		queue = queue[1:]
+	// queue[head:] is the frontier; popping is just head++.
+	head := 0
+	for head < len(queue) && len(out) < bud.MaxPages && used < bud.MaxBytesTotal && ctx.Err() == nil {
+		// Next wave: up to spiderParallel URLs that still fit the page and per-domain
+		// budgets. A domain whose kept pages plus this wave's fetches reach the cap is
+		// only full if those fetches all succeed, so its further URLs are deferred to
+		// the next wave rather than dropped.
+		var wave []spiderPage
+		var deferred []frontierURL
+		reserved := map[string]int{}
+		for head < len(queue) && len(wave) < spiderParallel && len(out)+len(wave) < bud.MaxPages {
+			f := queue[head]
+			head++
 
-		pu, err := url.Parse(u)
-		if err != nil || pu.Hostname() == "" {
-			continue
+			pu := f.parsed
+			if pu == nil {
+				var err error
+				if pu, err = url.Parse(f.raw); err != nil {
+					continue
+				}
+			}
+			if pu.Hostname() == "" {
+				continue
+			}
+			dom := strings.ToLower(pu.Hostname())
+			if dCount[dom] >= bud.PerDomainMax {
+				continue
+			}
+			if dCount[dom]+reserved[dom] >= bud.PerDomainMax {
+				deferred = append(deferred, frontierURL{raw: f.raw, parsed: pu})
+				continue
+			}
+			reserved[dom]++
+			wave = append(wave, spiderPage{url: f.raw, base: pu, dom: dom})
 		}
-		dom := strings.ToLower(pu.Hostname())
-		if dCount[dom] >= bud.PerDomainMax {
-			continue
+		if len(wave) == 0 {
+			break
 		}
+		// back to the front of the frontier, in queue order (their slots are consumed)
+		head -= len(deferred)
+		copy(queue[head:], deferred)
 
-		req, _ := http.NewRequest("GET", u, nil)
-		applyDefaultHeaders(req)
-		resp, err := client.Do(req)
-		if err != nil {
-			continue
-		}
-		b, _ := io.ReadAll(io.LimitReader(resp.Body, 1_500_000))
-		resp.Body.Close()
-		used += int64(len(b))
-		if used >= bud.MaxBytesTotal {
-			break
+		// The crawl is network-bound: fetch the wave concurrently, then reduce in
+		// queue order so budgets and link order stay as in the sequential BFS.
+		var wg sync.WaitGroup
+		for i := range wave {
+			wg.Add(1)
+			go func(p *spiderPage) {
+				defer wg.Done()
+				// PDFs, images, JSON, ...: nothing to read or follow, the body is never downloaded
+				p.body, p.ct, p.err = get(ctx, client, p.url, 1_500_000, "spider", isTextContent)
+			}(&wave[i])
 		}
+		wg.Wait()
 
-		page := string(b)
-		ct := strings.ToLower(resp.Header.Get("Content-Type"))
-		if strings.Contains(ct, "text/html") || ct == "" {
-			links := extractLinks(page, u, bud.MaxLinksPerPage)
-			for _, lk := range links {
-				n := normalizeResultURL(lk)
+		for _, p := range wave {
+			if p.err != nil {
+				continue
+			}
+			used += int64(len(p.body))
+			if used >= bud.MaxBytesTotal {
+				break
+			}
+			// mirrors, AMP and query-string variants: identical bytes are processed once
+			sum := sha256.Sum256(p.body)
+			if seenBody[sum] {
+				continue
+			}
+			seenBody[sum] = true
+
+			fr, hrefs := processPage(p.body, p.ct, p.url, p.dom, bud.MaxLinksPerPage)
+			for _, lk := range resolveLinks(hrefs, p.base) {
+				s := lk.String()
+				n := normalizeResultURL(s)
 				if n == "" || seen[n] {
 					continue
 				}
 				seen[n] = true
-				queue = append(queue, n)
+				if n != s {
+					lk = nil // DDG redirect etc.: parse the target when it is popped
+				}
+				queue = append(queue, frontierURL{raw: n, parsed: lk})
 			}
+			out = append(out, fr)
+			dCount[p.dom]++
 		}
-
-		// reuse existing cleaner (stripHTML + normalizeWhitespace) via Fetch-style logic
-		txt := normalizeWhitespace(stripHTML(page))
-		fr := &FetchResult{
-			Title:     extractTitle(page),
-			URL:       u,
-			Text:      txt,
-			Snippet:   func() string { if len(txt) > 420 { return txt[:420] }; return txt }(),
-			Body:      func() string { if len(txt) > 3000 { return txt[:3000] }; return txt }(),
-			FetchedAt: time.Now(),
-			Domain:    dom,
-		}
-		out = append(out, fr)
-		dCount[dom]++
 	}
 
 	return out, nil
 }
 
-func extractLinks(htmlPage string, base string, max int) []string {
-	if max <= 0 {
-		max = 12
-	}
-	re := regexp.MustCompile(`(?is)href=["']([^"'#]+)["']`)
-	m := re.FindAllStringSubmatch(htmlPage, max)
-	out := make([]string, 0, len(m))
-	baseU, _ := url.Parse(base)
-	for _, mm := range m {
-		if len(mm) < 2 {
-			continue
-		}
-		h := strings.TrimSpace(mm[1])
+// spiderParallel bounds the number of in-flight fetches per crawl wave.
+const spiderParallel = 8
+
+// frontierURL is a queued URL; parsed is kept when it is already known (resolved
+// links), so popping it does not parse the same string again.
+type frontierURL struct {
+	raw    string
+	parsed *url.URL
+}
+
+type spiderPage struct {
+	url  string
+	base *url.URL
+	dom  string
+	ct   string
+	body []byte
+	err  error
+}
+
+// isTextContent mirrors Fetch: HTML, plain text, or an unlabeled body.
+func isTextContent(ct string) bool {
+	return ct == "" || strings.Contains(ct, "text/html") || strings.Contains(ct, "text/plain") || strings.Contains(ct, "xhtml")
+}
+
+// resolveLinks resolves raw href values against the page URL.
+func resolveLinks(hrefs []string, baseU *url.URL) []*url.URL {
+	out := make([]*url.URL, 0, len(hrefs))
+	for _, h := range hrefs {
+		h = strings.TrimSpace(h)
 		if h == "" {
 			continue
 		}
@@ -135,7 +194,7 @@ func extractLinks(htmlPage string, base string, max int) []string {
 		if baseU != nil {
 			u = baseU.ResolveReference(u)
 		}
-		out = append(out, u.String())
+		out = append(out, u)
 	}
 	return out
 }
@@ -1,6 +1,7 @@
 package websense
 
 import (
+	"context"
 	"crypto/sha256"
 	"encoding/hex"
 	"errors"
@@ -8,9 +9,10 @@ import (
 	"io"
 	"net/http"
 	"net/url"
-	"regexp"
 	"strings"
+	"sync"
 	"time"
+	"unicode/utf8"
 )
 
 type SearchResult struct {
@@ -22,7 +24,6 @@ type SearchResult struct {
 type FetchResult struct {
 	Title     string
 	URL       string
-	Text      string
 	Snippet   string
 	Body      string // first 3000 chars for LLM context
 	Hash      string
@@ -30,8 +31,21 @@ type FetchResult struct {
 	Domain    string
 }
 
+// transport is shared by Search, Fetch and Spider so repeated hits on the same
+// host (DDG, the pages of one site during a crawl) reuse their TCP/TLS
+// connections. Leaving Accept-Encoding unset lets it negotiate gzip itself.
+var transport = &http.Transport{
+	Proxy:               http.ProxyFromEnvironment,
+	ForceAttemptHTTP2:   true,
+	MaxIdleConns:        64,
+	MaxIdleConnsPerHost: 16,
+	IdleConnTimeout:     90 * time.Second,
+	TLSHandshakeTimeout: 10 * time.Second,
+}
+
 var httpClient = &http.Client{
-	Timeout: 12 * time.Second,
+	Timeout:   12 * time.Second,
+	Transport: transport,
 }
 
 // DuckDuckGo HTML (v0, aber: robustere Links + Snippets).
@@ -42,46 +56,28 @@ func Search(query string, k int) ([]SearchResult, error) {
 	q := url.QueryEscape(query)
 	u := "https://duckduckgo.com/html/?q=" + q
 
-	req, _ := http.NewRequest("GET", u, nil)
-	applyDefaultHeaders(req)
-	resp, err := httpClient.Do(req)
+	b, _, err := get(context.Background(), httpClient, u, 2_000_000, "search", nil)
 	if err != nil {
 		return nil, err
 	}
-	defer resp.Body.Close()
-	if resp.StatusCode >= 400 {
-		return nil, errors.New("search http status: " + resp.Status)
-	}
-
-	b, _ := io.ReadAll(io.LimitReader(resp.Body, 2_000_000))
 	page := string(b)
 
-	// Titles/URLs
-	reA := regexp.MustCompile(`(?is)<a[^>]*class="result__a"[^>]*href="([^"]+)"[^>]*>(.*?)</a>`)
-	mA := reA.FindAllStringSubmatch(page, k)
-
-	// Snippets (DDG nutzt je nach Variante <a> oder <div>)
-	var snippets []string
-	reSnipA := regexp.MustCompile(`(?is)<a[^>]*class="result__snippet"[^>]*>(.*?)</a>`)
-	for _, mm := range reSnipA.FindAllStringSubmatch(page, k) {
-		snippets = append(snippets, normalizeWhitespace(stripHTML(mm[1])))
-	}
+	// Titles/URLs + snippets (DDG nutzt je nach Variante <a> oder <div>), one scan
+	hits, snipA, snipDiv := scanDDG(page, k)
+	snippets := snipA
 	if len(snippets) == 0 {
-		reSnipD := regexp.MustCompile(`(?is)<div[^>]*class="result__snippet"[^>]*>(.*?)</div>`)
-		for _, mm := range reSnipD.FindAllStringSubmatch(page, k) {
-			snippets = append(snippets, normalizeWhitespace(stripHTML(mm[1])))
-		}
+		snippets = snipDiv
 	}
 
-	out := make([]SearchResult, 0, len(mA))
-	for i, mm := range mA {
-		raw := html.UnescapeString(mm[1])
+	out := make([]SearchResult, 0, len(hits))
+	for i, h := range hits {
+		raw := html.UnescapeString(h.href)
 		link := normalizeResultURL(raw)
-		title := normalizeWhitespace(stripHTML(mm[2]))
+		title := normalizeWhitespace(stripHTML(h.inner))
 
 		snip := ""
 		if i < len(snippets) {
-			snip = snippets[i]
+			snip = normalizeWhitespace(stripHTML(snippets[i]))
 		}
 		out = append(out, SearchResult{
 			Title:   title,
@@ -102,59 +98,130 @@ func Fetch(rawURL string) (*FetchResult, error) {
 		return nil, errors.New("fetch: missing scheme")
 	}
 
-	req, _ := http.NewRequest("GET", normalized, nil)
-	applyDefaultHeaders(req)
-	resp, err := httpClient.Do(req)
+	b, ct, err := get(context.Background(), httpClient, normalized, 3_000_000, "fetch", nil)
 	if err != nil {
 		return nil, err
 	}
-	defer resp.Body.Close()
-	if resp.StatusCode >= 400 {
-		return nil, errors.New("fetch http status: " + resp.Status)
-	}
+	fr, _ := processPage(b, ct, normalized, pu.Hostname(), 0)
+	return fr, nil
+}
 
-	ct := strings.ToLower(resp.Header.Get("Content-Type"))
-	b, _ := io.ReadAll(io.LimitReader(resp.Body, 3_000_000))
+// FetchMany fetches urls concurrently and returns the results in input order;
+// failed fetches leave a nil entry.
+func FetchMany(urls []string) []*FetchResult {
+	out := make([]*FetchResult, len(urls))
+	var wg sync.WaitGroup
+	for i, u := range urls {
+		wg.Add(1)
+		go func(i int, u string) {
+			defer wg.Done()
+			if fr, err := Fetch(u); err == nil {
+				out[i] = fr
+			}
+		}(i, u)
+	}
+	wg.Wait()
+	return out
+}
 
-	var text string
+// processPage is the per-page pipeline shared by Fetch and Spider: one scan for
+// text/title/links, whitespace normalization, hash and the clipped views.
+// It also returns up to maxLinks raw hrefs for HTML pages.
+func processPage(b []byte, ct, pageURL, dom string, maxLinks int) (*FetchResult, []string) {
+	var text, title string
+	var hrefs []string
 	if strings.Contains(ct, "text/plain") {
 		text = normalizeWhitespace(html.UnescapeString(string(b)))
 	} else {
 		// default: treat as html
-		page := string(b)
-		text = normalizeWhitespace(stripHTML(page))
-	}
-
-	title := ""
-	if strings.Contains(ct, "text/html") || ct == "" {
-		title = extractTitle(string(b))
+		isHTML := strings.Contains(ct, "text/html") || ct == ""
+		if !isHTML {
+			maxLinks = 0
+		}
+		ps := scanHTML(string(b), maxLinks)
+		text = normalizeWhitespace(ps.text)
+		if isHTML {
+			title = normalizeWhitespace(stripHTML(ps.title))
+			hrefs = ps.hrefs
+		}
 	}
 
-	h := sha256.Sum256([]byte(text))
-	hash := hex.EncodeToString(h[:])
+	// Longer body for LLM context (first 3000 chars of clean text). Cloned so the
+	// result doesn't pin the whole page text; the snippet shares the body.
+	body := strings.Clone(clipUTF8(text, 3000))
 
 	// Short snippet for display/storage (420 chars)
-	snippet := text
-	if len(snippet) > 420 {
-		snippet = snippet[:420]
-	}
-
-	// Longer body for LLM context (first 3000 chars of clean text)
-	body := text
-	if len(body) > 3000 {
-		body = body[:3000]
-	}
+	snippet := clipUTF8(body, 420)
 
 	return &FetchResult{
 		Title:     title,
-		URL:       normalized,
-		Text:      text,
+		URL:       pageURL,
 		Snippet:   snippet,
 		Body:      body,
-		Hash:      hash,
+		Hash:      textHash(text),
 		FetchedAt: time.Now(),
-		Domain:    pu.Hostname(),
-	}, nil
+		Domain:    dom,
+	}, hrefs
+}
+
+// clipUTF8 cuts s to at most n bytes without splitting a multi-byte rune.
+func clipUTF8(s string, n int) string {
+	if len(s) <= n {
+		return s
+	}
+	for n > 0 && !utf8.RuneStart(s[n]) {
+		n--
+	}
+	return s[:n]
+}
+
+// hashBufs recycles the chunk buffers textHash feeds the digest with; a local
+// array would escape through the hash.Hash interface on every call.
+var hashBufs = sync.Pool{New: func() any { return new([32 << 10]byte) }}
+
+// textHash is the hex SHA-256 of s. The text is fed through a pooled buffer
+// instead of converting the whole page to a []byte copy first.
+func textHash(s string) string {
+	h := sha256.New()
+	buf := hashBufs.Get().(*[32 << 10]byte)
+	for len(s) > 0 {
+		n := copy(buf[:], s)
+		h.Write(buf[:n])
+		s = s[n:]
+	}
+	hashBufs.Put(buf)
+	var sum [sha256.Size]byte
+	return hex.EncodeToString(h.Sum(sum[:0]))
+}
+
+// get is the one GET path of the package (Search, Fetch, Spider): browser-like
+// headers, error on HTTP >= 400, body capped at limit. It returns the
+// lower-cased Content-Type too; if accept is set and rejects it, the body is
+// not read at all.
+func get(ctx context.Context, client *http.Client, u string, limit int64, what string, accept func(ct string) bool) ([]byte, string, error) {
+	req, err := http.NewRequestWithContext(ctx, "GET", u, nil)
+	if err != nil {
+		return nil, "", err
+	}
+	applyDefaultHeaders(req)
+	resp, err := client.Do(req)
+	if err != nil {
+		return nil, "", err
+	}
+	defer resp.Body.Close()
+	if resp.StatusCode >= 400 {
+		return nil, "", errors.New(what + " http status: " + resp.Status)
+	}
+	ct := strings.ToLower(resp.Header.Get("Content-Type"))
+	if accept != nil && !accept(ct) {
+		return nil, ct, errors.New(what + ": unwanted content type " + ct)
+	}
+	b, err := io.ReadAll(io.LimitReader(resp.Body, limit))
+	if err != nil && ctx.Err() != nil {
+		// cut off by the caller's deadline: a truncated page is not a result
+		return nil, ct, ctx.Err()
+	}
+	return b, ct, nil
 }
 
 func applyDefaultHeaders(req *http.Request) {
@@ -162,15 +229,17 @@ func applyDefaultHeaders(req *http.Request) {
 	req.Header.Set("User-Agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36")
 	req.Header.Set("Accept", "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8")
 	req.Header.Set("Accept-Language", "de-DE,de;q=0.9,en;q=0.7")
-	req.Header.Set("Connection", "close")
 }
 
 func normalizeResultURL(u string) string {
 	u = strings.TrimSpace(u)
+	if u == "" || (u[0] != '/' && u[0] != 'h') {
+		return u
+	}
 	if strings.HasPrefix(u, "//") {
-		return "https:" + u
+		u = "https:" + u
 	}
-	// DDG redirect: /l/?uddg=...
+	// DDG redirect: /l/?uddg=... (relative, protocol-relative or absolute)
 	if strings.HasPrefix(u, "/l/?") {
 		return decodeDDGRedirect("https://duckduckgo.com" + u)
 	}
@@ -196,26 +265,233 @@ func decodeDDGRedirect(ddg string) string {
 	return decoded
 }
 
-func extractTitle(page string) string {
-	re := regexp.MustCompile(`(?is)<title[^>]*>(.*?)</title>`)
-	m := re.FindStringSubmatch(page)
-	if len(m) < 2 {
-		return ""
+// pageScan is what one pass over an HTML page yields.
+type pageScan struct {
+	text  string   // tags stripped, entities unescaped (whitespace not yet normalized)
+	title string   // raw inner HTML of the first <title>
+	hrefs []string // raw href values without '#', in document order
+}
+
+// scanHTML walks the page once: it drops tags and <script>/<style> bodies (every
+// tag becomes one space), remembers the first <title> and collects up to maxLinks
+// href values on the way.
+func scanHTML(s string, maxLinks int) pageScan {
+	var ps pageScan
+	if strings.IndexByte(s, '<') < 0 {
+		// plain text served as HTML (or an error body): nothing to strip
+		ps.text = html.UnescapeString(s)
+		return ps
+	}
+	var b strings.Builder
+	b.Grow(len(s))
+	titleStart := -1
+	for i := 0; i < len(s); {
+		j := strings.IndexByte(s[i:], '<')
+		if j < 0 {
+			b.WriteString(s[i:])
+			break
+		}
+		b.WriteString(s[i : i+j])
+		i += j
+		end := strings.IndexByte(s[i+1:], '>')
+		if end <= 0 {
+			// "<>" or an unterminated '<' is text, not a tag
+			b.WriteByte('<')
+			i++
+			continue
+		}
+		open := i
+		tag := s[i+1 : i+1+end]
+		i += end + 2
+		b.WriteByte(' ')
+
+		name := tagName(tag)
+		switch {
+		case strings.EqualFold(name, "script"), strings.EqualFold(name, "style"):
+			if _, k := indexCloseTag(s[i:], name); k >= 0 {
+				i += k
+			}
+			continue
+		case strings.EqualFold(name, "title"):
+			if titleStart < 0 {
+				titleStart = i
+			}
+		case strings.EqualFold(name, "/title"):
+			if titleStart >= 0 && ps.title == "" {
+				ps.title = s[titleStart:open]
+			}
+		}
+		if len(ps.hrefs) < maxLinks {
+			if h := hrefAttr(tag); h != "" {
+				ps.hrefs = append(ps.hrefs, h)
+			}
+		}
 	}
-	return normalizeWhitespace(stripHTML(m[1]))
+	ps.text = html.UnescapeString(b.String())
+	return ps
 }
 
+// stripHTML drops tags and <script>/<style> bodies and unescapes entities.
 func stripHTML(s string) string {
-	reSS := regexp.MustCompile(`(?is)<(script|style)[^>]*>.*?</(script|style)>`)
-	s = reSS.ReplaceAllString(s, " ")
-	reT := regexp.MustCompile(`(?is)<[^>]+>`)
-	s = reT.ReplaceAllString(s, " ")
-	return html.UnescapeString(s)
+	return scanHTML(s, 0).text
+}
+
+// tagName returns the element name of tag (the text between '<' and '>'), e.g.
+// "a" or "/title".
+func tagName(tag string) string {
+	n := 0
+	if n < len(tag) && tag[n] == '/' {
+		n++
+	}
+	for n < len(tag) && tag[n] != ' ' && tag[n] != '\t' && tag[n] != '\n' && tag[n] != '\r' && tag[n] != '/' {
+		n++
+	}
+	return tag[:n]
+}
+
+// hrefAttr returns the quoted href value of tag, or "" if there is none or it
+// carries a fragment.
+func hrefAttr(tag string) string {
+	for i := 0; i+6 < len(tag); i++ {
+		if (tag[i] != 'h' && tag[i] != 'H') || !strings.EqualFold(tag[i:i+5], "href=") {
+			continue
+		}
+		q := tag[i+5]
+		if q != '"' && q != '\'' {
+			continue
+		}
+		v := tag[i+6:]
+		e := strings.IndexByte(v, q)
+		if e <= 0 {
+			return ""
+		}
+		v = v[:e]
+		if strings.ContainsAny(v, "#\"'") {
+			return ""
+		}
+		return v
+	}
+	return ""
+}
+
+// indexCloseTag finds the first </name> in s (case-insensitive) and returns the
+// offsets of its '<' and just past its '>', or -1, -1.
+func indexCloseTag(s, name string) (int, int) {
+	for i := 0; ; {
+		j := strings.Index(s[i:], "</")
+		if j < 0 {
+			return -1, -1
+		}
+		start := i + j
+		i = start + 2
+		if len(s)-i <= len(name) || !strings.EqualFold(s[i:i+len(name)], name) {
+			continue
+		}
+		switch s[i+len(name)] {
+		case '>', ' ', '\t', '\n', '\r':
+		default:
+			continue // e.g. </abbr> when looking for </a>
+		}
+		k := strings.IndexByte(s[i+len(name):], '>')
+		if k < 0 {
+			return -1, -1
+		}
+		return start, i + len(name) + k + 1
+	}
+}
+
+type ddgHit struct {
+	href  string
+	inner string
 }
 
+// scanDDG walks the DDG HTML result page once and collects up to k result
+// anchors (class="result__a") and snippets, both the <a> and the <div> variant.
+// Inner HTML is returned raw; callers strip it.
+func scanDDG(page string, k int) (hits []ddgHit, snipA, snipDiv []string) {
+	const marker = `class="result__`
+	for i := 0; ; {
+		j := strings.Index(page[i:], marker)
+		if j < 0 {
+			return
+		}
+		at := i + j
+		i = at + len(marker)
+
+		open := strings.LastIndexByte(page[:at], '<')
+		if open < 0 || strings.IndexByte(page[open:at], '>') >= 0 {
+			continue // marker is not inside a tag
+		}
+		gt := strings.IndexByte(page[at:], '>')
+		if gt < 0 {
+			return
+		}
+		tag := page[open+1 : at+gt]
+		cls := page[i:]
+		q := strings.IndexByte(cls, '"')
+		if q < 0 {
+			return
+		}
+		cls = cls[:q]
+
+		name := tag
+		if n := strings.IndexAny(name, " \t\n\r"); n >= 0 {
+			name = name[:n]
+		}
+		isA := strings.EqualFold(name, "a")
+		isDiv := strings.EqualFold(name, "div")
+		if !(isA && cls == "a" && len(hits) < k) &&
+			!(isA && cls == "snippet" && len(snipA) < k) &&
+			!(isDiv && cls == "snippet" && len(snipDiv) < k) {
+			continue
+		}
+
+		body := page[at+gt+1:]
+		cs, ce := indexCloseTag(body, name)
+		if cs < 0 {
+			continue
+		}
+		inner := body[:cs]
+		i = at + gt + 1 + ce
+
+		switch {
+		case cls == "snippet" && isA:
+			snipA = append(snipA, inner)
+		case cls == "snippet":
+			snipDiv = append(snipDiv, inner)
+		default:
+			h := strings.Index(tag, `href="`)
+			if h < 0 {
+				continue
+			}
+			href := tag[h+len(`href="`):]
+			if e := strings.IndexByte(href, '"'); e > 0 {
+				hits = append(hits, ddgHit{href: href[:e], inner: inner})
+			}
+		}
+	}
+}
+
+// normalizeWhitespace collapses runs of ASCII whitespace and NBSP into one space
+// and trims both ends, in a single pass.
 func normalizeWhitespace(s string) string {
-	s = strings.ReplaceAll(s, "\u00a0", " ")
-	re := regexp.MustCompile(`\s+`)
-	s = re.ReplaceAllString(s, " ")
-	return strings.TrimSpace(s)
+	var b strings.Builder
+	b.Grow(len(s))
+	pending := false
+	for i := 0; i < len(s); i++ {
+		switch c := s[i]; {
+		case c == ' ' || c == '\t' || c == '\n' || c == '\r' || c == '\f':
+			pending = true
+		case c == 0xC2 && i+1 < len(s) && s[i+1] == 0xA0: // U+00A0
+			pending = true
+			i++
+		default:
+			if pending && b.Len() > 0 {
+				b.WriteByte(' ')
+			}
+			pending = false
+			b.WriteByte(c)
+		}
+	}
+	return b.String()
 }
@@ -0,0 +1,232 @@
+package websense
+
+import (
+	"crypto/sha256"
+	"encoding/hex"
+	"fmt"
+	"net/http"
+	"net/http/httptest"
+	"strings"
+	"testing"
+	"time"
+	"unicode/utf8"
+)
+
+func TestStripHTML(t *testing.T) {
+	cases := []struct {
+		in, want string
+	}{
+		{"<p>Hallo <b>Welt</b></p>", "Hallo Welt"},
+		{"a<script type=\"x\">var x = '<p>';</script>b", "a b"},
+		{"a<STYLE>p{}</Style >b", "a b"},
+		{"a &lt; b &amp; c", "a < b & c"},
+		{"1 < 2", "1 < 2"},
+		{"x<>y", "x<>y"},
+		{"<script>never closed", "never closed"},
+	}
+	for _, c := range cases {
+		if got := normalizeWhitespace(stripHTML(c.in)); got != c.want {
+			t.Errorf("stripHTML(%q) = %q, want %q", c.in, got, c.want)
+		}
+	}
+}
+
+func TestSpider_RespectsPageBudget(t *testing.T) {
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Header().Set("Content-Type", "text/html")
+		fmt.Fprintf(w, `<title>%s</title><a href="/a%s">a</a><a href="/b%s">b</a>`, r.URL.Path, r.URL.Path, r.URL.Path)
+	}))
+	defer srv.Close()
+
+	out, err := Spider([]string{srv.URL + "/"}, SpiderBudget{MaxPages: 4, PerDomainMax: 10})
+	if err != nil {
+		t.Fatal(err)
+	}
+	if len(out) != 4 {
+		t.Fatalf("got %d pages, want 4", len(out))
+	}
+	if out[0].URL != srv.URL+"/" || out[0].Title != "/" {
+		t.Fatalf("first page should be the seed, got %q (%q)", out[0].URL, out[0].Title)
+	}
+}
+
+func TestSpider_StopsAtWallBudget(t *testing.T) {
+	release := make(chan struct{})
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Header().Set("Content-Type", "text/html")
+		if r.URL.Path == "/slow" {
+			select {
+			case <-release:
+			case <-r.Context().Done():
+			}
+			return
+		}
+		fmt.Fprint(w, `<title>fast</title><a href="/slow">slow</a>`)
+	}))
+	defer srv.Close()
+	defer close(release)
+
+	start := time.Now()
+	out, err := Spider([]string{srv.URL + "/"}, SpiderBudget{MaxPages: 4, PerDomainMax: 10, MaxWall: 200 * time.Millisecond})
+	if err != nil {
+		t.Fatal(err)
+	}
+	if d := time.Since(start); d > 2*time.Second {
+		t.Fatalf("crawl took %v, want it cut off near MaxWall", d)
+	}
+	if len(out) != 1 || out[0].Title != "fast" {
+		t.Fatalf("got %d pages, want only the fast seed", len(out))
+	}
+}
+
+func TestScanDDG(t *testing.T) {
+	page := `<div class="result"><h2><a rel="nofollow" class="result__a" href="//duckduckgo.com/l/?uddg=https%3A%2F%2Fexample.org%2Fx">Example <b>X</b></a></h2>
+<a class="result__snippet" href="#">Snippet <abbr>one</abbr> here</a></div>
+<div class="result"><a class="result__a" href="https://b.example/">B</a><div class="result__snippet">Div snippet</div></div>`
+
+	hits, snipA, snipDiv := scanDDG(page, 6)
+	if len(hits) != 2 || hits[0].inner != "Example <b>X</b>" || hits[1].href != "https://b.example/" {
+		t.Fatalf("hits = %+v", hits)
+	}
+	if len(snipA) != 1 || snipA[0] != "Snippet <abbr>one</abbr> here" {
+		t.Fatalf("snipA = %q", snipA)
+	}
+	if len(snipDiv) != 1 || snipDiv[0] != "Div snippet" {
+		t.Fatalf("snipDiv = %q", snipDiv)
+	}
+	if got := normalizeResultURL(hits[0].href); got != "https://example.org/x" {
+		t.Fatalf("normalizeResultURL = %q", got)
+	}
+
+	if hits, _, _ := scanDDG(page, 1); len(hits) != 1 {
+		t.Fatalf("k=1 returned %d hits", len(hits))
+	}
+}
+
+func TestScanHTML_TitleAndLinks(t *testing.T) {
+	page := `<html><head><TITLE>Ein &amp; Alles</TITLE><script>var a = '<a href="/js">';</script></head>
+<body><a href="/x">x</a> <A HREF='https://b.example/y'>y</A> <a href="/z#frag">z</a> <a href="/w">w</a></body></html>`
+	ps := scanHTML(page, 2)
+	if got := normalizeWhitespace(stripHTML(ps.title)); got != "Ein & Alles" {
+		t.Fatalf("title = %q", got)
+	}
+	if len(ps.hrefs) != 2 || ps.hrefs[0] != "/x" || ps.hrefs[1] != "https://b.example/y" {
+		t.Fatalf("hrefs = %q", ps.hrefs)
+	}
+	if got := normalizeWhitespace(ps.text); got != "Ein & Alles x y z w" {
+		t.Fatalf("text = %q", got)
+	}
+}
+
+func TestNormalizeWhitespace(t *testing.T) {
+	cases := map[string]string{
+		"":                    "",
+		"  a  b ":             "a b",
+		"a\u00a0\u00a0b\t\nc": "a b c",
+		"\u00a0x\u00a0":       "x",
+		"über  straße":        "über straße",
+		"a\r\n\fb":            "a b",
+	}
+	for in, want := range cases {
+		if got := normalizeWhitespace(in); got != want {
+			t.Errorf("normalizeWhitespace(%q) = %q, want %q", in, got, want)
+		}
+	}
+}
+
+func TestTextHash(t *testing.T) {
+	long := strings.Repeat("abcdefghij", 10_000) // spans several chunks
+	for _, s := range []string{"", "hallo", long} {
+		want := sha256.Sum256([]byte(s))
+		if got := textHash(s); got != hex.EncodeToString(want[:]) {
+			t.Fatalf("textHash(len %d) = %s", len(s), got)
+		}
+	}
+}
+
+func TestSpider_SkipsNonTextPages(t *testing.T) {
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.URL.Path == "/logo.png" {
+			w.Header().Set("Content-Type", "image/png")
+			w.Write([]byte("\x89PNG<title>nope</title>"))
+			return
+		}
+		w.Header().Set("Content-Type", "text/html; charset=utf-8")
+		fmt.Fprintf(w, `<title>%s</title><a href="/logo.png">logo</a><a href="/about">about</a>`, r.URL.Path)
+	}))
+	defer srv.Close()
+
+	out, err := Spider([]string{srv.URL + "/"}, SpiderBudget{MaxPages: 5, PerDomainMax: 10})
+	if err != nil {
+		t.Fatal(err)
+	}
+	for _, fr := range out {
+		if strings.HasSuffix(fr.URL, "/logo.png") {
+			t.Fatalf("non-text page was crawled: %+v", fr)
+		}
+	}
+	if len(out) != 2 {
+		t.Fatalf("got %d pages, want 2 (/ and /about)", len(out))
+	}
+}
+
+func TestSpider_FailedFetchFreesDomainSlot(t *testing.T) {
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if strings.HasPrefix(r.URL.Path, "/bad") {
+			http.NotFound(w, r)
+			return
+		}
+		w.Header().Set("Content-Type", "text/html")
+		if r.URL.Path == "/" {
+			fmt.Fprint(w, `<a href="/bad1">1</a><a href="/bad2">2</a><a href="/ok1">3</a><a href="/ok2">4</a>`)
+			return
+		}
+		fmt.Fprintf(w, `<title>%s</title>`, r.URL.Path)
+	}))
+	defer srv.Close()
+
+	// the two failing fetches take the domain's open slots in one wave; the pages
+	// behind them must still be crawled, as the sequential spider would
+	out, err := Spider([]string{srv.URL + "/"}, SpiderBudget{MaxPages: 5, PerDomainMax: 3})
+	if err != nil {
+		t.Fatal(err)
+	}
+	var urls []string
+	for _, fr := range out {
+		urls = append(urls, strings.TrimPrefix(fr.URL, srv.URL))
+	}
+	if got := strings.Join(urls, " "); got != "/ /ok1 /ok2" {
+		t.Fatalf("crawled %q, want \"/ /ok1 /ok2\"", got)
+	}
+}
+
+func TestSpider_SkipsDuplicateBodies(t *testing.T) {
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Header().Set("Content-Type", "text/html")
+		fmt.Fprint(w, `<a href="/?amp=1">amp</a><a href="/mirror">mirror</a>`)
+	}))
+	defer srv.Close()
+
+	out, err := Spider([]string{srv.URL + "/"}, SpiderBudget{MaxPages: 5, PerDomainMax: 10})
+	if err != nil {
+		t.Fatal(err)
+	}
+	if len(out) != 1 {
+		t.Fatalf("got %d pages, want 1 (all URLs serve the same body)", len(out))
+	}
+}
+
+func TestProcessPage_ClipsOnRuneBoundary(t *testing.T) {
+	page := strings.Repeat("ä", 2000) // 4000 bytes, 2 bytes per rune
+	fr, _ := processPage([]byte(page), "text/plain", "https://example.org/", "example.org", 0)
+	if !utf8.ValidString(fr.Snippet) || !utf8.ValidString(fr.Body) {
+		t.Fatalf("clipped text is not valid UTF-8")
+	}
+	if len(fr.Snippet) != 420 || len(fr.Body) != 3000 {
+		t.Fatalf("snippet=%d body=%d bytes, want 420/3000", len(fr.Snippet), len(fr.Body))
+	}
+	fr, _ = processPage([]byte("x"+page), "text/plain", "https://example.org/", "example.org", 0)
+	if !utf8.ValidString(fr.Snippet) || !utf8.ValidString(fr.Body) {
+		t.Fatalf("clipped text is not valid UTF-8 at odd offset")
+	}
+}